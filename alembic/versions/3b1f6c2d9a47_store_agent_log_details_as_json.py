@@ -0,0 +1,79 @@
+"""store agent_logs.details as JSON
+
+Revision ID: 3b1f6c2d9a47
+Revises: 5ccc449625b2, d98864ddf865
+Create Date: 2026-10-17 09:12:04.118532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1f6c2d9a47'
+down_revision: Union[str, Sequence[str], None] = ('5ccc449625b2', 'd98864ddf865')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: convert agent_logs.details from TEXT to JSON.
+
+    This migration (which also merges the two existing heads):
+    1. Wraps legacy plain-text details in a JSON string so every row decodes
+    2. Changes the column type to JSON
+    """
+    # Step 1: Make sure every existing value is valid JSON
+    import json
+    from sqlalchemy.orm import Session
+    from sqlalchemy import text
+
+    bind = op.get_bind()
+    session = Session(bind=bind)
+
+    result = session.execute(text(
+        "SELECT id, details FROM agent_logs WHERE details IS NOT NULL"
+    ))
+
+    for row in result:
+        log_id, details = row
+
+        # Skip rows that already hold serialized JSON
+        try:
+            json.loads(details)
+            continue
+        except (json.JSONDecodeError, ValueError):
+            pass
+
+        session.execute(
+            text("UPDATE agent_logs SET details = :details WHERE id = :log_id"),
+            {"details": json.dumps(details), "log_id": log_id}
+        )
+
+    session.commit()
+
+    # Step 2: Change the column type
+    with op.batch_alter_table('agent_logs', schema=None) as batch_op:
+        batch_op.alter_column('details',
+                              existing_type=sa.Text(),
+                              type_=sa.JSON(),
+                              existing_nullable=True,
+                              # Postgres has no implicit TEXT -> JSON cast; safe
+                              # now that step 1 left only valid JSON
+                              postgresql_using='details::json')
+
+
+def downgrade() -> None:
+    """Downgrade schema: convert agent_logs.details back to TEXT.
+
+    Values remain JSON-encoded text, which is what the TEXT column held for
+    dict details before this migration.
+    """
+    with op.batch_alter_table('agent_logs', schema=None) as batch_op:
+        batch_op.alter_column('details',
+                              existing_type=sa.JSON(),
+                              type_=sa.Text(),
+                              existing_nullable=True,
+                              postgresql_using='details::text')
@@ -0,0 +1,36 @@
+"""add status composite indexes to tasks
+
+Revision ID: 4d7a1f3e8b62
+Revises: 9c4e2a7b1d58
+Create Date: 2026-10-17 16:41:09.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d7a1f3e8b62'
+down_revision: Union[str, Sequence[str], None] = '9c4e2a7b1d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: index tasks on status with due_date, priority_score and completed_at."""
+    op.create_index('ix_tasks_status_due_date', 'tasks', ['status', 'due_date'], unique=False)
+    op.create_index(
+        'ix_tasks_status_priority_score', 'tasks', ['status', 'priority_score'], unique=False
+    )
+    op.create_index(
+        'ix_tasks_status_completed_at', 'tasks', ['status', 'completed_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop the status composite indexes."""
+    op.drop_index('ix_tasks_status_completed_at', table_name='tasks')
+    op.drop_index('ix_tasks_status_priority_score', table_name='tasks')
+    op.drop_index('ix_tasks_status_due_date', table_name='tasks')
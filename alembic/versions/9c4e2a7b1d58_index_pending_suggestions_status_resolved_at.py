@@ -0,0 +1,48 @@
+"""index pending_suggestions on status and resolved_at
+
+Revision ID: 9c4e2a7b1d58
+Revises: 3b1f6c2d9a47
+Create Date: 2026-10-17 14:03:27.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e2a7b1d58'
+down_revision: Union[str, Sequence[str], None] = '3b1f6c2d9a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: add a (status, resolved_at) index to pending_suggestions.
+
+    The table is created by init_db rather than a migration, so the index is
+    only added when the table already exists.
+    """
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('pending_suggestions'):
+        return
+
+    existing = {index['name'] for index in inspector.get_indexes('pending_suggestions')}
+    if 'ix_pending_suggestions_status_resolved_at' not in existing:
+        op.create_index(
+            'ix_pending_suggestions_status_resolved_at',
+            'pending_suggestions',
+            ['status', 'resolved_at'],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop the (status, resolved_at) index."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('pending_suggestions'):
+        return
+
+    existing = {index['name'] for index in inspector.get_indexes('pending_suggestions')}
+    if 'ix_pending_suggestions_status_resolved_at' in existing:
+        op.drop_index('ix_pending_suggestions_status_resolved_at', table_name='pending_suggestions')
@@ -0,0 +1,55 @@
+"""add trigram search indexes to tasks
+
+Revision ID: b2e8d5c3f719
+Revises: 4d7a1f3e8b62
+Create Date: 2026-10-17 17:12:44.830516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e8d5c3f719'
+down_revision: Union[str, Sequence[str], None] = '4d7a1f3e8b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: add pg_trgm GIN indexes for task title/description search.
+
+    TaskService.get_tasks searches with unanchored ILIKE patterns, which Postgres
+    can serve from trigram indexes. SQLite has no equivalent, so this is a no-op there.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_tasks_title_trgm',
+        'tasks',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_tasks_description_trgm',
+        'tasks',
+        ['description'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop the trigram indexes (the extension is left installed)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_tasks_description_trgm', table_name='tasks')
+    op.drop_index('ix_tasks_title_trgm', table_name='tasks')
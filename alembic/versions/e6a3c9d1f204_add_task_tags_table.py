@@ -0,0 +1,58 @@
+"""add task_tags table
+
+Revision ID: e6a3c9d1f204
+Revises: b2e8d5c3f719
+Create Date: 2026-10-17 17:48:02.215934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a3c9d1f204'
+down_revision: Union[str, Sequence[str], None] = 'b2e8d5c3f719'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: add an indexed task_tags table and backfill it from tasks.tags.
+
+    init_db may already have created the (empty) table, so creation is skipped
+    when it exists and the backfill only runs when the table is empty.
+    """
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table('task_tags'):
+        op.create_table(
+            'task_tags',
+            sa.Column('task_id', sa.Integer(), nullable=False),
+            sa.Column('tag', sa.String(length=500), nullable=False),
+            sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('task_id', 'tag'),
+        )
+        op.create_index(op.f('ix_task_tags_tag'), 'task_tags', ['tag'], unique=False)
+
+    if bind.execute(sa.text('SELECT COUNT(*) FROM task_tags')).scalar():
+        return
+
+    rows = []
+    for task_id, tags in bind.execute(
+        sa.text('SELECT id, tags FROM tasks WHERE tags IS NOT NULL')
+    ):
+        normalized = dict.fromkeys(tag.strip().lower() for tag in tags.split(','))
+        rows.extend({'task_id': task_id, 'tag': tag} for tag in normalized if tag)
+
+    if rows:
+        task_tags = sa.table('task_tags', sa.column('task_id'), sa.column('tag'))
+        op.bulk_insert(task_tags, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop the task_tags table (tasks.tags is unchanged)."""
+    op.drop_index(op.f('ix_task_tags_tag'), table_name='task_tags')
+    op.drop_table('task_tags')
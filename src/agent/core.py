@@ -23,7 +23,7 @@ from src.models.database import get_db_session
 from src.models.task import TaskPriority, TaskSource
 from src.services.agent_log_service import AgentLogService
 from src.services.initiative_service import InitiativeService
-from src.services.llm_service import ExtractedTask, HttpLogCallback, LLMError, LLMService, ProductivityRecommendation
+from src.services.llm_service import ExtractedTask, HttpLogCallback, LLMService, ProductivityRecommendation
 from src.services.pending_suggestion_service import PendingSuggestionService
 from src.services.task_service import TaskService
 from src.utils.config import AgentConfig, Config
@@ -295,6 +295,8 @@ class AutonomousAgent:
             self._scheduler.shutdown(wait=False)
             self._scheduler = None
 
+        await self.llm_service.aclose()
+
         # Log stop
         with get_db_session() as db:
             log_service = AgentLogService(db)
@@ -497,71 +499,73 @@ class AutonomousAgent:
         created_task_ids: list[int] = []
         suggested_tasks: list[PendingSuggestion] = []
 
-        for item in items:
-            self.state.items_processed_session += 1
+        if not items:
+            return created_task_ids, suggested_tasks
 
-            # Build text for LLM extraction
+        # Build text for LLM extraction
+        texts = []
+        contexts = []
+        for item in items:
             text = f"Subject: {item.title}\n"
             if item.description:
                 text += f"\n{item.description}"
             if item.metadata:
                 if item.metadata.get("sender"):
                     text += f"\nFrom: {item.metadata['sender']}"
+            texts.append(text)
+            contexts.append(
+                f"Source reference: {item.source_reference}" if item.source_reference else None
+            )
 
-            try:
-                # Extract tasks using LLM
-                extracted = await self.llm_service.extract_tasks_from_text(
-                    text=text,
-                    source=source.value,
-                    context=f"Source reference: {item.source_reference}" if item.source_reference else None,
-                )
+        # Extract tasks for all items, batched into as few LLM calls as possible;
+        # a failed request yields its exception in place of those items' tasks
+        extracted_per_item = await self.llm_service.extract_tasks_from_texts(
+            texts=texts,
+            source=source.value,
+            contexts=contexts,
+        )
 
-                # Log LLM usage
-                with get_db_session() as db:
-                    log_service = AgentLogService(db)
-                    log_service.log_llm_request(
-                        message=f"Task extraction from {source.value}",
-                        tokens_used=0,  # Would need to track this from LLM response
-                        model=self.config.llm.model,
-                        details={"source": source.value, "tasks_extracted": len(extracted)},
-                    )
+        # Log LLM usage
+        with get_db_session() as db:
+            log_service = AgentLogService(db)
+            log_service.log_llm_request(
+                message=f"Task extraction from {source.value}",
+                tokens_used=0,  # Would need to track this from LLM response
+                model=self.config.llm.model,
+                details={
+                    "source": source.value,
+                    "items": len(items),
+                    "tasks_extracted": sum(
+                        len(e) for e in extracted_per_item if not isinstance(e, BaseException)
+                    ),
+                },
+            )
+
+        for item, extracted in zip(items, extracted_per_item, strict=True):
+            self.state.items_processed_session += 1
+
+            if isinstance(extracted, BaseException):
+                logger.error("LLM extraction failed for %r: %s", item.title, extracted)
+                # Fall back to creating a basic task from the actionable item
+                if self._autonomy_level in [AutonomyLevel.AUTO, AutonomyLevel.FULL]:
+                    task_id = await self._create_task_from_actionable_item(item)
+                    if task_id:
+                        created_task_ids.append(task_id)
+                continue
 
-                # Process each extracted task based on autonomy level
-                with get_db_session() as decision_db:
-                    for task in extracted:
-                        if self._should_auto_create_task(task, db=decision_db):
-                            task_id = await self._create_task_from_extracted(task, source, item)
-                            if task_id:
-                                created_task_ids.append(task_id)
-                        else:
-                            # Create enhanced suggestion with full context
-                            # Save suggestion to database for persistence across processes
-                            with get_db_session() as suggestion_db:
-                                suggestion_service = PendingSuggestionService(suggestion_db)
-                                db_suggestion = suggestion_service.create_suggestion(
-                                    title=task.title,
-                                    description=task.description,
-                                    priority=task.priority,
-                                    due_date=task.due_date,
-                                    tags=task.tags,
-                                    confidence=task.confidence,
-                                    source=source,
-                                    source_reference=item.source_reference,
-                                    source_url=self._generate_source_url(
-                                        source, item.source_reference, item.metadata
-                                    ),
-                                    reasoning=self._build_suggestion_reasoning(task, item, source),
-                                    original_title=item.title,
-                                    original_sender=item.metadata.get("sender") if item.metadata else None,
-                                    original_snippet=(
-                                        item.description[:200] + "..."
-                                        if item.description and len(item.description) > 200
-                                        else item.description
-                                    ),
-                                )
-                            
-                            # Create dataclass for return value
-                            suggestion = PendingSuggestion(
+            # Process each extracted task based on autonomy level
+            with get_db_session() as decision_db:
+                for task in extracted:
+                    if self._should_auto_create_task(task, db=decision_db):
+                        task_id = await self._create_task_from_extracted(task, source, item)
+                        if task_id:
+                            created_task_ids.append(task_id)
+                    else:
+                        # Create enhanced suggestion with full context
+                        # Save suggestion to database for persistence across processes
+                        with get_db_session() as suggestion_db:
+                            suggestion_service = PendingSuggestionService(suggestion_db)
+                            db_suggestion = suggestion_service.create_suggestion(
                                 title=task.title,
                                 description=task.description,
                                 priority=task.priority,
@@ -582,15 +586,30 @@ class AutonomousAgent:
                                     else item.description
                                 ),
                             )
-                            suggested_tasks.append(suggestion)
-
-            except LLMError as e:
-                logger.error(f"LLM extraction failed: {e}")
-                # Fall back to creating basic task from actionable item
-                if self._autonomy_level in [AutonomyLevel.AUTO, AutonomyLevel.FULL]:
-                    task_id = await self._create_task_from_actionable_item(item)
-                    if task_id:
-                        created_task_ids.append(task_id)
+                        
+                        # Create dataclass for return value
+                        suggestion = PendingSuggestion(
+                            title=task.title,
+                            description=task.description,
+                            priority=task.priority,
+                            due_date=task.due_date,
+                            tags=task.tags,
+                            confidence=task.confidence,
+                            source=source,
+                            source_reference=item.source_reference,
+                            source_url=self._generate_source_url(
+                                source, item.source_reference, item.metadata
+                            ),
+                            reasoning=self._build_suggestion_reasoning(task, item, source),
+                            original_title=item.title,
+                            original_sender=item.metadata.get("sender") if item.metadata else None,
+                            original_snippet=(
+                                item.description[:200] + "..."
+                                if item.description and len(item.description) > 200
+                                else item.description
+                            ),
+                        )
+                        suggested_tasks.append(suggestion)
 
         return created_task_ids, suggested_tasks
 
@@ -795,7 +814,9 @@ class AutonomousAgent:
                 initiative_service = InitiativeService(db)
 
                 # Get tasks and statistics
-                tasks, _ = task_service.get_tasks(include_completed=False, limit=50)
+                tasks, _ = task_service.get_tasks(
+                    include_completed=False, include_initiative=True, limit=50
+                )
                 statistics = task_service.get_statistics()
 
                 # Get active initiatives with progress
@@ -14,6 +14,7 @@ from src.models.agent_log import AgentAction, LogLevel
 from src.services.agent_log_service import AgentLogService
 from src.services.recommendation_service import RecommendationService
 from src.utils.config import get_config
+from src.utils.dates import naive_utcnow
 
 router = APIRouter(prefix="/agent", tags=["agent"])
 
@@ -96,7 +97,7 @@ class AgentLogResponse(BaseModel):
     level: str
     action: str | None
     message: str
-    details: str | None
+    details: dict[str, Any] | str | None
     tokens_used: int | None
     model_used: str | None
     reference_type: str | None
@@ -311,8 +312,8 @@ async def get_recommendations(
             )
             for r in recommendations
         ],
-        generated_at=service._cache_timestamp,
-        from_cache=not force_refresh and service._is_cache_valid(30),
+        generated_at=service.get_generated_at(None),
+        from_cache=not force_refresh and service._is_cache_valid(30, None),
     )
 
 
@@ -454,9 +455,9 @@ def get_agent_logs(
     offset: int = Query(default=0, ge=0),
 ) -> AgentLogsResponse:
     """Get agent activity logs."""
-    from datetime import UTC, timedelta
+    from datetime import timedelta
 
-    since = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=hours)
+    since = naive_utcnow() - timedelta(hours=hours)
 
     logs, total = service.get_logs(
         level=level,
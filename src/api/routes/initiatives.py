@@ -41,11 +41,12 @@ def list_initiatives(
         include_completed=include_completed,
         limit=limit,
         offset=offset,
+        load_tasks=True,
     )
 
     initiatives_with_progress = []
     for initiative in initiatives:
-        progress = service.get_initiative_progress(initiative.id)
+        progress = service.get_loaded_initiative_progress(initiative)
         initiatives_with_progress.append(
             InitiativeProgressResponse(
                 initiative=_initiative_to_response(initiative),
@@ -64,11 +65,11 @@ def get_active_initiatives(
     service: Annotated[InitiativeService, Depends(get_initiative_service)],
 ) -> InitiativeListResponse:
     """Get all active initiatives with progress."""
-    initiatives = service.get_active_initiatives()
+    initiatives = service.get_active_initiatives(load_tasks=True)
 
     initiatives_with_progress = []
     for initiative in initiatives:
-        progress = service.get_initiative_progress(initiative.id)
+        progress = service.get_loaded_initiative_progress(initiative)
         initiatives_with_progress.append(
             InitiativeProgressResponse(
                 initiative=_initiative_to_response(initiative),
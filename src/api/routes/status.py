@@ -5,7 +5,7 @@ Provides endpoints for:
 - Tasks due today or overdue
 """
 
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from src.models import TaskPriority, TaskStatus, get_db
 from src.services.task_service import TaskService
+from src.utils.dates import naive_utcnow
 
 router = APIRouter(prefix="/status", tags=["status"])
 
@@ -58,7 +59,7 @@ def get_today_due_tasks(
     overdue_count = len(overdue_tasks)
 
     # Get tasks due today
-    now = datetime.now(UTC).replace(tzinfo=None)
+    now = naive_utcnow()
     today_end = now.replace(hour=23, minute=59, second=59)
 
     due_today_tasks = service.get_tasks(
@@ -20,7 +20,7 @@ from src.api.schemas import (
 )
 from src.models import Task, TaskPriority, TaskSource, TaskStatus, get_db
 from src.services.task_service import TaskService
-from src.services.llm_service import LLMService
+from src.services.llm_service import get_shared_llm_service
 from src.utils.config import get_config
 from src.services.initiative_service import InitiativeService
 
@@ -82,6 +82,7 @@ def list_tasks(
         due_before=due_before,
         due_after=due_after,
         include_completed=include_completed,
+        include_initiative=True,
         limit=limit,
         offset=offset,
     )
@@ -204,10 +205,9 @@ def delete_task(
     service: Annotated[TaskService, Depends(get_task_service)],
 ) -> None:
     """Delete a task."""
-    task = service.get_task(task_id)
-    if not task:
+    # Delete by ID directly; loading the task first would only cost a SELECT
+    if not service.bulk_delete([task_id]):
         raise HTTPException(status_code=404, detail="Task not found")
-    service.delete_task(task)
 
 
 @router.post("/parse", response_model=ParseTaskResponse)
@@ -238,7 +238,7 @@ def parse_text_to_tasks(
     
     try:
         # Initialize LLM service
-        llm_service = LLMService(config.llm)
+        llm_service = get_shared_llm_service(config.llm)
         
         # Get active initiatives for LLM context
         initiatives_for_llm = []
@@ -1,5 +1,6 @@
 """Voice input API routes for task creation."""
 
+import threading
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
@@ -15,18 +16,35 @@ from src.services.voice_service import (
     VoiceError,
     VoiceService,
 )
-from src.utils.config import get_config
+from src.utils.config import LLMConfig, VoiceConfig, get_config
 
 router = APIRouter(prefix="/tasks/voice", tags=["voice"])
 
 
+# Shared across requests so the transcription cache and in-flight coalescing
+# in VoiceService apply between uploads
+_shared_service: tuple[VoiceConfig, LLMConfig, VoiceService] | None = None
+_shared_service_lock = threading.Lock()
+
+
 def get_voice_service() -> VoiceService:
     """Dependency to get voice service."""
+    global _shared_service
+
     config = get_config()
-    return VoiceService(
-        voice_config=config.voice,
-        llm_config=config.llm,
-    )
+    with _shared_service_lock:
+        # Compare by identity: configs are unhashable pydantic models
+        if (
+            _shared_service is None
+            or _shared_service[0] is not config.voice
+            or _shared_service[1] is not config.llm
+        ):
+            _shared_service = (
+                config.voice,
+                config.llm,
+                VoiceService(voice_config=config.voice, llm_config=config.llm),
+            )
+        return _shared_service[2]
 
 
 def get_task_service(db: Session = Depends(get_db)) -> TaskService:
@@ -115,7 +133,9 @@ async def transcribe_audio(
             raise HTTPException(status_code=400, detail="Empty audio file")
 
         # Transcribe only
-        result = voice_service.transcribe_audio(audio_data, language)
+        result = await voice_service.transcribe_audio_async(
+            audio_data, language, include_metadata=True
+        )
 
         return TranscriptionResponse(
             text=result.text,
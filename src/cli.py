@@ -25,7 +25,7 @@ from src import __version__
 from src.models import init_db
 from src.models.database import get_db_session
 from src.models.initiative import InitiativePriority, InitiativeStatus
-from src.models.task import TaskPriority, TaskSource, TaskStatus
+from src.models.task import Task, TaskPriority, TaskSource, TaskStatus
 from src.services.initiative_service import InitiativeService
 from src.services.task_service import TaskService
 from src.utils.config import get_config, load_config, set_config
@@ -427,6 +427,22 @@ def agent_review(auto_approve, auto_reject):
         console.print(f"  [dim]Remaining:[/dim] {remaining}")
 
 
+def _get_task_or_warn(service: TaskService, task_id: int) -> Task | None:
+    """Look up a task, printing a not-found message if it doesn't exist.
+
+    Args:
+        service: Task service bound to the command's session
+        task_id: ID of the task to look up
+
+    Returns:
+        The task, or None if it was not found
+    """
+    task = service.get_task(task_id)
+    if not task:
+        console.print(f"[red]Task #{task_id} not found.[/red]")
+    return task
+
+
 def _display_suggestion(suggestion, number: int, remaining: int) -> None:
     """Display a single suggestion in a rich panel."""
     # Priority emoji and style
@@ -864,7 +880,7 @@ def tasks_list(status, priority, account_id, link, initiative, show_all, limit):
         status_filter = TaskStatus(status) if status else None
         priority_filter = TaskPriority(priority) if priority else None
 
-        tasks, total = service.get_tasks(
+        tasks, total = service.get_tasks_summary(
             status=status_filter,
             priority=priority_filter,
             account_id=account_id,
@@ -899,8 +915,8 @@ def tasks_list(status, priority, account_id, link, initiative, show_all, limit):
             )
 
             title_text = task.title[:40] if task.title else "(no title)"
-            initiative_text = task.initiative.title[:15] if task.initiative else "-"
-            link_icon = "🔗" if task.get_document_links_list() else ""
+            initiative_text = task.initiative_title[:15] if task.initiative_title else "-"
+            link_icon = "🔗" if task.has_document_links else ""
             table.add_row(
                 str(task.id),
                 pri_emoji,
@@ -969,10 +985,8 @@ def tasks_complete(task_id):
     """Mark a task as completed."""
     with get_db_session() as db:
         service = TaskService(db)
-        task = service.get_task(task_id)
-
+        task = _get_task_or_warn(service, task_id)
         if not task:
-            console.print(f"[red]Task #{task_id} not found.[/red]")
             return
 
         service.update_task(task, status=TaskStatus.COMPLETED)
@@ -986,10 +1000,8 @@ def tasks_delete(task_id, yes):
     """Delete a task."""
     with get_db_session() as db:
         service = TaskService(db)
-        task = service.get_task(task_id)
-
+        task = _get_task_or_warn(service, task_id)
         if not task:
-            console.print(f"[red]Task #{task_id} not found.[/red]")
             return
 
         if not yes:
@@ -1025,10 +1037,8 @@ def tasks_link_add(task_id, url):
 
     with get_db_session() as db:
         service = TaskService(db)
-        task = service.get_task(task_id)
-
+        task = _get_task_or_warn(service, task_id)
         if not task:
-            console.print(f"[red]Task #{task_id} not found.[/red]")
             return
 
         links = task.get_document_links_list()
@@ -1049,10 +1059,8 @@ def tasks_link_remove(task_id, url):
     """Remove a document link from a task."""
     with get_db_session() as db:
         service = TaskService(db)
-        task = service.get_task(task_id)
-
+        task = _get_task_or_warn(service, task_id)
         if not task:
-            console.print(f"[red]Task #{task_id} not found.[/red]")
             return
 
         links = task.get_document_links_list()
@@ -1071,10 +1079,8 @@ def tasks_show(task_id):
     """Show task details."""
     with get_db_session() as db:
         service = TaskService(db)
-        task = service.get_task(task_id)
-
+        task = _get_task_or_warn(service, task_id)
         if not task:
-            console.print(f"[red]Task #{task_id} not found.[/red]")
             return
 
         pri_style = get_priority_style(task.priority)
@@ -1204,10 +1210,8 @@ def tasks_due(ctx, task_id, date, yes, clear):
 
     with get_db_session() as db:
         service = TaskService(db)
-        task = service.get_task(task_id)
-
+        task = _get_task_or_warn(service, task_id)
         if not task:
-            console.print(f"[red]Task #{task_id} not found.[/red]")
             return
 
         # Show current task info
@@ -1311,9 +1315,8 @@ def tasks_merge(ctx, task_ids, yes, keep):
         # Fetch all tasks
         tasks_to_merge = []
         for task_id in task_ids:
-            task = service.get_task(task_id)
+            task = _get_task_or_warn(service, task_id)
             if not task:
-                console.print(f"[red]Task #{task_id} not found.[/red]")
                 return
             tasks_to_merge.append(task)
 
@@ -1398,8 +1401,7 @@ def tasks_merge(ctx, task_ids, yes, keep):
 
         # Delete original tasks unless --keep
         if not keep:
-            for task in tasks_to_merge:
-                service.delete_task(task)
+            service.bulk_delete([task.id for task in tasks_to_merge])
             console.print(f"[dim]Deleted {len(tasks_to_merge)} original tasks.[/dim]")
 
 
@@ -1445,6 +1447,9 @@ def tasks_voice(ctx, duration, transcribe_only):
         console.print("[dim]Please connect a microphone and try again.[/dim]")
         return
 
+    # Connect to Whisper while the user speaks
+    voice_service.warm_up_connection()
+
     try:
         # Recording phase with countdown
         console.print(Panel(
@@ -1568,9 +1573,8 @@ def tasks_associate(task_id, initiative_id):
         initiative_service = InitiativeService(db)
 
         # Get the task
-        task = task_service.get_task(task_id)
+        task = _get_task_or_warn(task_service, task_id)
         if not task:
-            console.print(f"[red]Task #{task_id} not found.[/red]")
             return
 
         # Get the initiative
@@ -2367,7 +2371,7 @@ def notify(ctx, message, title):
         type=NotificationType.INFO,
     )
 
-    if service.send(notification):
+    if service.send_sync(notification):
         console.print("[green]✓[/green] Notification sent")
     else:
         console.print("[yellow]Notification not sent (may be disabled)[/yellow]")
@@ -18,6 +18,16 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Patterns for the XML-like meetings format, compiled once at import
+_MEETING_PATTERN = re.compile(r'<meeting\s+([^>]+)>(.*?)</meeting>', re.DOTALL)
+_MEETING_ATTR_PATTERNS = {
+    attr: re.compile(rf'{attr}="([^"]+)"') for attr in ("id", "title", "date", "workspace_id")
+}
+_PARTICIPANTS_PATTERN = re.compile(r'<known_participants>(.*?)</known_participants>', re.DOTALL)
+_EMAIL_PATTERN = re.compile(r'<([^>]+@[^>]+)>')
+_SUMMARY_PATTERN = re.compile(r'<summary>(.*?)</summary>', re.DOTALL)
+_NOTES_PATTERN = re.compile(r'<notes>(.*?)</notes>', re.DOTALL)
+
 
 class MCPClient:
     """HTTP client for Granola MCP server using JSON-RPC 2.0.
@@ -172,40 +182,22 @@ class MCPClient:
         meetings = []
 
         # Find all meeting tags using regex
-        meeting_pattern = r'<meeting\s+([^>]+)>(.*?)</meeting>'
-        for match in re.finditer(meeting_pattern, xml_text, re.DOTALL):
+        for match in _MEETING_PATTERN.finditer(xml_text):
             attrs_str = match.group(1)
             content = match.group(2)
 
-            # Extract attributes from meeting tag
+            # Extract id, title, date and (optional) workspace_id from meeting tag
             meeting = {}
-
-            # Extract id
-            id_match = re.search(r'id="([^"]+)"', attrs_str)
-            meeting["id"] = id_match.group(1) if id_match else ""
-
-            # Extract title
-            title_match = re.search(r'title="([^"]+)"', attrs_str)
-            meeting["title"] = title_match.group(1) if title_match else ""
-
-            # Extract date
-            date_match = re.search(r'date="([^"]+)"', attrs_str)
-            meeting["date"] = date_match.group(1) if date_match else ""
-
-            # Extract workspace_id (optional)
-            workspace_match = re.search(r'workspace_id="([^"]+)"', attrs_str)
-            meeting["workspace_id"] = workspace_match.group(1) if workspace_match else ""
+            for attr, pattern in _MEETING_ATTR_PATTERNS.items():
+                attr_match = pattern.search(attrs_str)
+                meeting[attr] = attr_match.group(1) if attr_match else ""
 
             # Extract attendees from known_participants
-            participants_match = re.search(
-                r'<known_participants>(.*?)</known_participants>',
-                content,
-                re.DOTALL
-            )
+            participants_match = _PARTICIPANTS_PATTERN.search(content)
             if participants_match:
                 participants_text = participants_match.group(1)
                 # Extract email addresses (in angle brackets)
-                emails = re.findall(r'<([^>]+@[^>]+)>', participants_text)
+                emails = _EMAIL_PATTERN.findall(participants_text)
                 meeting["attendees"] = emails
             else:
                 meeting["attendees"] = []
@@ -213,8 +205,8 @@ class MCPClient:
             # Extract notes/content if requested
             if include_content:
                 # Try <summary> tag first (newer format), then <notes> (legacy)
-                summary_match = re.search(r'<summary>(.*?)</summary>', content, re.DOTALL)
-                notes_match = re.search(r'<notes>(.*?)</notes>', content, re.DOTALL)
+                summary_match = _SUMMARY_PATTERN.search(content)
+                notes_match = None if summary_match else _NOTES_PATTERN.search(content)
 
                 if summary_match:
                     meeting["content"] = summary_match.group(1).strip()
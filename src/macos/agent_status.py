@@ -7,13 +7,15 @@ and retry logic.
 
 import json
 import logging
+import time
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
 import httpx
 
+from src.utils.dates import naive_utcnow
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,12 +53,12 @@ class CachedData:
     """Cached API response with timestamp."""
 
     data: Any
-    timestamp: datetime
+    timestamp: float  # time.monotonic() when cached
     ttl_seconds: int = 30
 
     def is_valid(self) -> bool:
         """Check if cache is still valid."""
-        return datetime.now(UTC).replace(tzinfo=None) - self.timestamp < timedelta(seconds=self.ttl_seconds)
+        return time.monotonic() - self.timestamp < self.ttl_seconds
 
 
 class AgentStatusManager:
@@ -120,7 +122,7 @@ class AgentStatusManager:
             status = AgentStatus(**status_data)
 
             # Cache the result
-            self._status_cache = CachedData(status, datetime.now(UTC).replace(tzinfo=None), self.cache_ttl)
+            self._status_cache = CachedData(status, time.monotonic(), self.cache_ttl)
 
             return status
         except Exception as e:
@@ -156,7 +158,7 @@ class AgentStatusManager:
             logs = [AgentLog(**log) for log in logs_data.get("logs", [])]
 
             # Cache the result
-            self._logs_cache = CachedData(logs, datetime.now(UTC).replace(tzinfo=None), self.cache_ttl)
+            self._logs_cache = CachedData(logs, time.monotonic(), self.cache_ttl)
 
             return logs
         except Exception as e:
@@ -298,7 +300,7 @@ class AgentStatusManager:
                 "is_running": status.is_running,
                 "autonomy_level": status.autonomy_level,
                 "last_poll": status.last_poll,
-                "timestamp": datetime.now(UTC).replace(tzinfo=None).isoformat(),
+                "timestamp": naive_utcnow().isoformat(),
             }
             self._state_file.write_text(json.dumps(state, indent=2))
         except Exception as e:
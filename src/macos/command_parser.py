@@ -25,10 +25,10 @@ class ParsedCommand:
 class CommandParser:
     """Parser for quick input commands."""
 
-    # Command patterns
-    PARSE_PATTERN = r"^parse\s+(.+)$"
-    VOICE_PATTERN = r"^voice\s*$"
-    PRIORITY_PATTERN = r"^priority\s+(.+)$"
+    # Command patterns, compiled once at import
+    PARSE_PATTERN = re.compile(r"^parse\s+(.+)$", re.IGNORECASE)
+    VOICE_PATTERN = re.compile(r"^voice\s*$", re.IGNORECASE)
+    PRIORITY_PATTERN = re.compile(r"^priority\s+(.+)$", re.IGNORECASE)
 
     @staticmethod
     def parse(input_text: str) -> ParsedCommand:
@@ -64,7 +64,7 @@ class CommandParser:
             )
 
         # Check for parse command
-        match = re.match(CommandParser.PARSE_PATTERN, text, re.IGNORECASE)
+        match = CommandParser.PARSE_PATTERN.match(text)
         if match:
             return ParsedCommand(
                 command_type="parse",
@@ -72,7 +72,7 @@ class CommandParser:
             )
 
         # Check for voice command
-        match = re.match(CommandParser.VOICE_PATTERN, text, re.IGNORECASE)
+        match = CommandParser.VOICE_PATTERN.match(text)
         if match:
             return ParsedCommand(
                 command_type="voice",
@@ -80,7 +80,7 @@ class CommandParser:
             )
 
         # Check for priority command
-        match = re.match(CommandParser.PRIORITY_PATTERN, text, re.IGNORECASE)
+        match = CommandParser.PRIORITY_PATTERN.match(text)
         if match:
             return ParsedCommand(
                 command_type="priority",
@@ -33,6 +33,15 @@ from src.macos.task_details_sheet import TaskDetailsModalManager
 
 logger = logging.getLogger(__name__)
 
+# Static menu text, built once rather than on every menu rebuild
+_PRIORITY_SYMBOLS = {
+    "CRITICAL": "🔴",
+    "HIGH": "🟠",
+    "MEDIUM": "🟡",
+    "LOW": "🟢",
+}
+_AGENT_STATE_LABELS = {True: "🟢 Running", False: "⚫ Stopped"}
+
 
 class MenuDelegate(NSObject):
     """Delegate object for handling menu actions."""
@@ -113,6 +122,14 @@ class TaskMenuApp(NSObject):
         self.menu = None
         self.client = httpx.Client(timeout=10.0)
         self.agent_manager = None
+        # Held while a manual poll runs so repeated clicks don't stack polls
+        self._poll_lock = threading.Lock()
+        # Set while a UI update is queued on the main thread, so updates from
+        # several fetch threads collapse into one menu rebuild
+        self._ui_update_pending = False
+        self._ui_update_lock = threading.Lock()
+        # Title last set on the status item; setting it relayouts the menu bar
+        self._menu_bar_title = None
 
         # Task data cache
         self.overdue_count = 0
@@ -167,6 +184,7 @@ class TaskMenuApp(NSObject):
         self.status_item.setHighlightMode_(True)
 
         # Initial title
+        self._menu_bar_title = None
         self._update_menu_bar_title()
 
         # Create menu
@@ -207,7 +225,11 @@ class TaskMenuApp(NSObject):
         else:
             title = f"{self.total_count}" if self.total_count > 0 else "✓"
 
+        # Most updates change the menu contents, not the counts in the title
+        if title == self._menu_bar_title:
+            return
         self.status_item.setTitle_(title)
+        self._menu_bar_title = title
 
     def refreshTasksTimer_(self, sender: Any = None) -> None:
         """Refresh task data from API (called by NSTimer).
@@ -248,15 +270,26 @@ class TaskMenuApp(NSObject):
             response.raise_for_status()
 
             data = response.json()
-            self.overdue_count = int(data.get("overdue_count", 0))
-            self.due_today_count = int(data.get("due_today_count", 0))
-            self.total_count = int(data.get("total_count", 0))
-            self.tasks = list(data.get("tasks", []))
-
-            # Update UI on main thread
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "updateUIOnMainThread:", None, False
-            )
+            overdue_count = int(data.get("overdue_count", 0))
+            due_today_count = int(data.get("due_today_count", 0))
+            total_count = int(data.get("total_count", 0))
+            tasks = list(data.get("tasks", []))
+
+            # Most timer ticks return the same data; skip rebuilding the menu then
+            if (overdue_count, due_today_count, total_count, tasks) == (
+                self.overdue_count,
+                self.due_today_count,
+                self.total_count,
+                self.tasks,
+            ):
+                return
+
+            self.overdue_count = overdue_count
+            self.due_today_count = due_today_count
+            self.total_count = total_count
+            self.tasks = tasks
+
+            self._schedule_ui_update()
 
         except Exception as e:
             logger.warning(f"Error fetching tasks: {e}")
@@ -270,20 +303,35 @@ class TaskMenuApp(NSObject):
         try:
             # Get agent status (uses caching)
             status = self.agent_manager.get_status(use_cache=False)
-            self.agent_status = status
             self.last_agent_status_update = datetime.now()
 
             # Get recent logs
-            self.agent_logs = self.agent_manager.get_logs(limit=5, hours=24)
+            logs = self.agent_manager.get_logs(limit=5, hours=24)
 
-            # Update UI on main thread
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "updateUIOnMainThread:", None, False
-            )
+            # Skip rebuilding the menu when nothing it shows has changed
+            if status == self.agent_status and logs == self.agent_logs:
+                return
+
+            self.agent_status = status
+            self.agent_logs = logs
+
+            self._schedule_ui_update()
 
         except Exception as e:
             logger.warning(f"Error fetching agent status: {e}")
 
+    @objc.python_method
+    def _schedule_ui_update(self) -> None:
+        """Queue a UI update on the main thread unless one is already queued."""
+        with self._ui_update_lock:
+            if self._ui_update_pending:
+                return
+            self._ui_update_pending = True
+
+        self.performSelectorOnMainThread_withObject_waitUntilDone_(
+            "updateUIOnMainThread:", None, False
+        )
+
     def updateUIOnMainThread_(self, _: Any = None) -> None:
         """Update menu bar title and menu items on the main thread.
 
@@ -293,6 +341,10 @@ class TaskMenuApp(NSObject):
         Args:
             _: Unused parameter (required by PyObjC selector)
         """
+        # Clear first: data fetched after this point queues another update
+        with self._ui_update_lock:
+            self._ui_update_pending = False
+
         # Update title
         if self.status_item is not None:
             self._update_menu_bar_title()
@@ -500,7 +552,7 @@ class TaskMenuApp(NSObject):
         if not self.agent_status:
             return "Agent status unknown"
 
-        status = "🟢 Running" if self.agent_status.is_running else "⚫ Stopped"
+        status = _AGENT_STATE_LABELS[bool(self.agent_status.is_running)]
         autonomy = self.agent_status.autonomy_level or "unknown"
         return f"{status} • {autonomy}"
 
@@ -514,13 +566,7 @@ class TaskMenuApp(NSObject):
         Returns:
             Visual symbol
         """
-        symbols = {
-            "CRITICAL": "🔴",
-            "HIGH": "🟠",
-            "MEDIUM": "🟡",
-            "LOW": "🟢",
-        }
-        return symbols.get(priority, "○")
+        return _PRIORITY_SYMBOLS.get(priority, "○")
 
     def start_agent_action(self, sender: Any = None) -> None:
         """Start agent action handler.
@@ -559,6 +605,10 @@ class TaskMenuApp(NSObject):
         if not self.agent_manager or not self.agent_status or not self.agent_status.is_running:
             return
 
+        if not self._poll_lock.acquire(blocking=False):
+            logger.debug("Poll already in progress, ignoring request")
+            return
+
         # Run in background thread to avoid blocking UI
         thread = threading.Thread(target=self._poll_now_thread)
         thread.daemon = True
@@ -623,6 +673,8 @@ class TaskMenuApp(NSObject):
             self._fetch_and_update_agent_status()
         except Exception as e:
             logger.error(f"Failed to poll: {e}")
+        finally:
+            self._poll_lock.release()
 
     def task_item_clicked_with_id(self, task_id: int) -> None:
         """Handle task menu item click with specific task ID.
@@ -10,9 +10,21 @@ import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from datetime import datetime
+from functools import partial
 from typing import Any, Dict, List
 import webbrowser
 
+_DOCUMENT_EXTENSIONS = ('.pdf', '.doc', '.docx', '.xls', '.xlsx')
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif')
+
+
+def _open_link(url: str, event: Any = None) -> None:
+    """Open a document link in the browser (bound to each link label)."""
+    try:
+        webbrowser.open(url)
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to open link: {e}")
+
 
 def show_task_details_modal(task_data: Dict[str, Any]) -> Dict[str, Any]:
     """Show a task details modal and return the result as JSON.
@@ -222,9 +234,10 @@ def show_task_details_modal(task_data: Dict[str, Any]) -> Dict[str, Any]:
         for link in document_links:
             # Determine file icon based on URL
             link_text = str(link)
-            if link_text.lower().endswith(('.pdf', '.doc', '.docx', '.xls', '.xlsx')):
+            lowered = link_text.lower()
+            if lowered.endswith(_DOCUMENT_EXTENSIONS):
                 icon = "📄"
-            elif link_text.lower().endswith(('.jpg', '.jpeg', '.png', '.gif')):
+            elif lowered.endswith(_IMAGE_EXTENSIONS):
                 icon = "🖼️"
             else:
                 icon = "🔗"
@@ -242,15 +255,7 @@ def show_task_details_modal(task_data: Dict[str, Any]) -> Dict[str, Any]:
             link_button.pack(anchor=tk.W, pady=2)
             
             # Make link clickable
-            def make_link_handler(url):
-                def handler(event=None):
-                    try:
-                        webbrowser.open(url)
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Failed to open link: {e}")
-                return handler
-            
-            link_button.bind('<Button-1>', make_link_handler(link_text))
+            link_button.bind('<Button-1>', partial(_open_link, link_text))
     
     # Quick Actions Section
     actions_frame = ttk.LabelFrame(scrollable_frame, text="Quick Actions", padding="10")
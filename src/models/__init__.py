@@ -6,7 +6,7 @@ from src.models.initiative import Initiative, InitiativePriority, InitiativeStat
 from src.models.notification import Notification, NotificationType
 from src.models.pending_suggestion import PendingSuggestionModel, SuggestionStatus
 from src.models.processed_granola_note import ProcessedGranolaNote
-from src.models.task import Task, TaskPriority, TaskSource, TaskStatus
+from src.models.task import Task, TaskPriority, TaskSource, TaskStatus, TaskTag
 
 __all__ = [
     "AgentAction",
@@ -25,6 +25,7 @@ __all__ = [
     "TaskPriority",
     "TaskSource",
     "TaskStatus",
+    "TaskTag",
     "get_db",
     "get_db_session",
     "init_db",
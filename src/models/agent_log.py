@@ -2,8 +2,9 @@
 
 import enum
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime, Enum, Integer, String, Text, func
+from sqlalchemy import JSON, DateTime, Enum, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.database import Base
@@ -50,7 +51,7 @@ class AgentLog(Base):
     action: Mapped[AgentAction | None] = mapped_column(Enum(AgentAction), nullable=True)
 
     message: Mapped[str] = mapped_column(String(1000), nullable=False)
-    details: Mapped[str | None] = mapped_column(Text, nullable=True)
+    details: Mapped[dict[str, Any] | str | None] = mapped_column(JSON, nullable=True)
 
     # For tracking LLM usage
     tokens_used: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -64,5 +65,8 @@ class AgentLog(Base):
         DateTime, server_default=func.now(), nullable=False
     )
 
+    # Fetch the server-generated timestamp in the INSERT itself (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<AgentLog(id={self.id}, level={self.level.value}, action={self.action})>"
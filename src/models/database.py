@@ -32,7 +32,10 @@ def get_session_factory():
     """Get or create the session factory."""
     global _SessionLocal
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+        # Objects stay loaded after commit, so writes don't need a follow-up refresh
+        _SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=get_engine()
+        )
     return _SessionLocal
 
 
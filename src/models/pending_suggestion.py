@@ -4,7 +4,7 @@ import enum
 import json
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, Float, Integer, String, Text, func
+from sqlalchemy import DateTime, Enum, Float, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.database import Base
@@ -62,17 +62,31 @@ class PendingSuggestionModel(Base):
     # If approved, link to the created task
     created_task_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    __table_args__ = (
+        # Covers the resolved-suggestion cleanup scan
+        Index("ix_pending_suggestions_status_resolved_at", "status", "resolved_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<PendingSuggestion(id={self.id}, title='{self.title[:30]}...', status={self.status.value})>"
 
     def get_tags_list(self) -> list[str]:
-        """Get tags as a list."""
+        """Get tags as a list.
+
+        The decoded list is memoized against the raw column value, so repeated
+        calls only parse the JSON again after tags change.
+        """
         if not self.tags:
             return []
-        try:
-            return json.loads(self.tags)
-        except json.JSONDecodeError:
-            return []
+
+        cached = getattr(self, "_parsed_tags", None)
+        if cached is None or cached[0] != self.tags:
+            try:
+                parsed = json.loads(self.tags)
+            except json.JSONDecodeError:
+                parsed = []
+            cached = self._parsed_tags = (self.tags, parsed)
+        return list(cached[1])
 
     def set_tags_list(self, tags: list[str] | None) -> None:
         """Set tags from a list."""
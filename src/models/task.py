@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.database import Base
@@ -95,6 +95,25 @@ class Task(Base):
         "Initiative", back_populates="tasks"
     )
 
+    # Indexed copy of tags used for filtering (kept in sync by set_tags_list).
+    # Not passive_deletes: SQLite only enforces ON DELETE CASCADE with foreign
+    # keys enabled, so the ORM deletes the rows itself
+    tag_entries: Mapped[list["TaskTag"]] = relationship(
+        "TaskTag", cascade="all, delete-orphan"
+    )
+
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Active-task lookups filter on status, then range over due date
+        # (overdue / due soon) or order by score (prioritized lists)
+        Index("ix_tasks_status_due_date", "status", "due_date"),
+        Index("ix_tasks_status_priority_score", "status", "priority_score"),
+        # Completed-task statistics
+        Index("ix_tasks_status_completed_at", "status", "completed_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title='{self.title[:30]}...', status={self.status.value})>"
 
@@ -107,6 +126,8 @@ class Task(Base):
     def set_tags_list(self, tags: list[str]) -> None:
         """Set tags from a list."""
         self.tags = ",".join(tags) if tags else None
+        normalized = dict.fromkeys(tag.strip().lower() for tag in tags or [])
+        self.tag_entries = [TaskTag(tag=tag) for tag in normalized if tag]
 
     def get_document_links_list(self) -> list[str]:
         """Get document links as a list.
@@ -138,3 +159,17 @@ class Task(Base):
         else:
             import json
             self.document_links = json.dumps(links)
+
+
+class TaskTag(Base):
+    """A single lowercased tag on a task, indexed for tag filters."""
+
+    __tablename__ = "task_tags"
+
+    task_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag: Mapped[str] = mapped_column(String(500), primary_key=True, index=True)
+
+    def __repr__(self) -> str:
+        return f"<TaskTag(task_id={self.task_id}, tag='{self.tag}')>"
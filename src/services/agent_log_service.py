@@ -1,17 +1,32 @@
 """Agent log service for tracking agent activity and decisions."""
 
-import json
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from src.models.agent_log import AgentAction, AgentLog, LogLevel
+from src.utils.dates import naive_utcnow
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import so log() doesn't need getattr/enum lookups per call
+_LOG_METHODS = {
+    LogLevel.DEBUG: logger.debug,
+    LogLevel.INFO: logger.info,
+    LogLevel.WARNING: logger.warning,
+    LogLevel.ERROR: logger.error,
+}
+_ACTION_LABELS: dict[AgentAction | None, str] = {action: action.value for action in AgentAction}
+_ACTION_LABELS[None] = "GENERAL"
+
+# Query parameters whose values are redacted from logged URLs
+_SENSITIVE_PARAMS = frozenset(
+    {"api_key", "apikey", "key", "token", "secret", "password", "auth"}
+)
+
 
 class AgentLogService:
     """Service for logging and querying agent activity."""
@@ -42,7 +57,7 @@ class AgentLogService:
             message: Log message
             level: Log level (DEBUG, INFO, WARNING, ERROR)
             action: Type of agent action
-            details: Additional details (dict will be JSON serialized)
+            details: Additional details (stored in a JSON column)
             tokens_used: LLM tokens used (if applicable)
             model_used: LLM model used (if applicable)
             reference_type: Type of related entity (task, email, etc.)
@@ -51,10 +66,6 @@ class AgentLogService:
         Returns:
             The created AgentLog entry
         """
-        # Convert dict details to JSON string
-        if isinstance(details, dict):
-            details = json.dumps(details)
-
         log_entry = AgentLog(
             level=level,
             action=action,
@@ -66,13 +77,14 @@ class AgentLogService:
             reference_id=reference_id,
         )
 
+        # No refresh: the session doesn't expire on commit, and eager_defaults
+        # returns the server-default created_at with the INSERT, so the entry
+        # is already complete.
         self.db.add(log_entry)
         self.db.commit()
-        self.db.refresh(log_entry)
 
         # Also log to Python logger
-        log_method = getattr(logger, level.value)
-        log_method(f"[{action.value if action else 'GENERAL'}] {message}")
+        _LOG_METHODS[level]("[%s] %s", _ACTION_LABELS[action], message)
 
         return log_entry
 
@@ -135,13 +147,15 @@ class AgentLogService:
         Returns:
             The created AgentLog entry
         """
+        # The title appears once (in the message); the full title lives on the
+        # referenced task row, so it is not duplicated into details.
         return self.log(
             f"Created task from {source}: {task_title[:100]}",
             level=LogLevel.INFO,
             action=AgentAction.CREATE_TASK,
             reference_type="task",
             reference_id=str(task_id),
-            details={"source": source, "title": task_title},
+            details={"source": source},
         )
 
     def log_poll(
@@ -315,30 +329,22 @@ class AgentLogService:
         Returns:
             Sanitized URL with sensitive params redacted
         """
-        from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
-
-        sensitive_params = {"api_key", "apikey", "key", "token", "secret", "password", "auth"}
-
         try:
-            parsed = urlparse(url)
-            query_params = parse_qs(parsed.query)
-
-            # Redact sensitive parameters
-            for param in query_params:
-                if param.lower() in sensitive_params:
-                    query_params[param] = ["[REDACTED]"]
-
-            # Reconstruct URL
-            sanitized_query = urlencode(query_params, doseq=True)
-            sanitized = urlunparse((
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path,
-                parsed.params,
-                sanitized_query,
-                "",  # Remove fragment
-            ))
-            return sanitized
+            # Single pass over the query string; the fragment is dropped
+            url = url.partition("#")[0]
+            base, sep, query = url.partition("?")
+            if not sep:
+                return url
+
+            params = []
+            for param in query.split("&"):
+                name = param.partition("=")[0]
+                if name.lower() in _SENSITIVE_PARAMS:
+                    params.append(f"{name}=[REDACTED]")
+                else:
+                    params.append(param)
+
+            return f"{base}?{'&'.join(params)}"
         except Exception:
             # If parsing fails, return a truncated version
             return url[:100] + "..." if len(url) > 100 else url
@@ -351,6 +357,7 @@ class AgentLogService:
         since: datetime | None = None,
         limit: int = 100,
         offset: int = 0,
+        count: bool = True,
     ) -> tuple[list[AgentLog], int]:
         """Query log entries.
 
@@ -360,6 +367,7 @@ class AgentLogService:
             since: Filter logs after this datetime
             limit: Maximum number of logs to return
             offset: Offset for pagination
+            count: Run the total-count query (total is -1 when False)
 
         Returns:
             Tuple of (logs, total_count)
@@ -375,7 +383,7 @@ class AgentLogService:
         if since is not None:
             query = query.filter(AgentLog.created_at >= since)
 
-        total = query.count()
+        total = query.count() if count else -1
 
         logs = (
             query.order_by(AgentLog.created_at.desc())
@@ -396,8 +404,8 @@ class AgentLogService:
         Returns:
             List of recent AgentLog entries
         """
-        since = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=hours)
-        logs, _ = self.get_logs(since=since, limit=limit)
+        since = naive_utcnow() - timedelta(hours=hours)
+        logs, _ = self.get_logs(since=since, limit=limit, count=False)
         return logs
 
     def get_llm_usage_stats(
@@ -412,25 +420,11 @@ class AgentLogService:
         Returns:
             Dict with usage statistics
         """
+        now = naive_utcnow()
         if since is None:
-            since = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=24)
-
-        query = (
-            self.db.query(AgentLog)
-            .filter(AgentLog.action == AgentAction.LLM_REQUEST)
-            .filter(AgentLog.created_at >= since)
-        )
-
-        # Get totals
-        total_requests = query.count()
-        total_tokens = (
-            self.db.query(func.sum(AgentLog.tokens_used))
-            .filter(AgentLog.action == AgentAction.LLM_REQUEST)
-            .filter(AgentLog.created_at >= since)
-            .scalar()
-        ) or 0
+            since = now - timedelta(hours=24)
 
-        # Get breakdown by model
+        # Single GROUP BY; overall totals are summed from the per-model rows
         model_breakdown = (
             self.db.query(
                 AgentLog.model_used,
@@ -443,8 +437,11 @@ class AgentLogService:
             .all()
         )
 
+        total_requests = sum(count for _, count, _ in model_breakdown)
+        total_tokens = sum(tokens or 0 for _, _, tokens in model_breakdown)
+
         return {
-            "period_hours": (datetime.now(UTC).replace(tzinfo=None) - since).total_seconds() / 3600,
+            "period_hours": (now - since).total_seconds() / 3600,
             "total_requests": total_requests,
             "total_tokens": total_tokens,
             "by_model": {
@@ -466,7 +463,7 @@ class AgentLogService:
         Returns:
             Dict with activity summary
         """
-        since = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=hours)
+        since = naive_utcnow() - timedelta(hours=hours)
 
         # Count by action type
         action_counts = dict(
@@ -534,7 +531,7 @@ class AgentLogService:
         Returns:
             Number of logs deleted
         """
-        cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days)
+        cutoff = naive_utcnow() - timedelta(days=days)
 
         deleted = (
             self.db.query(AgentLog)
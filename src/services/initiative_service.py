@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from src.models.initiative import Initiative, InitiativePriority, InitiativeStatus
 from src.models.task import Task, TaskStatus
@@ -27,9 +27,13 @@ class InitiativeService:
         include_completed: bool = True,
         limit: int = 50,
         offset: int = 0,
+        load_tasks: bool = False,
     ) -> tuple[list[Initiative], int]:
         """Get initiatives with filtering.
 
+        Args:
+            load_tasks: Eager-load each initiative's tasks in one extra query
+
         Returns:
             Tuple of (initiatives, total_count)
         """
@@ -60,6 +64,9 @@ class InitiativeService:
             InitiativePriority.MEDIUM: 2,
             InitiativePriority.LOW: 3,
         }
+        if load_tasks:
+            query = query.options(selectinload(Initiative.tasks))
+
         initiatives = (
             query.order_by(Initiative.created_at.desc())
             .offset(offset)
@@ -72,13 +79,12 @@ class InitiativeService:
 
         return initiatives, total
 
-    def get_active_initiatives(self) -> list[Initiative]:
+    def get_active_initiatives(self, *, load_tasks: bool = False) -> list[Initiative]:
         """Get all active initiatives ordered by priority."""
-        initiatives = (
-            self.db.query(Initiative)
-            .filter(Initiative.status == InitiativeStatus.ACTIVE)
-            .all()
-        )
+        query = self.db.query(Initiative).filter(Initiative.status == InitiativeStatus.ACTIVE)
+        if load_tasks:
+            query = query.options(selectinload(Initiative.tasks))
+        initiatives = query.all()
         priority_order = {
             InitiativePriority.HIGH: 1,
             InitiativePriority.MEDIUM: 2,
@@ -170,6 +176,35 @@ class InitiativeService:
             .scalar()
         )
 
+        completed_tasks = 0
+        if total_tasks:
+            completed_tasks = (
+                self.db.query(func.count(Task.id))
+                .filter(
+                    Task.initiative_id == initiative_id,
+                    Task.status == TaskStatus.COMPLETED,
+                )
+                .scalar()
+            )
+
+        return self._progress_dict(total_tasks, completed_tasks)
+
+    def get_loaded_initiative_progress(self, initiative: Initiative) -> dict:
+        """Calculate progress from an initiative's already-loaded tasks.
+
+        Use with initiatives fetched via ``load_tasks=True`` to avoid issuing
+        COUNT queries per initiative.
+
+        Returns:
+            Dict with total_tasks, completed_tasks, and progress_percent
+        """
+        tasks = initiative.tasks
+        completed_tasks = sum(1 for t in tasks if t.status == TaskStatus.COMPLETED)
+        return self._progress_dict(len(tasks), completed_tasks)
+
+    @staticmethod
+    def _progress_dict(total_tasks: int, completed_tasks: int) -> dict:
+        """Build the progress dict from task counts."""
         if total_tasks == 0:
             return {
                 "total_tasks": 0,
@@ -177,15 +212,6 @@ class InitiativeService:
                 "progress_percent": 0.0,
             }
 
-        completed_tasks = (
-            self.db.query(func.count(Task.id))
-            .filter(
-                Task.initiative_id == initiative_id,
-                Task.status == TaskStatus.COMPLETED,
-            )
-            .scalar()
-        )
-
         progress_percent = (completed_tasks / total_tasks) * 100
 
         return {
@@ -205,17 +231,14 @@ class InitiativeService:
         Returns:
             List of dicts with initiative data and progress info
         """
-        if status:
-            initiatives, _ = self.get_initiatives(status=status, include_completed=include_completed)
-        else:
-            initiatives, _ = self.get_initiatives(include_completed=include_completed)
-
-        result = []
-        for initiative in initiatives:
-            progress = self.get_initiative_progress(initiative.id)
-            result.append({
-                "initiative": initiative,
-                "progress": progress,
-            })
+        initiatives, _ = self.get_initiatives(
+            status=status, include_completed=include_completed, load_tasks=True
+        )
 
-        return result
+        return [
+            {
+                "initiative": initiative,
+                "progress": self.get_loaded_initiative_progress(initiative),
+            }
+            for initiative in initiatives
+        ]
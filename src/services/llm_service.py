@@ -3,35 +3,408 @@
 Uses litellm for OpenAI API-compatible calls, supporting any provider.
 """
 
+import asyncio
+import hashlib
+import heapq
 import json
 import logging
+import re
+import threading
 import time
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Callable
-
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import httpx
 import litellm
+import tiktoken
 from litellm import acompletion
 
 from src.utils.config import LLMConfig
 
+try:
+    import ciso8601
+except ImportError:  # Optional C parser; the stdlib fallback is slower but equivalent
+    ciso8601 = None
+
 # Type for HTTP logging callback
 HttpLogCallback = Callable[[str, str, int | None, float | None, str | None, str | None], None]
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Substitutions applied when repairing near-miss JSON from the model
+_SMART_QUOTES = str.maketrans({"\u201c": '"', "\u201d": '"', "\u2018": "'", "\u2019": "'"})
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+# Responses are only cached for requests at or below this temperature
+_CACHEABLE_MAX_TEMPERATURE = 0.5
+_RESPONSE_CACHE_MAXSIZE = 1024
+
+# Limits for packing several texts into one extraction request
+_MAX_BATCH_INPUT_TOKENS = 6000
+_MAX_BATCH_DOCUMENTS = 10
+
+# Longest text sent for single-text extraction; longer input is truncated locally
+_MAX_EXTRACTION_INPUT_TOKENS = 12000
+# Rough characters per token for English text, used when no tokenizer is available
+_CHARS_PER_TOKEN = 4
+
+# Upper bound on LLM requests in flight when fanning out independent calls
+_MAX_CONCURRENT_REQUESTS = 10
+
+# Connection pool shared by all litellm requests in the process
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=90)
+_HTTP_TIMEOUT = 30.0
+
+# On-disk cache of LLM-resolved date phrases, valid for the day they were parsed
+_DEFAULT_DATE_CACHE_PATH = Path.home() / ".personal-assistant" / "date-parse-cache.json"
+
+
+# Task statuses excluded from recommendation context, and priority levels
+_CLOSED_STATUSES = frozenset({"completed", "cancelled"})
+_PRIORITY_LEVELS = ("critical", "high", "medium", "low")
+_VALID_PRIORITIES = frozenset(_PRIORITY_LEVELS)
+_HIGH_PRIORITIES = frozenset({"critical", "high"})
+
+# Relative date phrases resolved locally instead of by the LLM
+_RELATIVE_DAYS = {"today": 0, "tomorrow": 1, "day after tomorrow": 2}
+_IN_N_UNITS_PATTERN = re.compile(r"^in (\d+|an?|one) (day|week)s?$")
+_NEXT_WEEKDAY_PATTERN = re.compile(r"^next ([a-z]+)$")
+_WEEKDAYS = {
+    name: index
+    for index, names in enumerate(
+        [
+            ("monday", "mon"),
+            ("tuesday", "tue", "tues"),
+            ("wednesday", "wed"),
+            ("thursday", "thu", "thur", "thurs"),
+            ("friday", "fri"),
+            ("saturday", "sat"),
+            ("sunday", "sun"),
+        ]
+    )
+    for name in names
+}
+
+# Structured-output schema for single-text extraction, used when the model supports it.
+# Schemas must have an object at the top level, so the task array is wrapped.
+_EXTRACTION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "extracted_tasks",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "tasks": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {"type": "string"},
+                            "description": {"type": ["string", "null"]},
+                            "priority": {"type": "string", "enum": list(_PRIORITY_LEVELS)},
+                            "due_date": {"type": ["string", "null"]},
+                            "tags": {"type": "array", "items": {"type": "string"}},
+                            "confidence": {"type": "number"},
+                            "suggested_initiative_id": {"type": ["integer", "null"]},
+                            "document_links": {"type": "array", "items": {"type": "string"}},
+                        },
+                        "required": ["title", "priority", "confidence"],
+                    },
+                }
+            },
+            "required": ["tasks"],
+        },
+    },
+}
+
+# System prompt templates; only the dated and per-call sections are filled in
+_EXTRACTION_SYSTEM_PROMPT_TEMPLATE = """You are a task extraction assistant. Analyze the given text and extract any actionable tasks or requests.
+
+Today's date is {today_str} ({weekday}). Use this to interpret relative dates correctly.
+
+For each task, determine:
+- title: A clear, concise task title (max 100 chars)
+- description: Additional context if needed
+- priority: "critical", "high", "medium", or "low" based on urgency indicators
+- due_date: If a deadline is mentioned, extract it in ISO format (YYYY-MM-DDTHH:MM:SS). For relative dates like "this Sunday", "tomorrow", "next week", calculate the actual future date based on today's date.
+- tags: Relevant tags for categorization
+- confidence: Your confidence in this being a real task (0.0 to 1.0)
+- suggested_initiative_id: (optional) If this task relates to one of the available initiatives, include its ID. Otherwise omit this field.
+- document_links: (optional) Array of relevant URLs found in the text (Google Docs, Notion, GitHub, Confluence, Jira, etc.). Extract URLs that are directly related to the task.
+
+Return a JSON array of tasks. If no actionable tasks are found, return an empty array [].
+
+Priority guidelines:
+- critical: Contains "ASAP", "urgent", "immediately", "emergency", or blocking issues
+- high: Has a deadline within 1-2 days, or explicitly marked important
+- medium: Normal requests without urgency indicators
+- low: "when you get a chance", "no rush", or informational items
 
-@dataclass
+IMPORTANT: All due dates must be in the future. If someone says "this Sunday" and today is {weekday}, calculate the next upcoming Sunday.{initiatives_context}
+
+Example output:
+[{{"title": "Review PR #123", "description": "Code review requested by John", "priority": "high", "due_date": "2026-01-29T17:00:00", "tags": ["code-review", "engineering"], "confidence": 0.9, "document_links": ["https://github.com/org/repo/pull/123"]}}]"""
+
+_DATE_PARSE_SYSTEM_PROMPT_TEMPLATE = """You are a date parsing assistant. Convert natural language date expressions to ISO format datetime.
+
+Today's date is {today_str} ({weekday}). The current time is {current_time}.
+
+Rules:
+- Return ONLY the datetime in ISO format: YYYY-MM-DDTHH:MM:SS
+- If no time is specified, use 23:59:00 (end of day)
+- For relative dates like "next Friday", calculate the actual date
+- For "end of month", use the last day of the current month
+- For "end of week", use Sunday
+- If the date is ambiguous or cannot be parsed, return "INVALID"
+
+Examples:
+- "tomorrow" -> {tomorrow}T23:59:00
+- "next Friday" -> [calculate the next Friday from today]
+- "in 3 days" -> {in_three_days}T23:59:00
+- "February 15th" -> 2026-02-15T23:59:00
+- "this Sunday at 5pm" -> [next Sunday]T17:00:00
+
+Respond with ONLY the ISO datetime string, nothing else."""
+
+
+def _format_table(columns: tuple[str, ...], rows: list[tuple[Any, ...]]) -> str:
+    """Serialize rows as a compact pipe-separated table with a single header line.
+
+    Sends far fewer tokens than one descriptive sentence per row. Missing values
+    become empty cells and pipes inside values are replaced so rows stay aligned.
+    """
+    lines = ["|".join(columns)]
+    for row in rows:
+        lines.append(
+            "|".join("" if value is None else str(value).replace("|", "/") for value in row)
+        )
+    return "\n".join(lines)
+
+
+def _coerce_priority(value: Any) -> str:
+    """Normalize a model-supplied priority, defaulting unknown values to medium."""
+    if isinstance(value, str):
+        value = value.strip().lower()
+        if value in _VALID_PRIORITIES:
+            return value
+    return "medium"
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO-8601 datetime from the model as a naive datetime.
+
+    Raises:
+        ValueError: If value is not a valid ISO-8601 datetime
+    """
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime_as_naive(value)
+        except ValueError:
+            pass  # ciso8601 is stricter than the stdlib; let fromisoformat decide
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+
+def _resolve_relative_date(phrase: str, now: datetime) -> datetime | None:
+    """Resolve simple relative date phrases without calling the LLM.
+
+    Handles "today", "tomorrow", "in N days/weeks" and "next <weekday>"
+    (the next occurrence after today). Resolved dates use end of day, as the
+    LLM is instructed to when no time is given.
+
+    Args:
+        phrase: Date phrase to resolve
+        now: Reference time
+
+    Returns:
+        Resolved datetime, or None if the phrase needs the LLM
+    """
+    phrase = " ".join(phrase.lower().split())
+    days = _RELATIVE_DAYS.get(phrase)
+
+    if days is None and (match := _IN_N_UNITS_PATTERN.match(phrase)):
+        count = int(match.group(1)) if match.group(1).isdigit() else 1
+        days = count * 7 if match.group(2) == "week" else count
+
+    if days is None and (match := _NEXT_WEEKDAY_PATTERN.match(phrase)):
+        target = _WEEKDAYS.get(match.group(1))
+        if target is not None:
+            days = (target - now.weekday() - 1) % 7 + 1
+
+    if days is None:
+        return None
+    return (now + timedelta(days=days)).replace(hour=23, minute=59, second=0, microsecond=0)
+
+
+async def _gather_limited(
+    coros: list[Awaitable[Any]],
+    max_concurrency: int = _MAX_CONCURRENT_REQUESTS,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Await coroutines concurrently with at most max_concurrency running at once.
+
+    Every coroutine is scheduled before any result is awaited, so independent
+    requests overlap instead of running one after another.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros), return_exceptions=return_exceptions)
+
+
+# Process-wide keep-alive client installed as litellm's async session, and the
+# event loop it was opened on (its connections can't be used from another loop)
+_shared_http_client: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+_shared_http_client_lock = threading.Lock()
+
+
+async def _get_shared_http_client() -> httpx.AsyncClient:
+    """Get the keep-alive HTTP client used for LLM requests.
+
+    One client serves every LLMService, since litellm only has one async
+    session. It is created on first use, and again after it is closed or when
+    called from a different event loop; a replaced client is closed so its
+    connection pool isn't leaked.
+
+    Returns:
+        Shared httpx AsyncClient, installed as litellm's async session
+    """
+    global _shared_http_client
+
+    loop = asyncio.get_running_loop()
+    previous = None
+    with _shared_http_client_lock:
+        if (
+            _shared_http_client is None
+            or _shared_http_client[0] is not loop
+            or _shared_http_client[1].is_closed
+        ):
+            previous = _shared_http_client
+            _shared_http_client = (
+                loop,
+                httpx.AsyncClient(limits=_HTTP_LIMITS, http2=True, timeout=_HTTP_TIMEOUT),
+            )
+        client = _shared_http_client[1]
+    litellm.aclient_session = client
+
+    if previous is not None:
+        await _close_http_client(*previous)
+    return client
+
+
+async def _close_shared_http_client() -> None:
+    """Close the shared HTTP client, if one is open, and uninstall it from litellm."""
+    global _shared_http_client
+
+    with _shared_http_client_lock:
+        previous, _shared_http_client = _shared_http_client, None
+    if previous is None:
+        return
+    if litellm.aclient_session is previous[1]:
+        litellm.aclient_session = None
+    await _close_http_client(*previous)
+
+
+async def _close_http_client(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """Close client, on the event loop that owns its connections when that loop is still running."""
+    if client.is_closed:
+        return
+    try:
+        if loop is not asyncio.get_running_loop() and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            await client.aclose()
+    except Exception as e:
+        # Connections of a closed loop can't be shut down cleanly; they are released on GC
+        logger.debug("Could not close replaced HTTP client: %s", e)
+
+
+@lru_cache(maxsize=8)
+def _warm_model_metadata(model: str) -> None:
+    """Resolve litellm's provider and model info once so the first request doesn't pay for it."""
+    try:
+        litellm.get_llm_provider(model)
+        litellm.get_model_info(model)
+    except Exception as e:
+        # Unknown or custom models have no metadata; requests still work
+        logger.debug("Could not preload litellm metadata for %s: %s", model, e)
+    _supports_response_schema(model)
+
+
+@lru_cache(maxsize=8)
+def _supports_response_schema(model: str) -> bool:
+    """Check whether litellm knows model to accept a JSON-schema response_format."""
+    try:
+        return litellm.supports_response_schema(model=model)
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> tiktoken.Encoding | None:
+    """Return the tokenizer for model, falling back to cl100k_base for unknown models.
+
+    tiktoken downloads its BPE files on first use, so this returns None (and
+    caches that) when they can't be loaded, e.g. without network access.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model.rsplit("/", 1)[-1])
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("Could not load tokenizer for %s, estimating tokens by length: %s", model, e)
+        return None
+
+
+def _truncate_to_tokens(text: str, model: str, max_tokens: int) -> str:
+    """Trim text to at most max_tokens tokens so oversized input isn't rejected by the API."""
+    # Every token covers at least one character, so short text can't be over the limit
+    if len(text) <= max_tokens:
+        return text
+    encoding = _get_encoding(model)
+    if encoding is None:
+        max_chars = max_tokens * _CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        logger.warning("Truncating extraction input from %s to %s characters", len(text), max_chars)
+        return text[:max_chars]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    logger.warning("Truncating extraction input from %s to %s tokens", len(tokens), max_tokens)
+    return encoding.decode(tokens[:max_tokens])
+
+
+@lru_cache(maxsize=8)
+def _format_extraction_system_prompt(today: date, initiatives_context: str) -> str:
+    """Render the extraction system prompt, memoized per day and initiative set."""
+    return _EXTRACTION_SYSTEM_PROMPT_TEMPLATE.format(
+        today_str=today.strftime("%Y-%m-%d"),
+        weekday=today.strftime("%A"),
+        initiatives_context=initiatives_context,
+    )
+
+
+@dataclass(slots=True)
 class LLMResponse:
     """Response from an LLM call."""
 
     content: str
     tokens_used: int
     model: str
-    raw_response: dict[str, Any] | None = None
+    raw_response: dict[str, Any] | None = None  # Only populated when debug logging is on
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedTask:
     """A task extracted from text by the LLM."""
 
@@ -45,7 +418,7 @@ class ExtractedTask:
     document_links: list[str] | None = None  # Extracted URLs from the text
 
 
-@dataclass
+@dataclass(slots=True)
 class PrioritySuggestion:
     """A prioritization suggestion from the LLM."""
 
@@ -56,7 +429,7 @@ class PrioritySuggestion:
     confidence: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductivityRecommendation:
     """A productivity recommendation from the LLM."""
 
@@ -67,19 +440,186 @@ class ProductivityRecommendation:
     actionable_steps: list[str] | None = None
 
 
+class LLMResponseCache:
+    """Bounded in-memory LRU cache of LLM responses with a TTL."""
+
+    def __init__(self, maxsize: int = _RESPONSE_CACHE_MAXSIZE, ttl: float = 3600):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses kept (least recently used evicted)
+            ttl: Seconds a cached response stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, LLMResponse]] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: dict[str, Any] | None = None,
+    ) -> str:
+        """Build a cache key from everything that determines the response."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "response_format": response_format,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class JSONArrayStream:
+    """Incremental parser yielding top-level JSON array elements as they close.
+
+    Text before the opening ``[`` (such as a markdown fence) is skipped. If the
+    model returns a bare object instead of an array, that object is yielded as
+    the only element.
+    """
+
+    def __init__(self):
+        """Initialize the parser state."""
+        self._depth = 0
+        self._element_depth: int | None = None
+        self._buffer: list[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._done = False
+
+    def feed(self, chunk: str) -> list[Any]:
+        """Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of the response
+
+        Returns:
+            Elements completed by this chunk, in order
+        """
+        elements = []
+        for ch in chunk:
+            if self._done:
+                break
+            if self._element_depth is None:
+                if ch == "[":
+                    self._element_depth = self._depth = 1
+                    continue
+                if ch != "{":
+                    continue
+                self._element_depth = 0
+
+            in_element = self._depth > self._element_depth
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "[{":
+                self._depth += 1
+            elif ch in "]}":
+                self._depth -= 1
+                if self._depth < self._element_depth:
+                    self._done = True
+                    break
+
+            if in_element or self._depth > self._element_depth:
+                self._buffer.append(ch)
+                if self._depth == self._element_depth:
+                    element = self._decode("".join(self._buffer))
+                    self._buffer.clear()
+                    if element is not None:
+                        elements.append(element)
+                    self._done = self._element_depth == 0
+        return elements
+
+    def finish(self) -> list[Any]:
+        """Flush an element left incomplete by a truncated stream.
+
+        Returns:
+            The repaired trailing element, if it could be recovered
+        """
+        if not self._buffer:
+            return []
+        element = self._decode(_repair_json("".join(self._buffer)))
+        self._buffer.clear()
+        self._done = True
+        return [element] if element is not None else []
+
+    @staticmethod
+    def _decode(text: str) -> Any:
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+        try:
+            return json.loads(_repair_json(text))
+        except json.JSONDecodeError as e:
+            logger.warning("Skipping unparseable streamed element: %s", e)
+            return None
+
+
 class LLMService:
     """Service for LLM-powered task extraction and recommendations."""
 
-    def __init__(self, config: LLMConfig, http_log_callback: HttpLogCallback | None = None):
+    def __init__(
+        self,
+        config: LLMConfig,
+        http_log_callback: HttpLogCallback | None = None,
+        date_cache_path: Path | None = None,
+    ):
         """Initialize the LLM service.
 
         Args:
             config: LLM configuration with API key, model, etc.
             http_log_callback: Optional callback for logging HTTP requests.
                 Signature: (method, url, status_code, duration, service, request_type) -> None
+            date_cache_path: File for caching parse_date results across runs.
+                Defaults to ~/.personal-assistant/date-parse-cache.json
         """
         self.config = config
         self._http_log_callback = http_log_callback
+        self._date_cache_path = date_cache_path or _DEFAULT_DATE_CACHE_PATH
+        self._response_cache = (
+            LLMResponseCache(ttl=config.response_cache_ttl) if config.response_cache_ttl else None
+        )
         self._configure_litellm()
 
     def set_http_log_callback(self, callback: HttpLogCallback | None) -> None:
@@ -99,12 +639,22 @@ class LLMService:
         # Disable litellm's verbose logging
         litellm.set_verbose = False
 
+        _warm_model_metadata(self.config.model)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client shared by all services, if one is open.
+
+        The next request opens a fresh client.
+        """
+        await _close_shared_http_client()
+
     async def _call_llm(
         self,
         messages: list[dict[str, str]],
         temperature: float | None = None,
         max_tokens: int | None = None,
         request_type: str = "completion",
+        response_format: dict[str, Any] | None = None,
     ) -> LLMResponse:
         """Make an async LLM call.
 
@@ -113,6 +663,7 @@ class LLMService:
             temperature: Override default temperature
             max_tokens: Override default max tokens
             request_type: Type of request for logging (e.g., 'task_extraction', 'recommendations')
+            response_format: Optional structured-output format forwarded to the provider
 
         Returns:
             LLMResponse with content and metadata
@@ -120,6 +671,22 @@ class LLMService:
         Raises:
             LLMError: If the API call fails
         """
+        temperature = temperature or self.config.temperature
+        max_tokens = max_tokens or self.config.max_tokens
+
+        # Low-temperature requests are effectively deterministic, so identical
+        # requests can be answered from the cache without a network round-trip
+        cache_key = None
+        if self._response_cache is not None and temperature <= _CACHEABLE_MAX_TEMPERATURE:
+            cache_key = LLMResponseCache.make_key(
+                self.config.model, messages, temperature, max_tokens, response_format
+            )
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("LLM cache hit for %s request", request_type)
+                # No tokens were spent on this call
+                return replace(cached, tokens_used=0)
+
         start_time = time.time()
         status_code = None
 
@@ -128,13 +695,18 @@ class LLMService:
         if not api_url.endswith("/chat/completions"):
             api_url = f"{api_url.rstrip('/')}/chat/completions"
 
+        await _get_shared_http_client()
+
+        extra_params = {"response_format": response_format} if response_format else {}
+
         try:
             response = await acompletion(
                 model=self.config.model,
                 messages=messages,
                 api_key=self.config.api_key,
-                temperature=temperature or self.config.temperature,
-                max_tokens=max_tokens or self.config.max_tokens,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **extra_params,
             )
 
             content = response.choices[0].message.content or ""
@@ -154,12 +726,21 @@ class LLMService:
                     request_type,
                 )
 
-            return LLMResponse(
+            # Dumping the full provider response is costly and only useful for debugging
+            raw_response = None
+            if logger.isEnabledFor(logging.DEBUG) and hasattr(response, "model_dump"):
+                raw_response = response.model_dump()
+
+            llm_response = LLMResponse(
                 content=content,
                 tokens_used=tokens_used,
                 model=self.config.model,
-                raw_response=response.model_dump() if hasattr(response, "model_dump") else None,
+                raw_response=raw_response,
             )
+            if cache_key is not None:
+                self._response_cache.set(cache_key, llm_response)
+
+            return llm_response
 
         except Exception as e:
             duration = time.time() - start_time
@@ -180,9 +761,76 @@ class LLMService:
                     request_type,
                 )
 
-            logger.error(f"LLM call failed: {e}")
+            logger.error("LLM call failed: %s", e)
             raise LLMError(f"LLM call failed: {e}") from e
 
+    async def _stream_llm(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        request_type: str = "completion",
+    ) -> AsyncIterator[str]:
+        """Make a streaming LLM call, yielding content as it arrives.
+
+        Streamed responses bypass the response cache.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            request_type: Type of request for logging
+
+        Yields:
+            Content deltas in arrival order
+
+        Raises:
+            LLMError: If the API call fails
+        """
+        start_time = time.time()
+        status_code = None
+
+        api_url = self.config.base_url or "https://api.openai.com/v1"
+        if not api_url.endswith("/chat/completions"):
+            api_url = f"{api_url.rstrip('/')}/chat/completions"
+
+        await _get_shared_http_client()
+
+        try:
+            response = await acompletion(
+                model=self.config.model,
+                messages=messages,
+                api_key=self.config.api_key,
+                temperature=temperature or self.config.temperature,
+                max_tokens=max_tokens or self.config.max_tokens,
+                stream=True,
+            )
+
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+
+            status_code = 200
+
+        except Exception as e:
+            status_code = getattr(e, "status_code", 500)
+            logger.error("LLM call failed: %s", e)
+            raise LLMError(f"LLM call failed: {e}") from e
+
+        finally:
+            if self._http_log_callback and status_code is not None:
+                self._http_log_callback(
+                    "POST",
+                    api_url,
+                    status_code,
+                    time.time() - start_time,
+                    "llm",
+                    request_type,
+                )
+
     async def extract_tasks_from_text(
         self,
         text: str,
@@ -201,52 +849,227 @@ class LLMService:
         Returns:
             List of extracted tasks
         """
-        today = datetime.now()
-        today_str = today.strftime("%Y-%m-%d")
-        weekday = today.strftime("%A")
+        if not text.strip():
+            return []
 
-        # Build initiatives context if provided
-        initiatives_context = ""
-        if initiatives:
-            initiatives_context = "\nAvailable initiatives to link tasks to:\n"
-            for init in initiatives:
-                initiatives_context += f"- ID {init.get('id')}: {init.get('title')} (priority: {init.get('priority', 'medium')})\n"
-            initiatives_context += "\nWhen a task is related to one of these initiatives, include suggested_initiative_id in your response.\n"
+        try:
+            response = await self._call_llm(
+                messages=self._build_extraction_messages(text, source, context, initiatives),
+                temperature=0.3,  # Lower temperature for more consistent extraction
+                request_type="task_extraction",
+                # Constrained output can't come back fenced or malformed
+                response_format=(
+                    _EXTRACTION_RESPONSE_FORMAT
+                    if _supports_response_schema(self.config.model)
+                    else None
+                ),
+            )
 
-        system_prompt = f"""You are a task extraction assistant. Analyze the given text and extract any actionable tasks or requests.
+            # Parse JSON response
+            tasks = self._parse_extracted_tasks(self._parse_json_response(response.content))
 
-Today's date is {today_str} ({weekday}). Use this to interpret relative dates correctly.
+            logger.info("Extracted %s tasks from %s", len(tasks), source)
+            return tasks
 
-For each task, determine:
-- title: A clear, concise task title (max 100 chars)
-- description: Additional context if needed
-- priority: "critical", "high", "medium", or "low" based on urgency indicators
-- due_date: If a deadline is mentioned, extract it in ISO format (YYYY-MM-DDTHH:MM:SS). For relative dates like "this Sunday", "tomorrow", "next week", calculate the actual future date based on today's date.
-- tags: Relevant tags for categorization
-- confidence: Your confidence in this being a real task (0.0 to 1.0)
-- suggested_initiative_id: (optional) If this task relates to one of the available initiatives, include its ID. Otherwise omit this field.
-- document_links: (optional) Array of relevant URLs found in the text (Google Docs, Notion, GitHub, Confluence, Jira, etc.). Extract URLs that are directly related to the task.
+        except LLMError:
+            raise
+        except Exception as e:
+            logger.error("Task extraction failed: %s", e)
+            return []
 
-Return a JSON array of tasks. If no actionable tasks are found, return an empty array [].
+    async def extract_tasks_from_text_stream(
+        self,
+        text: str,
+        source: str = "unknown",
+        context: str | None = None,
+        initiatives: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[ExtractedTask]:
+        """Extract tasks from text, yielding each one as soon as the model emits it.
 
-Priority guidelines:
-- critical: Contains "ASAP", "urgent", "immediately", "emergency", or blocking issues
-- high: Has a deadline within 1-2 days, or explicitly marked important
-- medium: Normal requests without urgency indicators
-- low: "when you get a chance", "no rush", or informational items
+        Same prompt and parsing as extract_tasks_from_text, but the response is
+        streamed and each task is yielded when its JSON object closes instead of
+        after the whole completion has been generated.
 
-IMPORTANT: All due dates must be in the future. If someone says "this Sunday" and today is {weekday}, calculate the next upcoming Sunday.{initiatives_context}
+        Args:
+            text: The text to extract tasks from
+            source: Source of the text (email, slack, meeting_notes, etc.)
+            context: Additional context about the text
+            initiatives: Optional list of initiative dicts with id, title, description
 
-Example output:
-[{{"title": "Review PR #123", "description": "Code review requested by John", "priority": "high", "due_date": "2026-01-29T17:00:00", "tags": ["code-review", "engineering"], "confidence": 0.9, "document_links": ["https://github.com/org/repo/pull/123"]}}]"""
+        Yields:
+            Extracted tasks in the order the model produces them
+
+        Raises:
+            LLMError: If the API call fails
+        """
+        if not text.strip():
+            return
+
+        parser = JSONArrayStream()
+        count = 0
+
+        async for chunk in self._stream_llm(
+            messages=self._build_extraction_messages(text, source, context, initiatives),
+            temperature=0.3,
+            request_type="task_extraction",
+        ):
+            for element in parser.feed(chunk):
+                for task in self._parse_extracted_tasks(element):
+                    count += 1
+                    yield task
+
+        for element in parser.finish():
+            for task in self._parse_extracted_tasks(element):
+                count += 1
+                yield task
+
+        logger.info("Extracted %s tasks from %s", count, source)
+
+    async def extract_tasks_from_texts(
+        self,
+        texts: list[str],
+        source: str = "unknown",
+        contexts: list[str | None] | None = None,
+        initiatives: list[dict[str, Any]] | None = None,
+    ) -> list[list[ExtractedTask] | BaseException]:
+        """Extract tasks from several independent texts with as few LLM calls as possible.
+
+        Texts are packed into a single request (split into sub-batches when the
+        combined input exceeds the token budget) and the model returns one task
+        array per text. If a batched response can't be attributed to its texts,
+        that sub-batch falls back to one extract_tasks_from_text call per text.
+        A failed request only affects the texts it covered.
+
+        Args:
+            texts: The texts to extract tasks from
+            source: Source of the texts (email, slack, meeting_notes, etc.)
+            contexts: Optional per-text context, aligned with texts
+            initiatives: Optional list of initiative dicts with id, title, description
+
+        Returns:
+            One entry per input text, in order: the extracted tasks, or the
+            exception (such as LLMError) raised while extracting that text
+        """
+        contexts = contexts or [None] * len(texts)
+        batches = self._split_extraction_batches(list(zip(texts, contexts, strict=True)))
+
+        # Sub-batches are independent requests, so run them concurrently
+        batch_results = await _gather_limited(
+            [self._extract_tasks_batch(batch, source, initiatives) for batch in batches],
+            return_exceptions=True,
+        )
+
+        results: list[list[ExtractedTask] | BaseException] = []
+        for batch, result in zip(batches, batch_results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Task extraction failed for %s %s documents: %s", len(batch), source, result
+                )
+                results.extend([result] * len(batch))
+            else:
+                results.extend(result)
+        return results
+
+    async def extract_tasks_many(
+        self,
+        items: list[tuple[str, str, str | None]],
+        initiatives: list[dict[str, Any]] | None = None,
+        max_concurrency: int = _MAX_CONCURRENT_REQUESTS,
+    ) -> list[list[ExtractedTask] | BaseException]:
+        """Run extract_tasks_from_text for several texts concurrently.
+
+        Args:
+            items: (text, source, context) tuples to extract tasks from
+            initiatives: Optional list of initiative dicts with id, title, description
+            max_concurrency: Maximum number of LLM requests in flight at once
+
+        Returns:
+            One entry per item, in order: the extracted tasks, or the exception
+            (such as LLMError) raised for that item
+        """
+        return await _gather_limited(
+            [
+                self.extract_tasks_from_text(
+                    text=text, source=source, context=context, initiatives=initiatives
+                )
+                for text, source, context in items
+            ],
+            max_concurrency=max_concurrency,
+            return_exceptions=True,
+        )
+
+    def _split_extraction_batches(
+        self, items: list[tuple[str, str | None]]
+    ) -> list[list[tuple[str, str | None]]]:
+        """Group (text, context) pairs into batches that fit the input token budget."""
+        batches: list[list[tuple[str, str | None]]] = []
+        current: list[tuple[str, str | None]] = []
+        current_tokens = 0
+
+        for text, context in items:
+            tokens = self._count_tokens(f"{context or ''}\n{text}")
+            if current and (
+                current_tokens + tokens > _MAX_BATCH_INPUT_TOKENS
+                or len(current) >= _MAX_BATCH_DOCUMENTS
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append((text, context))
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _count_tokens(self, text: str) -> int:
+        """Count prompt tokens for the configured model (approximate on failure)."""
+        try:
+            return litellm.token_counter(model=self.config.model, text=text)
+        except Exception:
+            return len(text) // 4
+
+    async def _extract_tasks_batch(
+        self,
+        batch: list[tuple[str, str | None]],
+        source: str,
+        initiatives: list[dict[str, Any]] | None,
+    ) -> list[list[ExtractedTask] | BaseException]:
+        """Extract tasks for several texts in a single LLM call.
+
+        A one-text batch uses the regular single-text extraction prompt. When
+        falling back to per-text extraction, each text's failure is returned in
+        its slot rather than raised.
+
+        Raises:
+            LLMError: If the batched LLM call fails
+        """
+        if len(batch) == 1:
+            text, context = batch[0]
+            return [
+                await self.extract_tasks_from_text(
+                    text=text, source=source, context=context, initiatives=initiatives
+                )
+            ]
+
+        system_prompt = self._build_extraction_system_prompt(initiatives) + f"""
+
+You will receive {len(batch)} independent documents, each starting with a "---DOC <n>---" line.
+Extract tasks separately for each document. Return a single JSON object mapping each document number (as a string) to its array of tasks, e.g. {{"0": [...], "1": []}}. Include every document number, using [] when a document has no tasks."""
+
+        documents = []
+        for i, (text, context) in enumerate(batch):
+            documents.append(f"---DOC {i}---")
+            if context:
+                documents.append(f"Context: {context}")
+            documents.append(text)
+        documents_text = "\n".join(documents)
 
         user_prompt = f"""Source: {source}
-{f"Context: {context}" if context else ""}
 
-Text to analyze:
-{text}
+Documents to analyze:
+{documents_text}
 
-Extract all actionable tasks as JSON:"""
+Extract all actionable tasks per document as JSON:"""
 
         try:
             response = await self._call_llm(
@@ -254,61 +1077,125 @@ Extract all actionable tasks as JSON:"""
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt},
                 ],
-                temperature=0.3,  # Lower temperature for more consistent extraction
-                request_type="task_extraction",
+                temperature=0.3,
+                request_type="task_extraction_batch",
+            )
+            data = self._parse_json_response(response.content)
+        except LLMError:
+            raise
+        except Exception as e:
+            logger.error("Batched task extraction failed: %s", e)
+            data = None
+
+        if not isinstance(data, dict):
+            logger.warning("Batched extraction response was not per-document; extracting individually")
+            return await _gather_limited(
+                [
+                    self.extract_tasks_from_text(
+                        text=text, source=source, context=context, initiatives=initiatives
+                    )
+                    for text, context in batch
+                ],
+                return_exceptions=True,
             )
 
-            # Parse JSON response
-            tasks_data = self._parse_json_response(response.content)
-            if not isinstance(tasks_data, list):
-                tasks_data = [tasks_data] if tasks_data else []
+        results = [self._parse_extracted_tasks(data.get(str(i), [])) for i in range(len(batch))]
+        logger.info(
+            "Extracted %s tasks from %s %s documents",
+            sum(len(r) for r in results),
+            len(batch),
+            source,
+        )
+        return results
 
-            tasks = []
-            for task_data in tasks_data:
-                try:
-                    due_date = None
-                    if task_data.get("due_date"):
-                        try:
-                            due_date = datetime.fromisoformat(task_data["due_date"].replace("Z", ""))
-                        except (ValueError, TypeError):
-                            pass
-
-                    suggested_initiative_id = None
-                    if task_data.get("suggested_initiative_id"):
-                        try:
-                            suggested_initiative_id = int(task_data["suggested_initiative_id"])
-                        except (ValueError, TypeError):
-                            pass
-
-                    # Extract document links
-                    document_links = task_data.get("document_links")
-                    if document_links and not isinstance(document_links, list):
-                        document_links = None
-
-                    tasks.append(
-                        ExtractedTask(
-                            title=task_data.get("title", "Untitled Task")[:500],
-                            description=task_data.get("description"),
-                            priority=task_data.get("priority", "medium"),
-                            due_date=due_date,
-                            tags=task_data.get("tags", []),
-                            confidence=float(task_data.get("confidence", 0.5)),
-                            suggested_initiative_id=suggested_initiative_id,
-                            document_links=document_links,
-                        )
-                    )
-                except (KeyError, TypeError) as e:
-                    logger.warning(f"Failed to parse task data: {e}")
-                    continue
+    def _build_extraction_system_prompt(
+        self, initiatives: list[dict[str, Any]] | None = None
+    ) -> str:
+        """Build the system prompt for task extraction."""
+        # Build initiatives context if provided
+        initiatives_context = ""
+        if initiatives:
+            lines = "".join(
+                f"- ID {init.get('id')}: {init.get('title')} (priority: {init.get('priority', 'medium')})\n"
+                for init in initiatives
+            )
+            initiatives_context = (
+                "\nAvailable initiatives to link tasks to:\n"
+                f"{lines}"
+                "\nWhen a task is related to one of these initiatives, include suggested_initiative_id in your response.\n"
+            )
 
-            logger.info(f"Extracted {len(tasks)} tasks from {source}")
-            return tasks
+        return _format_extraction_system_prompt(datetime.now().date(), initiatives_context)
 
-        except LLMError:
-            raise
-        except Exception as e:
-            logger.error(f"Task extraction failed: {e}")
-            return []
+    def _build_extraction_messages(
+        self,
+        text: str,
+        source: str,
+        context: str | None,
+        initiatives: list[dict[str, Any]] | None,
+    ) -> list[dict[str, str]]:
+        """Build the chat messages for a single-text task extraction."""
+        text = _truncate_to_tokens(text, self.config.model, _MAX_EXTRACTION_INPUT_TOKENS)
+        user_prompt = f"""Source: {source}
+{f"Context: {context}" if context else ""}
+
+Text to analyze:
+{text}
+
+Extract all actionable tasks as JSON:"""
+
+        return [
+            {"role": "system", "content": self._build_extraction_system_prompt(initiatives)},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def _parse_extracted_tasks(self, tasks_data: Any) -> list[ExtractedTask]:
+        """Convert parsed JSON task data into ExtractedTask objects."""
+        # Structured-output responses wrap the array as {"tasks": [...]}
+        if isinstance(tasks_data, dict) and isinstance(tasks_data.get("tasks"), list):
+            tasks_data = tasks_data["tasks"]
+        if not isinstance(tasks_data, list):
+            tasks_data = [tasks_data] if tasks_data else []
+
+        tasks = []
+        for task_data in tasks_data:
+            try:
+                due_date = None
+                if task_data.get("due_date"):
+                    try:
+                        due_date = _parse_iso_datetime(task_data["due_date"])
+                    except (ValueError, TypeError):
+                        pass
+
+                suggested_initiative_id = None
+                if task_data.get("suggested_initiative_id"):
+                    try:
+                        suggested_initiative_id = int(task_data["suggested_initiative_id"])
+                    except (ValueError, TypeError):
+                        pass
+
+                # Extract document links
+                document_links = task_data.get("document_links")
+                if document_links and not isinstance(document_links, list):
+                    document_links = None
+
+                tasks.append(
+                    ExtractedTask(
+                        title=task_data.get("title", "Untitled Task")[:500],
+                        description=task_data.get("description"),
+                        priority=_coerce_priority(task_data.get("priority")),
+                        due_date=due_date,
+                        tags=task_data.get("tags", []),
+                        confidence=float(task_data.get("confidence", 0.5)),
+                        suggested_initiative_id=suggested_initiative_id,
+                        document_links=document_links,
+                    )
+                )
+            except (KeyError, TypeError, AttributeError) as e:
+                logger.warning("Failed to parse task data: %s", e)
+                continue
+
+        return tasks
 
     async def suggest_priority_updates(
         self,
@@ -333,6 +1220,8 @@ Consider:
 - Current workload balance
 - Task titles/descriptions for importance indicators
 
+Tasks are given as a pipe-separated table with the header id|priority|due|title; an empty due cell means no due date.
+
 Return a JSON array of suggestions. Only include tasks that should change priority.
 
 Output format:
@@ -340,10 +1229,12 @@ Output format:
 
 If no changes are needed, return an empty array []."""
 
-        tasks_summary = "\n".join(
-            f"- ID {t['id']}: [{t['priority']}] {t['title']}"
-            + (f" (due: {t['due_date']})" if t.get("due_date") else "")
-            for t in tasks[:20]  # Limit to 20 tasks to manage context
+        tasks_summary = _format_table(
+            ("id", "priority", "due", "title"),
+            [
+                (t["id"], t["priority"], t.get("due_date"), t["title"])
+                for t in tasks[:20]  # Limit to 20 tasks to manage context
+            ],
         )
 
         user_prompt = f"""Current tasks:
@@ -373,14 +1264,14 @@ Suggest priority changes as JSON:"""
                     suggestions.append(
                         PrioritySuggestion(
                             task_id=int(s["task_id"]),
-                            current_priority=s.get("current_priority", "medium"),
-                            suggested_priority=s.get("suggested_priority", "medium"),
+                            current_priority=_coerce_priority(s.get("current_priority")),
+                            suggested_priority=_coerce_priority(s.get("suggested_priority")),
                             reason=s.get("reason", ""),
                             confidence=float(s.get("confidence", 0.5)),
                         )
                     )
                 except (KeyError, TypeError, ValueError) as e:
-                    logger.warning(f"Failed to parse priority suggestion: {e}")
+                    logger.warning("Failed to parse priority suggestion: %s", e)
                     continue
 
             return suggestions
@@ -388,7 +1279,7 @@ Suggest priority changes as JSON:"""
         except LLMError:
             raise
         except Exception as e:
-            logger.error(f"Priority suggestion failed: {e}")
+            logger.error("Priority suggestion failed: %s", e)
             return []
 
     async def generate_recommendations(
@@ -396,6 +1287,7 @@ Suggest priority changes as JSON:"""
         tasks: list[dict[str, Any]],
         statistics: dict[str, Any] | None = None,
         initiatives: list[dict[str, Any]] | None = None,
+        categories: set[str] | frozenset[str] | None = None,
     ) -> list[ProductivityRecommendation]:
         """Generate productivity recommendations based on task state.
 
@@ -403,6 +1295,7 @@ Suggest priority changes as JSON:"""
             tasks: List of task dicts
             statistics: Optional task statistics dict
             initiatives: Optional list of initiative dicts with progress
+            categories: Only generate recommendations in these categories
 
         Returns:
             List of productivity recommendations
@@ -415,6 +1308,8 @@ Initiatives are longer-term projects that tasks roll up to. When providing recom
 - Initiatives that need more tasks or attention
 - Balance between different initiative priorities
 
+Top priority tasks are given as a pipe-separated table with a header row; empty cells mean the value is not set.
+
 Categories:
 - focus: Help user focus on what matters most
 - scheduling: Suggestions for better time management
@@ -433,48 +1328,64 @@ Output format:
   "actionable_steps": ["Block 2 hours tomorrow morning", "Start with the oldest task"]
 }]"""
 
-        # Build context
-        task_summary = f"Total tasks: {len(tasks)}\n"
+        # Build context as a list of parts joined once at the end
+        parts = [f"Total tasks: {len(tasks)}\n"]
 
         if statistics:
-            task_summary += f"""Active tasks: {statistics.get('active', 0)}
+            parts.append(f"""Active tasks: {statistics.get('active', 0)}
 Overdue: {statistics.get('overdue', 0)}
 Due today: {statistics.get('due_today', 0)}
 Due this week: {statistics.get('due_this_week', 0)}
 By priority: {statistics.get('by_priority', {})}
 By source: {statistics.get('by_source', {})}
-"""
+""")
 
         # Add initiatives section
         if initiatives:
             active_initiatives = [i for i in initiatives if i.get("status") == "active"]
             if active_initiatives:
-                task_summary += f"\nActive initiatives ({len(active_initiatives)}):\n"
+                parts.append(f"\nActive initiatives ({len(active_initiatives)}):\n")
                 for i in active_initiatives:
                     progress = i.get("progress", {})
                     progress_pct = progress.get("progress_percent", 0)
                     total = progress.get("total_tasks", 0)
-                    task_summary += f"- [{i.get('priority', 'medium')}] {i.get('title', 'Untitled')} - {progress_pct:.0f}% complete ({total} tasks)"
-                    if i.get("target_date"):
-                        task_summary += f" (target: {i['target_date'][:10]})"
-                    task_summary += "\n"
+                    target = f" (target: {i['target_date'][:10]})" if i.get("target_date") else ""
+                    parts.append(
+                        f"- [{i.get('priority', 'medium')}] {i.get('title', 'Untitled')}"
+                        f" - {progress_pct:.0f}% complete ({total} tasks){target}\n"
+                    )
 
         # Add top priority tasks
-        top_tasks = sorted(
-            [t for t in tasks if t.get("status") not in ["completed", "cancelled"]],
+        top_tasks = heapq.nlargest(
+            10,
+            (t for t in tasks if t.get("status") not in _CLOSED_STATUSES),
             key=lambda x: x.get("priority_score", 0),
-            reverse=True,
-        )[:10]
+        )
 
         if top_tasks:
-            task_summary += "\nTop priority tasks:\n"
-            for t in top_tasks:
-                task_summary += f"- [{t.get('priority', 'medium')}] {t.get('title', 'Untitled')}"
-                if t.get("due_date"):
-                    task_summary += f" (due: {t['due_date']})"
-                if t.get("initiative"):
-                    task_summary += f" [Initiative: {t['initiative']}]"
-                task_summary += "\n"
+            parts.append("\nTop priority tasks:\n")
+            parts.append(
+                _format_table(
+                    ("priority", "due", "initiative", "title"),
+                    [
+                        (
+                            t.get("priority", "medium"),
+                            t.get("due_date"),
+                            t.get("initiative"),
+                            t.get("title", "Untitled"),
+                        )
+                        for t in top_tasks
+                    ],
+                )
+            )
+            parts.append("\n")
+
+        if categories:
+            parts.append(
+                f"\nOnly give recommendations in these categories: {', '.join(sorted(categories))}\n"
+            )
+
+        task_summary = "".join(parts)
 
         user_prompt = f"""Task Analysis:
 {task_summary}
@@ -510,15 +1421,18 @@ Generate productivity recommendations as JSON:"""
                         )
                     )
                 except (KeyError, TypeError) as e:
-                    logger.warning(f"Failed to parse recommendation: {e}")
+                    logger.warning("Failed to parse recommendation: %s", e)
                     continue
 
+            if categories:
+                recommendations = [r for r in recommendations if r.category in categories]
+
             return recommendations
 
         except LLMError:
             raise
         except Exception as e:
-            logger.error(f"Recommendation generation failed: {e}")
+            logger.error("Recommendation generation failed: %s", e)
             return []
 
     async def analyze_calendar_for_optimization(
@@ -564,7 +1478,8 @@ Output format:
         else:
             context += "No calendar events provided.\n"
 
-        context += f"\nHigh priority tasks: {len([t for t in tasks if t.get('priority') in ['critical', 'high']])}"
+        high_priority_count = sum(1 for t in tasks if t.get("priority") in _HIGH_PRIORITIES)
+        context += f"\nHigh priority tasks: {high_priority_count}"
 
         user_prompt = f"""{context}
 
@@ -604,7 +1519,7 @@ Suggest calendar optimizations as JSON:"""
         except LLMError:
             raise
         except Exception as e:
-            logger.error(f"Calendar optimization failed: {e}")
+            logger.error("Calendar optimization failed: %s", e)
             return []
 
     async def parse_date(self, date_string: str) -> datetime | None:
@@ -616,30 +1531,38 @@ Suggest calendar optimizations as JSON:"""
         Returns:
             Parsed datetime or None if parsing fails.
         """
-        today = datetime.now()
-        today_str = today.strftime("%Y-%m-%d")
-        weekday = today.strftime("%A")
+        phrase = date_string.strip()
 
-        system_prompt = f"""You are a date parsing assistant. Convert natural language date expressions to ISO format datetime.
+        # Absolute ISO dates need no interpretation
+        try:
+            parsed = datetime.fromisoformat(phrase)
+            if len(phrase) == 10:  # Date only: use end of day
+                parsed = parsed.replace(hour=23, minute=59)
+            return parsed
+        except ValueError:
+            pass
 
-Today's date is {today_str} ({weekday}). The current time is {today.strftime("%H:%M")}.
+        today = datetime.now()
 
-Rules:
-- Return ONLY the datetime in ISO format: YYYY-MM-DDTHH:MM:SS
-- If no time is specified, use 23:59:00 (end of day)
-- For relative dates like "next Friday", calculate the actual date
-- For "end of month", use the last day of the current month
-- For "end of week", use Sunday
-- If the date is ambiguous or cannot be parsed, return "INVALID"
+        # Common relative phrases are simple arithmetic
+        resolved = _resolve_relative_date(phrase, today)
+        if resolved is not None:
+            return resolved
 
-Examples:
-- "tomorrow" -> {(today + timedelta(days=1)).strftime("%Y-%m-%d")}T23:59:00
-- "next Friday" -> [calculate the next Friday from today]
-- "in 3 days" -> {(today + timedelta(days=3)).strftime("%Y-%m-%d")}T23:59:00
-- "February 15th" -> 2026-02-15T23:59:00
-- "this Sunday at 5pm" -> [next Sunday]T17:00:00
+        today_str = today.strftime("%Y-%m-%d")
+        weekday = today.strftime("%A")
 
-Respond with ONLY the ISO datetime string, nothing else."""
+        cached = self._get_cached_date(phrase, today_str)
+        if cached is not None:
+            return cached
+
+        system_prompt = _DATE_PARSE_SYSTEM_PROMPT_TEMPLATE.format(
+            today_str=today_str,
+            weekday=weekday,
+            current_time=today.strftime("%H:%M"),
+            tomorrow=(today + timedelta(days=1)).strftime("%Y-%m-%d"),
+            in_three_days=(today + timedelta(days=3)).strftime("%Y-%m-%d"),
+        )
 
         user_prompt = f"Parse this date: {date_string}"
 
@@ -658,26 +1581,58 @@ Respond with ONLY the ISO datetime string, nothing else."""
 
             # Check for invalid response
             if date_str.upper() == "INVALID":
-                logger.warning(f"LLM could not parse date: {date_string}")
+                logger.warning("LLM could not parse date: %s", date_string)
                 return None
 
             # Parse the ISO format datetime
             try:
-                # Handle various ISO formats
-                date_str = date_str.replace("Z", "")
-                parsed = datetime.fromisoformat(date_str)
-                logger.info(f"Parsed '{date_string}' -> {parsed}")
+                parsed = _parse_iso_datetime(date_str)
+                logger.info("Parsed '%s' -> %s", date_string, parsed)
+                self._store_cached_date(phrase, today_str, parsed)
                 return parsed
             except ValueError as e:
-                logger.warning(f"Failed to parse LLM date response '{date_str}': {e}")
+                logger.warning("Failed to parse LLM date response '%s': %s", date_str, e)
                 return None
 
         except LLMError:
             raise
         except Exception as e:
-            logger.error(f"Date parsing failed: {e}")
+            logger.error("Date parsing failed: %s", e)
             return None
 
+    def _load_date_cache(self, today_str: str) -> dict[str, str]:
+        """Load today's phrase -> ISO datetime mappings from the date cache file."""
+        try:
+            if self._date_cache_path.exists():
+                data = json.loads(self._date_cache_path.read_text())
+                if data.get("date") == today_str:
+                    return data.get("entries", {})
+        except Exception as e:
+            logger.warning("Failed to load date cache: %s", e)
+        return {}
+
+    def _get_cached_date(self, phrase: str, today_str: str) -> datetime | None:
+        """Return a previously LLM-parsed date for phrase, if parsed today."""
+        iso = self._load_date_cache(today_str).get(phrase.lower())
+        if iso is None:
+            return None
+        try:
+            return datetime.fromisoformat(iso)
+        except ValueError:
+            return None
+
+    def _store_cached_date(self, phrase: str, today_str: str, parsed: datetime) -> None:
+        """Persist an LLM-parsed date; entries from previous days are dropped."""
+        entries = self._load_date_cache(today_str)
+        entries[phrase.lower()] = parsed.isoformat()
+        try:
+            self._date_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._date_cache_path.write_text(
+                json.dumps({"date": today_str, "entries": entries}, indent=2)
+            )
+        except Exception as e:
+            logger.warning("Failed to save date cache: %s", e)
+
     async def merge_titles(self, titles: list[str]) -> str:
         """Merge multiple task titles into a single unified title.
 
@@ -729,44 +1684,153 @@ Merged title:"""
             if merged.startswith("'") and merged.endswith("'"):
                 merged = merged[1:-1]
 
-            logger.info(f"Merged {len(titles)} titles into: {merged}")
+            logger.info("Merged %s titles into: %s", len(titles), merged)
             return merged
 
         except LLMError:
             raise
         except Exception as e:
-            logger.error(f"Title merge failed: {e}")
+            logger.error("Title merge failed: %s", e)
             # Fallback: return first title
             return titles[0]
 
     def _parse_json_response(self, content: str) -> Any:
         """Parse JSON from LLM response, handling markdown code blocks.
 
+        Decoding starts at the first ``[`` or ``{``, so code fences and any
+        prose around the JSON are skipped without rebuilding the string.
+
         Args:
             content: Raw LLM response content
 
         Returns:
             Parsed JSON data
         """
-        # Strip markdown code blocks if present
-        content = content.strip()
-        if content.startswith("```"):
-            lines = content.split("\n")
-            # Remove first line (```json or ```)
-            lines = lines[1:]
-            # Remove last line (```)
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            content = "\n".join(lines)
+        starts = [i for i in (content.find("["), content.find("{")) if i != -1]
+        if not starts:
+            logger.warning("Failed to parse JSON response: no JSON value found")
+            logger.debug("Raw content: %s", content)
+            return []
 
+        start = min(starts)
         try:
-            return json.loads(content)
+            data, _ = _JSON_DECODER.raw_decode(content, start)
+            return data
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Raw content: {content}")
+            error = e
+
+        # Near misses (trailing commas, Python literals, truncated output) are
+        # cheaper to fix locally than to re-request
+        try:
+            data = json.loads(_repair_json(content[start:]))
+            logger.debug("Repaired malformed JSON response")
+            return data
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse JSON response: %s", error)
+            logger.debug("Raw content: %s", content)
             return []
 
 
+# Most recently created service and the config it was built from; reused so
+# services built per request share one HTTP pool and response cache
+_shared_service: tuple[LLMConfig, LLMService] | None = None
+_shared_service_lock = threading.Lock()
+
+
+def get_shared_llm_service(config: LLMConfig) -> LLMService:
+    """Get an LLM service for a config, reusing the last one built for it.
+
+    Repeated calls with the same config object return the same service.
+    Callers that need an HTTP log callback should build their own instance.
+
+    Args:
+        config: LLM configuration
+
+    Returns:
+        LLMService instance
+    """
+    global _shared_service
+
+    with _shared_service_lock:
+        # Compare by identity: configs are unhashable pydantic models
+        if _shared_service is None or _shared_service[0] is not config:
+            _shared_service = (config, LLMService(config))
+        return _shared_service[1]
+
+
+def _repair_json(text: str) -> str:
+    """Best-effort repair of almost-valid JSON produced by an LLM.
+
+    Fixes smart quotes, Python ``True``/``False``/``None`` literals, trailing
+    commas and output truncated mid-string or mid-container. Text after the
+    first complete top-level value is dropped.
+
+    Args:
+        text: Candidate JSON starting at its opening bracket
+
+    Returns:
+        Repaired JSON text (which may still be invalid)
+    """
+    text = text.translate(_SMART_QUOTES)
+    out: list[str] = []
+    closers: list[str] = []
+    in_string = False
+    escaped = False
+    i = 0
+
+    while i < len(text):
+        ch = text[i]
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+            out.append(ch)
+        elif ch in "[{":
+            closers.append("]" if ch == "[" else "}")
+            out.append(ch)
+        elif ch in "]}":
+            _strip_trailing_comma(out)
+            if closers:
+                closers.pop()
+            out.append(ch)
+            if not closers:
+                break
+        elif ch.isalpha():
+            end = i
+            while end < len(text) and (text[end].isalnum() or text[end] == "_"):
+                end += 1
+            word = text[i:end]
+            out.append(_PYTHON_LITERALS.get(word, word))
+            i = end
+            continue
+        else:
+            out.append(ch)
+        i += 1
+
+    # Close whatever the truncated output left open
+    if in_string:
+        out.append('"')
+    _strip_trailing_comma(out)
+    if out and out[-1] == ":":
+        out.append("null")
+    out.extend(reversed(closers))
+    return "".join(out)
+
+
+def _strip_trailing_comma(out: list[str]) -> None:
+    """Drop trailing whitespace and a dangling comma from a repair buffer."""
+    while out and out[-1].isspace():
+        out.pop()
+    if out and out[-1] == ",":
+        out.pop()
+
+
 class LLMError(Exception):
     """Exception raised for LLM service errors."""
 
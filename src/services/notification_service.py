@@ -3,11 +3,18 @@
 Supports native macOS notifications via osascript and fallback terminal alerts.
 """
 
+import atexit
 import logging
+import os
+import queue
+import re
+import select
+import shutil
 import subprocess
 import sys
+import threading
+import time
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
@@ -16,9 +23,16 @@ from sqlalchemy.orm import Session
 from src.models.task import Task, TaskStatus
 from src.services.task_service import TaskService
 from src.utils.config import NotificationConfig
+from src.utils.dates import naive_utcnow
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for osascript to deliver a notification
+_OSASCRIPT_TIMEOUT = 5
+
+# How osascript reports a failed statement, e.g. "execution error: ... (-1708)"
+_OSASCRIPT_ERROR_RE = re.compile(rb"(?:syntax|execution) error[^\n]*")
+
 
 class NotificationType(str, Enum):
     """Types of notifications."""
@@ -32,6 +46,22 @@ class NotificationType(str, Enum):
     TASK_CREATED = "task_created"
 
 
+# ANSI colors for terminal notifications, by notification type
+_COLORS = {
+    NotificationType.INFO: "\033[94m",  # Blue
+    NotificationType.WARNING: "\033[93m",  # Yellow
+    NotificationType.URGENT: "\033[91m",  # Red
+    NotificationType.REMINDER: "\033[95m",  # Magenta
+    NotificationType.TASK_DUE: "\033[93m",  # Yellow
+    NotificationType.TASK_OVERDUE: "\033[91m",  # Red
+    NotificationType.TASK_CREATED: "\033[92m",  # Green
+}
+
+_BANNER_RULE = "═" * 50
+
+_IS_MACOS = sys.platform == "darwin"
+
+
 @dataclass
 class Notification:
     """A notification to be sent."""
@@ -54,10 +84,42 @@ class NotificationService:
             config: Notification configuration
         """
         self.config = config
-        self._is_macos = sys.platform == "darwin"
+
+        # terminal-notifier skips AppleScript compilation, so prefer it when installed
+        self._notifier = shutil.which("terminal-notifier") if _IS_MACOS else None
+
+        # Long-lived interactive osascript, started on first macOS notification
+        self._osa_proc: subprocess.Popen | None = None
+        self._osa_lock = threading.Lock()
+        self._osa_seq = 0
+
+        # Notifications queued by send() and delivered by a background worker
+        self._queue: queue.Queue[Notification] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
 
     def send(self, notification: Notification) -> bool:
-        """Send a notification.
+        """Queue a notification for delivery by the background worker.
+
+        Returns immediately; delivery failures are logged by the worker.
+        Use send_sync when the delivery result is needed.
+
+        Args:
+            notification: The notification to send
+
+        Returns:
+            True if notification was queued, False if notifications are disabled
+        """
+        if not self.config.enabled:
+            logger.debug("Notifications disabled, skipping")
+            return False
+
+        self._ensure_worker()
+        self._queue.put_nowait(notification)
+        return True
+
+    def send_sync(self, notification: Notification) -> bool:
+        """Send a notification, blocking until it is delivered.
 
         Args:
             notification: The notification to send
@@ -72,17 +134,41 @@ class NotificationService:
         # Determine sound setting
         play_sound = notification.sound and self.config.sound
 
-        if self._is_macos:
+        if _IS_MACOS:
             return self._send_macos_notification(notification, play_sound)
         else:
             return self._send_terminal_notification(notification)
 
+    def flush(self) -> None:
+        """Block until every queued notification has been delivered."""
+        self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        """Start the delivery worker thread if it isn't running."""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._drain, name="notification-sender", daemon=True
+                )
+                self._worker.start()
+
+    def _drain(self) -> None:
+        """Deliver queued notifications one at a time."""
+        while True:
+            notification = self._queue.get()
+            try:
+                self.send_sync(notification)
+            except Exception as e:
+                logger.error(f"Failed to deliver notification: {e}")
+            finally:
+                self._queue.task_done()
+
     def _send_macos_notification(
         self,
         notification: Notification,
         play_sound: bool,
     ) -> bool:
-        """Send a macOS notification using osascript.
+        """Send a macOS notification using terminal-notifier or osascript.
 
         Args:
             notification: The notification to send
@@ -91,6 +177,9 @@ class NotificationService:
         Returns:
             True if successful
         """
+        if self._notifier:
+            return self._send_with_terminal_notifier(notification, play_sound)
+
         try:
             # Build AppleScript command
             script_parts = [
@@ -108,16 +197,20 @@ class NotificationService:
 
             script = " ".join(script_parts)
 
-            # Execute via osascript
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            # Prefer the shared helper; spawn a one-off osascript if it is unavailable
+            sent = self._run_in_osascript_helper(script)
+            if sent is None:
+                result = subprocess.run(
+                    ["osascript", "-e", script],
+                    capture_output=True,
+                    text=True,
+                    timeout=_OSASCRIPT_TIMEOUT,
+                )
 
-            if result.returncode != 0:
-                logger.error(f"osascript failed: {result.stderr}")
+                if result.returncode != 0:
+                    logger.error(f"osascript failed: {result.stderr}")
+                    return False
+            elif not sent:
                 return False
 
             logger.debug(f"Sent macOS notification: {notification.title}")
@@ -130,6 +223,142 @@ class NotificationService:
             logger.error(f"Failed to send macOS notification: {e}")
             return False
 
+    def _send_with_terminal_notifier(
+        self,
+        notification: Notification,
+        play_sound: bool,
+    ) -> bool:
+        """Send a macOS notification using the terminal-notifier binary.
+
+        Arguments are passed directly, so no AppleScript escaping is needed.
+
+        Args:
+            notification: The notification to send
+            play_sound: Whether to play a sound
+
+        Returns:
+            True if successful
+        """
+        args = [self._notifier, "-title", notification.title, "-message", notification.message]
+        if notification.subtitle:
+            args += ["-subtitle", notification.subtitle]
+        if play_sound:
+            args += ["-sound", "default"]
+        if notification.url:
+            args += ["-open", notification.url]
+
+        try:
+            result = subprocess.run(
+                args,
+                capture_output=True,
+                text=True,
+                timeout=_OSASCRIPT_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired:
+            logger.error("Notification timed out")
+            return False
+        except OSError as e:
+            logger.error(f"Failed to run terminal-notifier: {e}")
+            return False
+
+        if result.returncode != 0:
+            logger.error(f"terminal-notifier failed: {result.stderr}")
+            return False
+
+        logger.debug(f"Sent macOS notification: {notification.title}")
+        return True
+
+    def _run_in_osascript_helper(self, script: str) -> bool | None:
+        """Run an AppleScript statement in the long-lived osascript process.
+
+        Spawning osascript per notification costs a fork/exec plus LaunchServices
+        registration each time, so one interactive process is kept and fed
+        statements over stdin. Each statement is followed by a unique marker
+        string whose echo confirms the statement has been evaluated. stderr is
+        merged into stdout so an AppleScript error printed before the marker
+        is reported instead of lost.
+
+        Args:
+            script: AppleScript statement to evaluate (a single line)
+
+        Returns:
+            True if evaluated, False on error or timeout, None if the helper is
+            unavailable
+        """
+        with self._osa_lock:
+            proc = self._get_osascript_helper()
+            if proc is None:
+                return None
+
+            self._osa_seq += 1
+            marker = f"pa-ok-{self._osa_seq}"
+            try:
+                proc.stdin.write(f'{script}\n"{marker}"\n'.encode())
+                proc.stdin.flush()
+            except OSError:
+                self._stop_osascript_helper()
+                return None
+
+            fd = proc.stdout.fileno()
+            expected = marker.encode()
+            output = b""
+            deadline = time.monotonic() + _OSASCRIPT_TIMEOUT
+            while expected not in output:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                    logger.error("Notification timed out")
+                    self._stop_osascript_helper()
+                    return False
+                chunk = os.read(fd, 4096)
+                if not chunk:  # Helper exited
+                    self._stop_osascript_helper()
+                    return None
+                output += chunk
+
+            error = _OSASCRIPT_ERROR_RE.search(output, 0, output.index(expected))
+            if error:
+                logger.error(f"osascript failed: {error.group().decode(errors='replace')}")
+                return False
+            return True
+
+    def _get_osascript_helper(self) -> subprocess.Popen | None:
+        """Return the running osascript helper, starting it if needed."""
+        if self._osa_proc is not None and self._osa_proc.poll() is None:
+            return self._osa_proc
+
+        try:
+            self._osa_proc = subprocess.Popen(
+                ["osascript", "-i"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        except OSError as e:
+            logger.warning(f"Could not start osascript helper: {e}")
+            self._osa_proc = None
+            return None
+
+        atexit.register(self.close)
+        return self._osa_proc
+
+    def _stop_osascript_helper(self) -> None:
+        """Terminate the osascript helper, if running."""
+        proc, self._osa_proc = self._osa_proc, None
+        if proc is None:
+            return
+        atexit.unregister(self.close)
+        try:
+            proc.stdin.close()  # EOF ends the interactive session
+            proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+    def close(self) -> None:
+        """Release the osascript helper process."""
+        with self._osa_lock:
+            self._stop_osascript_helper()
+
     def _send_terminal_notification(self, notification: Notification) -> bool:
         """Send a terminal notification (fallback for non-macOS).
 
@@ -139,44 +368,44 @@ class NotificationService:
         Returns:
             True (always succeeds for terminal output)
         """
-        # Use ANSI colors for different notification types
-        colors = {
-            NotificationType.INFO: "\033[94m",  # Blue
-            NotificationType.WARNING: "\033[93m",  # Yellow
-            NotificationType.URGENT: "\033[91m",  # Red
-            NotificationType.REMINDER: "\033[95m",  # Magenta
-            NotificationType.TASK_DUE: "\033[93m",  # Yellow
-            NotificationType.TASK_OVERDUE: "\033[91m",  # Red
-            NotificationType.TASK_CREATED: "\033[92m",  # Green
-        }
         reset = "\033[0m"
-        color = colors.get(notification.type, "\033[0m")
+        color = _COLORS.get(notification.type, reset)
 
-        # Print notification
-        print(f"\n{color}╔{'═' * 50}╗{reset}")
-        print(f"{color}║ 🔔 {notification.title}{reset}")
+        lines = [f"\n{color}╔{_BANNER_RULE}╗{reset}", f"{color}║ 🔔 {notification.title}{reset}"]
         if notification.subtitle:
-            print(f"{color}║    {notification.subtitle}{reset}")
-        print(f"{color}║{reset}")
-        print(f"{color}║ {notification.message}{reset}")
-        print(f"{color}╚{'═' * 50}╝{reset}\n")
+            lines.append(f"{color}║    {notification.subtitle}{reset}")
+        lines.append(f"{color}║{reset}")
+        lines.append(f"{color}║ {notification.message}{reset}")
+        lines.append(f"{color}╚{_BANNER_RULE}╝{reset}\n\n")
 
         # Ring terminal bell if sound enabled
         if notification.sound and self.config.sound:
-            print("\a", end="", flush=True)
+            lines[-1] += "\a"
+
+        # Write the whole banner at once
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
         return True
 
     def _escape_applescript(self, text: str) -> str:
         """Escape text for AppleScript.
 
+        Line breaks become escape sequences so the statement stays on one line,
+        as the interactive osascript helper reads one statement per line.
+
         Args:
             text: Text to escape
 
         Returns:
             Escaped text safe for AppleScript
         """
-        return text.replace("\\", "\\\\").replace('"', '\\"')
+        return (
+            text.replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
 
     def notify_task_due_soon(self, task: Task) -> bool:
         """Send notification for a task due soon.
@@ -187,12 +416,12 @@ class NotificationService:
         Returns:
             True if notification sent
         """
-        if not self.config.on_due_soon:
+        if not (self.config.enabled and self.config.on_due_soon):
             return False
 
         hours_until_due = 0
         if task.due_date:
-            now = datetime.now(UTC).replace(tzinfo=None)
+            now = naive_utcnow()
             hours_until_due = (task.due_date - now).total_seconds() / 3600
 
         notification = Notification(
@@ -212,7 +441,7 @@ class NotificationService:
         Returns:
             True if notification sent
         """
-        if not self.config.on_overdue:
+        if not (self.config.enabled and self.config.on_overdue):
             return False
 
         notification = Notification(
@@ -233,7 +462,7 @@ class NotificationService:
         Returns:
             True if notification sent
         """
-        if not self.config.on_task_created:
+        if not (self.config.enabled and self.config.on_task_created):
             return False
 
         notification = Notification(
@@ -255,6 +484,9 @@ class NotificationService:
         Returns:
             True if notification sent
         """
+        if not self.config.enabled:
+            return False
+
         notification = Notification(
             title=title,
             message=message,
@@ -273,6 +505,9 @@ class NotificationService:
         Returns:
             True if notification sent
         """
+        if not self.config.enabled:
+            return False
+
         notification = Notification(
             title=f"⚠️ {title}",
             message=message,
@@ -290,6 +525,9 @@ class NotificationService:
         Returns:
             True if notification sent
         """
+        if not self.config.enabled:
+            return False
+
         notification = Notification(
             title=f"🚨 {title}",
             message=message,
@@ -300,49 +538,102 @@ class NotificationService:
     def check_and_notify_due_tasks(self, db: Session) -> int:
         """Check for due/overdue tasks and send notifications.
 
+        When more than one task qualifies, a single digest notification is sent
+        instead of one notification per task.
+
         Args:
             db: Database session
 
         Returns:
             Number of notifications sent
         """
+        if not self.config.enabled:
+            return 0
+
         task_service = TaskService(db)
-        notifications_sent = 0
 
-        # Check overdue tasks
+        overdue: list[Task] = []
         if self.config.on_overdue:
             overdue = task_service.get_overdue_tasks()
-            for task in overdue[:5]:  # Limit to avoid notification spam
-                if self.notify_task_overdue(task):
-                    notifications_sent += 1
 
-        # Check tasks due soon
+        due_soon: list[Task] = []
         if self.config.on_due_soon:
             # Get tasks due within configured hours
             hours = self.config.due_soon_hours
-            due_soon = task_service.get_due_soon_tasks(days=0)
+            now = naive_utcnow()
+            due_soon = [
+                task
+                for task in task_service.get_due_soon_tasks(days=0)
+                if task.due_date and 0 < (task.due_date - now).total_seconds() / 3600 <= hours
+            ]
 
-            now = datetime.now(UTC).replace(tzinfo=None)
-            for task in due_soon:
-                if task.due_date:
-                    hours_until = (task.due_date - now).total_seconds() / 3600
-                    if 0 < hours_until <= hours:
-                        if self.notify_task_due_soon(task):
-                            notifications_sent += 1
+        if len(overdue) + len(due_soon) > 1:
+            return 1 if self._notify_task_digest(overdue, due_soon) else 0
 
-        return notifications_sent
+        if overdue:
+            return 1 if self.notify_task_overdue(overdue[0]) else 0
+        if due_soon:
+            return 1 if self.notify_task_due_soon(due_soon[0]) else 0
+        return 0
+
+    def _notify_task_digest(self, overdue: list[Task], due_soon: list[Task]) -> bool:
+        """Send one notification summarizing several overdue and due-soon tasks.
+
+        Args:
+            overdue: Overdue tasks, most overdue first
+            due_soon: Tasks due soon
+
+        Returns:
+            True if notification sent
+        """
+        counts = []
+        if overdue:
+            counts.append(f"{len(overdue)} overdue")
+        if due_soon:
+            counts.append(f"{len(due_soon)} due soon")
+
+        # Limit listed titles to keep the notification readable
+        titles = [task.title[:100] for task in (overdue + due_soon)[:5]]
+
+        notification = Notification(
+            title="Task Digest",
+            message="\n".join(titles),
+            subtitle=", ".join(counts),
+            type=NotificationType.TASK_OVERDUE if overdue else NotificationType.TASK_DUE,
+        )
+        return self.send(notification)
+
+
+# Most recently created service and the config it was built from; reused so a
+# process shares one delivery worker and osascript helper
+_shared_service: tuple[NotificationConfig, NotificationService] | None = None
+_shared_service_lock = threading.Lock()
 
 
 def create_notification_service(config: NotificationConfig | None = None) -> NotificationService:
     """Create a notification service with config.
 
+    Repeated calls with the same config object return the same service; a new
+    config replaces it and shuts down the previous service's osascript helper.
+
     Args:
         config: Optional notification config (uses default if not provided)
 
     Returns:
         NotificationService instance
     """
+    global _shared_service
+
     if config is None:
         from src.utils.config import get_config
         config = get_config().notifications
-    return NotificationService(config)
+
+    with _shared_service_lock:
+        # Compare by identity: configs are unhashable pydantic models
+        if _shared_service is None or _shared_service[0] is not config:
+            previous = _shared_service
+            _shared_service = (config, NotificationService(config))
+            if previous is not None:
+                # The replaced service is unreachable now; don't leave its osascript running
+                previous[1].close()
+        return _shared_service[1]
@@ -1,16 +1,21 @@
 """Service for managing pending task suggestions."""
 
 import logging
-from datetime import datetime, UTC
+from datetime import datetime
 from typing import Any
 
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from src.integrations.base import IntegrationType
 from src.models.pending_suggestion import PendingSuggestionModel, SuggestionStatus
+from src.utils.dates import naive_utcnow
 
 logger = logging.getLogger(__name__)
 
+# Rows removed per DELETE in cleanup_old_suggestions, bounding each write lock
+_CLEANUP_BATCH_SIZE = 500
+
 
 class PendingSuggestionService:
     """Service for CRUD operations on pending suggestions."""
@@ -22,6 +27,8 @@ class PendingSuggestionService:
             db: Database session
         """
         self.db = db
+        # Pending suggestions from the last fetch; cleared by every mutation
+        self._pending_cache: list[PendingSuggestionModel] | None = None
 
     def create_suggestion(
         self,
@@ -79,22 +86,59 @@ class PendingSuggestionService:
         self.db.add(suggestion)
         self.db.commit()
         self.db.refresh(suggestion)
+        self._pending_cache = None
 
         logger.info(f"Created pending suggestion: {title[:50]}")
         return suggestion
 
+    def create_suggestions_bulk(
+        self, items: list[dict[str, Any]]
+    ) -> list[PendingSuggestionModel]:
+        """Create several pending suggestions with a single commit.
+
+        Args:
+            items: Dicts of create_suggestion keyword arguments (title required)
+
+        Returns:
+            Created suggestion models, in the same order as items
+        """
+        suggestions = []
+        for item in items:
+            item = dict(item)
+            tags = item.pop("tags", None)
+            source = item.pop("source", None)
+            suggestion = PendingSuggestionModel(
+                **item,
+                source=source.value if isinstance(source, IntegrationType) else source,
+                status=SuggestionStatus.PENDING,
+            )
+            suggestion.set_tags_list(tags)
+            suggestions.append(suggestion)
+
+        if not suggestions:
+            return []
+
+        self.db.bulk_save_objects(suggestions, return_defaults=True)
+        self.db.commit()
+        self._pending_cache = None
+
+        logger.info(f"Created {len(suggestions)} pending suggestions")
+        return suggestions
+
     def get_pending_suggestions(self) -> list[PendingSuggestionModel]:
         """Get all pending (unresolved) suggestions.
 
         Returns:
             List of pending suggestions ordered by creation date (oldest first)
         """
-        return (
-            self.db.query(PendingSuggestionModel)
-            .filter(PendingSuggestionModel.status == SuggestionStatus.PENDING)
-            .order_by(PendingSuggestionModel.created_at.asc())
-            .all()
-        )
+        if self._pending_cache is None:
+            self._pending_cache = (
+                self.db.query(PendingSuggestionModel)
+                .filter(PendingSuggestionModel.status == SuggestionStatus.PENDING)
+                .order_by(PendingSuggestionModel.created_at.asc())
+                .all()
+            )
+        return list(self._pending_cache)
 
     def get_suggestion_by_id(self, suggestion_id: int) -> PendingSuggestionModel | None:
         """Get a suggestion by ID.
@@ -118,10 +162,18 @@ class PendingSuggestionService:
         Returns:
             Suggestion model or None if index out of range
         """
-        suggestions = self.get_pending_suggestions()
-        if 0 <= index < len(suggestions):
-            return suggestions[index]
-        return None
+        if index < 0:
+            return None
+        if self._pending_cache is not None:
+            return self._pending_cache[index] if index < len(self._pending_cache) else None
+        return (
+            self.db.query(PendingSuggestionModel)
+            .filter(PendingSuggestionModel.status == SuggestionStatus.PENDING)
+            .order_by(PendingSuggestionModel.created_at.asc())
+            .offset(index)
+            .limit(1)
+            .first()
+        )
 
     def approve_suggestion(
         self,
@@ -142,10 +194,11 @@ class PendingSuggestionService:
             return False
 
         suggestion.status = SuggestionStatus.APPROVED
-        suggestion.resolved_at = datetime.now(UTC).replace(tzinfo=None)
+        suggestion.resolved_at = naive_utcnow()
         suggestion.created_task_id = created_task_id
 
         self.db.commit()
+        self._pending_cache = None
         logger.info(f"Approved suggestion {suggestion_id}, created task {created_task_id}")
         return True
 
@@ -163,9 +216,10 @@ class PendingSuggestionService:
             return False
 
         suggestion.status = SuggestionStatus.REJECTED
-        suggestion.resolved_at = datetime.now(UTC).replace(tzinfo=None)
+        suggestion.resolved_at = naive_utcnow()
 
         self.db.commit()
+        self._pending_cache = None
         logger.info(f"Rejected suggestion {suggestion_id}")
         return True
 
@@ -181,6 +235,7 @@ class PendingSuggestionService:
             .delete(synchronize_session=False)
         )
         self.db.commit()
+        self._pending_cache = None
         logger.info(f"Cleared {count} pending suggestions")
         return count
 
@@ -190,12 +245,36 @@ class PendingSuggestionService:
         Returns:
             Number of pending suggestions
         """
+        if self._pending_cache is not None:
+            return len(self._pending_cache)
         return (
             self.db.query(PendingSuggestionModel)
             .filter(PendingSuggestionModel.status == SuggestionStatus.PENDING)
             .count()
         )
 
+    def has_at_least(self, n: int) -> bool:
+        """Check whether at least n suggestions are pending.
+
+        Stops scanning after n rows instead of counting every pending suggestion.
+
+        Args:
+            n: Minimum number of pending suggestions
+
+        Returns:
+            True if n or more suggestions are pending
+        """
+        if n <= 0:
+            return True
+        if self._pending_cache is not None:
+            return len(self._pending_cache) >= n
+        return (
+            self.db.query(PendingSuggestionModel.id)
+            .filter(PendingSuggestionModel.status == SuggestionStatus.PENDING)
+            .limit(n)
+            .count()
+        ) >= n
+
     def cleanup_old_suggestions(self, days: int = 30) -> int:
         """Delete resolved suggestions older than specified days.
 
@@ -207,16 +286,30 @@ class PendingSuggestionService:
         """
         from datetime import timedelta
 
-        cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days)
+        cutoff = naive_utcnow() - timedelta(days=days)
 
-        count = (
-            self.db.query(PendingSuggestionModel)
-            .filter(PendingSuggestionModel.status != SuggestionStatus.PENDING)
-            .filter(PendingSuggestionModel.resolved_at < cutoff)
-            .delete(synchronize_session=False)
+        batch_ids = (
+            select(PendingSuggestionModel.id)
+            .where(PendingSuggestionModel.status != SuggestionStatus.PENDING)
+            .where(PendingSuggestionModel.resolved_at < cutoff)
+            .limit(_CLEANUP_BATCH_SIZE)
+        )
+        stmt = (
+            delete(PendingSuggestionModel)
+            .where(PendingSuggestionModel.id.in_(batch_ids))
+            .execution_options(synchronize_session=False)
         )
 
-        self.db.commit()
+        # Delete in small batches, committing between them, so the write lock
+        # is held briefly instead of for one long scan
+        count = 0
+        while True:
+            deleted = self.db.execute(stmt).rowcount
+            self.db.commit()
+            count += deleted
+            if deleted < _CLEANUP_BATCH_SIZE:
+                break
+
         logger.info(f"Cleaned up {count} old suggestions")
         return count
 
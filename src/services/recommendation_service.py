@@ -5,6 +5,8 @@ without requiring direct access to the agent or LLM service.
 """
 
 import logging
+import re
+import time
 from dataclasses import asdict
 from datetime import UTC, datetime
 from typing import Any
@@ -14,9 +16,17 @@ from sqlalchemy.orm import Session
 from src.services.llm_service import LLMService, ProductivityRecommendation
 from src.services.task_service import TaskService
 from src.utils.config import LLMConfig
+from src.utils.dates import naive_utcnow
 
 logger = logging.getLogger(__name__)
 
+# Title keywords suggesting a quick task; "review" only counts when the title
+# doesn't mention a document
+_QUICK_WIN_TITLE_RE = re.compile(
+    r"reply|respond|approve|confirm|^(?!.*document).*?review", re.IGNORECASE | re.DOTALL
+)
+_QUICK_WIN_TAGS = frozenset({"quick", "easy"})
+
 
 class RecommendationService:
     """Service for generating and managing productivity recommendations."""
@@ -31,81 +41,115 @@ class RecommendationService:
         self.db = db
         self.llm_service = LLMService(llm_config)
         self.task_service = TaskService(db)
-        self._cached_recommendations: list[ProductivityRecommendation] = []
-        self._cache_timestamp: datetime | None = None
+        # Recommendations per requested category set (None = all categories),
+        # with the time.monotonic() used for the TTL check and the wall-clock
+        # time they were generated at, for display
+        self._cache: dict[
+            frozenset[str] | None,
+            tuple[float, datetime, tuple[ProductivityRecommendation, ...]],
+        ] = {}
+        # Task dicts from the last generation, keyed by (id, updated_at) per task
+        self._task_dicts_key: tuple[tuple[int, datetime], ...] | None = None
+        self._task_dicts: list[dict[str, Any]] = []
 
     async def generate_recommendations(
         self,
         force_refresh: bool = False,
         cache_minutes: int = 30,
+        categories: set[str] | None = None,
     ) -> list[ProductivityRecommendation]:
         """Generate productivity recommendations.
 
         Args:
             force_refresh: Force regeneration even if cache is valid
             cache_minutes: Cache duration in minutes
+            categories: Only generate recommendations in these categories
+                (all categories if None); each set is cached separately
 
         Returns:
             List of productivity recommendations
         """
+        cache_key = frozenset(categories) if categories else None
+
         # Check cache
-        if not force_refresh and self._is_cache_valid(cache_minutes):
-            return self._cached_recommendations
+        if not force_refresh and self._is_cache_valid(cache_minutes, cache_key):
+            return list(self._cache[cache_key][2])
 
         # Get task data
         tasks, _ = self.task_service.get_tasks(include_completed=False, limit=50)
         statistics = self.task_service.get_statistics()
 
-        # Convert to dicts
-        task_dicts = [
-            {
-                "id": t.id,
-                "title": t.title,
-                "description": t.description,
-                "status": t.status.value,
-                "priority": t.priority.value,
-                "priority_score": t.priority_score,
-                "due_date": t.due_date.isoformat() if t.due_date else None,
-                "source": t.source.value,
-                "tags": t.get_tags_list(),
-            }
-            for t in tasks
-        ]
+        # Convert to dicts, reusing the previous conversion if no task changed
+        tasks_key = tuple((t.id, t.updated_at) for t in tasks)
+        if tasks_key != self._task_dicts_key:
+            self._task_dicts = [
+                {
+                    "id": t.id,
+                    "title": t.title,
+                    "description": t.description,
+                    "status": t.status.value,
+                    "priority": t.priority.value,
+                    "priority_score": t.priority_score,
+                    "due_date": t.due_date.isoformat() if t.due_date else None,
+                    "source": t.source.value,
+                    "tags": t.get_tags_list(),
+                }
+                for t in tasks
+            ]
+            self._task_dicts_key = tasks_key
+        task_dicts = self._task_dicts
 
         # Generate recommendations
         recommendations = await self.llm_service.generate_recommendations(
             tasks=task_dicts,
             statistics=statistics,
+            categories=cache_key,
         )
 
         # Update cache
-        self._cached_recommendations = recommendations
-        self._cache_timestamp = datetime.now(UTC)
+        self._cache[cache_key] = (time.monotonic(), naive_utcnow(), tuple(recommendations))
 
         return recommendations
 
-    def _is_cache_valid(self, cache_minutes: int) -> bool:
+    def _is_cache_valid(
+        self, cache_minutes: int, cache_key: frozenset[str] | None = None
+    ) -> bool:
         """Check if cached recommendations are still valid.
 
         Args:
             cache_minutes: Cache duration in minutes
+            cache_key: Category set the recommendations were generated for
 
         Returns:
             True if cache is valid
         """
-        if not self._cache_timestamp or not self._cached_recommendations:
+        entry = self._cache.get(cache_key)
+        if entry is None or not entry[2]:
             return False
 
-        age = (datetime.now(UTC) - self._cache_timestamp).total_seconds() / 60
-        return age < cache_minutes
+        return time.monotonic() - entry[0] < cache_minutes * 60
+
+    def get_generated_at(self, cache_key: frozenset[str] | None = None) -> datetime | None:
+        """Get when the cached recommendations for a category set were generated.
+
+        Args:
+            cache_key: Category set the recommendations were generated for
+                (None for all categories)
+
+        Returns:
+            Generation time (naive UTC), or None if nothing is cached
+        """
+        entry = self._cache.get(cache_key)
+        return entry[1] if entry else None
 
-    def get_cached_recommendations(self) -> list[ProductivityRecommendation]:
+    def get_cached_recommendations(self) -> tuple[ProductivityRecommendation, ...]:
         """Get cached recommendations without regenerating.
 
         Returns:
-            List of cached recommendations (may be empty)
+            Tuple of cached recommendations for all categories (may be empty)
         """
-        return self._cached_recommendations.copy()
+        entry = self._cache.get(None)
+        return entry[2] if entry else ()
 
     async def get_focus_recommendations(self) -> list[ProductivityRecommendation]:
         """Get recommendations focused on task prioritization.
@@ -113,8 +157,7 @@ class RecommendationService:
         Returns:
             List of focus-related recommendations
         """
-        all_recs = await self.generate_recommendations()
-        return [r for r in all_recs if r.category == "focus"]
+        return await self.generate_recommendations(categories={"focus"})
 
     async def get_scheduling_recommendations(self) -> list[ProductivityRecommendation]:
         """Get recommendations focused on scheduling.
@@ -122,8 +165,7 @@ class RecommendationService:
         Returns:
             List of scheduling-related recommendations
         """
-        all_recs = await self.generate_recommendations()
-        return [r for r in all_recs if r.category == "scheduling"]
+        return await self.generate_recommendations(categories={"scheduling"})
 
     async def get_quick_wins(self) -> list[dict[str, Any]]:
         """Get quick win suggestions based on task analysis.
@@ -142,22 +184,17 @@ class RecommendationService:
         # (no explicit duration info, so use heuristics)
         quick_wins = []
         for task in tasks:
-            tags = task.get_tags_list()
-            title_lower = task.title.lower()
-
-            # Heuristics for quick wins
-            is_quick = any([
-                "quick" in tags,
-                "easy" in tags,
-                len(task.title) < 50,  # Short titles often = simple tasks
-                "reply" in title_lower,
-                "respond" in title_lower,
-                "review" in title_lower and "document" not in title_lower,
-                "approve" in title_lower,
-                "confirm" in title_lower,
-            ])
-
-            if is_quick and task.priority_score > 30:
+            if task.priority_score <= 30:
+                continue
+
+            # Heuristics for quick wins, cheapest checks first
+            is_quick = (
+                len(task.title) < 50  # Short titles often = simple tasks
+                or _QUICK_WIN_TITLE_RE.search(task.title) is not None
+                or not _QUICK_WIN_TAGS.isdisjoint(task.get_tags_list())
+            )
+
+            if is_quick:
                 quick_wins.append({
                     "id": task.id,
                     "title": task.title,
@@ -186,20 +223,24 @@ class RecommendationService:
                 "suggested_actions": [],
             }
 
-        # Group by age
-        task_details = []
-        for task in overdue:
-            days_overdue = (datetime.now(UTC).replace(tzinfo=None) - task.due_date).days
-            task_details.append({
-                "id": task.id,
-                "title": task.title,
-                "priority": task.priority.value,
-                "days_overdue": days_overdue,
-                "source": task.source.value,
-            })
-
-        # Sort by days overdue (most overdue first)
-        task_details.sort(key=lambda x: x["days_overdue"], reverse=True)
+        import numpy as np
+
+        # Whole days overdue for every task in one vectorized subtraction
+        now = np.datetime64(naive_utcnow(), "us")
+        due = np.array([task.due_date for task in overdue], dtype="datetime64[us]")
+        days_overdue = (now - due) // np.timedelta64(1, "D")
+
+        # Most overdue first; stable so ties keep their due-date order
+        task_details = [
+            {
+                "id": overdue[i].id,
+                "title": overdue[i].title,
+                "priority": overdue[i].priority.value,
+                "days_overdue": int(days_overdue[i]),
+                "source": overdue[i].source.value,
+            }
+            for i in np.argsort(-days_overdue, kind="stable")
+        ]
 
         # Generate suggested actions
         suggested_actions = []
@@ -232,11 +273,12 @@ class RecommendationService:
         Returns:
             Dict with daily summary data
         """
-        statistics = self.task_service.get_statistics()
-        due_today = self.task_service.get_due_soon_tasks(days=0)
-        due_soon = self.task_service.get_due_soon_tasks(days=3)
-        overdue = self.task_service.get_overdue_tasks()
-        top_priority = self.task_service.get_prioritized_tasks(limit=5)
+        bundle = self.task_service.get_dashboard_bundle(due_soon_days=3, top_limit=5)
+        statistics = bundle.statistics
+        due_today = bundle.due_today
+        due_soon = bundle.due_soon
+        overdue = bundle.overdue
+        top_priority = bundle.top_priority
 
         # Get recommendations
         recommendations = await self.generate_recommendations()
@@ -274,5 +316,6 @@ class RecommendationService:
 
     def clear_cache(self) -> None:
         """Clear the recommendation cache."""
-        self._cached_recommendations = []
-        self._cache_timestamp = None
+        self._cache.clear()
+        self._task_dicts_key = None
+        self._task_dicts = []
@@ -1,14 +1,124 @@
 """Task service with business logic for task management."""
 
-from datetime import UTC, datetime, timedelta
+import copy
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Sequence
 
-from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import String, and_, bindparam, case, func, lambda_stmt, literal, or_, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from src.exceptions import AccountNotFoundError
-from src.models.initiative import InitiativePriority, InitiativeStatus
-from src.models.task import Task, TaskPriority, TaskSource, TaskStatus
+from src.models.initiative import Initiative, InitiativePriority, InitiativeStatus
+from src.models.task import Task, TaskPriority, TaskSource, TaskStatus, TaskTag
+from src.utils.dates import naive_utcnow, to_naive_utc
+
+_ACTIVE_STATUSES = [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]
+_DELETE_BATCH_SIZE = 500
+
+# Priority score point tables, shared by calculate_priority_score and its SQL
+# counterpart _priority_score_expr so the two cannot drift apart.
+_PRIORITY_POINTS = {
+    TaskPriority.CRITICAL: 40,
+    TaskPriority.HIGH: 30,
+    TaskPriority.MEDIUM: 20,
+    TaskPriority.LOW: 10,
+}
+_SOURCE_POINTS = {
+    TaskSource.MANUAL: 5,  # User explicitly created
+    TaskSource.EMAIL: 8,  # Email often contains important requests
+    TaskSource.SLACK: 7,  # Direct communication
+    TaskSource.CALENDAR: 6,  # Calendar-related
+    TaskSource.MEETING_NOTES: 9,  # Action items from meetings
+    TaskSource.AGENT: 4,  # Auto-generated
+}
+_URGENT_TAGS = frozenset({"urgent", "asap", "critical", "blocking", "blocker"})
+_IMPORTANT_TAGS = frozenset({"important", "priority", "key"})
+_INITIATIVE_POINTS = {
+    InitiativePriority.HIGH: 10,
+    InitiativePriority.MEDIUM: 5,
+    InitiativePriority.LOW: 2,
+}
+
+# Configured account IDs change only when the config file does, so they are
+# shared across TaskService instances and re-read at most once a minute.
+_ACCOUNT_IDS_TTL_SECONDS = 60.0
+_configured_account_ids: tuple[float, frozenset[str]] | None = None
+
+
+def _list_account_ids(integration_manager) -> frozenset[str]:
+    """Collect the account IDs configured for every integration type."""
+    from src.integrations.base import IntegrationType
+
+    return frozenset(
+        account_id
+        for integration_type in IntegrationType
+        for account_id in integration_manager.list_accounts(integration_type)
+    )
+
+
+def _get_configured_account_ids() -> frozenset[str]:
+    """Get account IDs from the loaded config, cached for a short TTL."""
+    global _configured_account_ids
+
+    now = time.monotonic()
+    if _configured_account_ids is not None:
+        loaded_at, account_ids = _configured_account_ids
+        if now - loaded_at < _ACCOUNT_IDS_TTL_SECONDS:
+            return account_ids
+
+    from src.integrations.manager import IntegrationManager
+    from src.utils.config import load_config
+
+    account_ids = _list_account_ids(IntegrationManager(load_config()))
+    _configured_account_ids = (now, account_ids)
+    return account_ids
+
+
+# get_statistics results, reused until a task write through TaskService or the
+# TTL expires (bounding staleness from time-based counts and other processes).
+_STATISTICS_TTL_SECONDS = 5.0
+_statistics_version = 0
+_statistics_cache: tuple[object, int, float, dict] | None = None
+
+
+def _invalidate_statistics() -> None:
+    """Mark cached statistics as stale after a task write."""
+    global _statistics_version
+    _statistics_version += 1
+
+
+def _clear_configured_account_ids() -> None:
+    """Drop the cached account IDs so the next lookup reloads the config."""
+    global _configured_account_ids
+    _configured_account_ids = None
+
+
+@dataclass(slots=True)
+class TaskSummary:
+    """The task columns shown in task listings."""
+
+    id: int
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    priority_score: float
+    due_date: datetime | None
+    initiative_id: int | None
+    initiative_title: str | None
+    has_document_links: bool
+
+
+@dataclass
+class DashboardBundle:
+    """Task data shown together on the daily summary."""
+
+    statistics: dict
+    due_today: list[Task]
+    due_soon: list[Task]
+    overdue: list[Task]
+    top_priority: list[Task]
 
 
 class TaskService:
@@ -24,11 +134,11 @@ class TaskService:
         """
         self.db = db
         self._integration_manager = integration_manager
-        self._valid_accounts: set[str] | None = None
+        self._valid_accounts: frozenset[str] | None = None
 
     def get_task(self, task_id: int) -> Task | None:
-        """Get a task by ID."""
-        return self.db.query(Task).filter(Task.id == task_id).first()
+        """Get a task by ID, from the session's identity map when already loaded."""
+        return self.db.get(Task, task_id)
 
     def get_tasks(
         self,
@@ -43,19 +153,99 @@ class TaskService:
         due_before: datetime | None = None,
         due_after: datetime | None = None,
         include_completed: bool = True,
+        include_initiative: bool = False,
         limit: int = 50,
         offset: int = 0,
     ) -> tuple[list[Task], int]:
         """Get tasks with advanced filtering.
 
+        Args:
+            include_initiative: Eager-load each task's initiative, for callers
+                that render it; otherwise it is lazy-loaded on access
+
         Returns:
             Tuple of (tasks, total_count)
         """
         query = self.db.query(Task)
 
-        # Add eager loading for initiative to avoid N+1 queries
-        query = query.options(joinedload(Task.initiative))
+        if include_initiative:
+            query = query.options(joinedload(Task.initiative))
+
+        query = self._filter_tasks(
+            query,
+            status=status,
+            priority=priority,
+            source=source,
+            account_id=account_id,
+            tags=tags,
+            document_links=document_links,
+            search=search,
+            due_before=due_before,
+            due_after=due_after,
+            include_completed=include_completed,
+        )
+        rows, total = self._paginate(query, limit=limit, offset=offset)
+        return [row[0] for row in rows], total
+
+    def get_tasks_summary(
+        self,
+        *,
+        status: TaskStatus | list[TaskStatus] | None = None,
+        priority: TaskPriority | list[TaskPriority] | None = None,
+        account_id: str | None = None,
+        document_links: list[str] | None = None,
+        include_completed: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[TaskSummary], int]:
+        """Get the columns needed for task listings, without loading Task objects.
+
+        Filters behave as in get_tasks. Only the listed columns and the
+        initiative title are selected, skipping description and tags.
+
+        Returns:
+            Tuple of (task summaries, total_count)
+        """
+        query = self.db.query(
+            Task.id,
+            Task.title,
+            Task.status,
+            Task.priority,
+            Task.priority_score,
+            Task.due_date,
+            Task.initiative_id,
+            Initiative.title.label("initiative_title"),
+            and_(Task.document_links.isnot(None), Task.document_links != ""),
+        ).outerjoin(Task.initiative)
+
+        query = self._filter_tasks(
+            query,
+            status=status,
+            priority=priority,
+            account_id=account_id,
+            document_links=document_links,
+            include_completed=include_completed,
+        )
+        rows, total = self._paginate(query, limit=limit, offset=offset)
+        summaries = [TaskSummary(*row[:8], has_document_links=bool(row[8])) for row in rows]
+        return summaries, total
 
+    @staticmethod
+    def _filter_tasks(
+        query,
+        *,
+        status: TaskStatus | list[TaskStatus] | None = None,
+        priority: TaskPriority | list[TaskPriority] | None = None,
+        source: TaskSource | None = None,
+        account_id: str | None = None,
+        tags: list[str] | None = None,
+        document_links: list[str] | None = None,
+        search: str | None = None,
+        due_before: datetime | None = None,
+        due_after: datetime | None = None,
+        include_completed: bool = True,
+    ):
+        """Apply the get_tasks filters to a query selecting from tasks."""
         # Status filter
         if status is not None:
             if isinstance(status, list):
@@ -80,10 +270,12 @@ class TaskService:
         if account_id is not None:
             query = query.filter(Task.account_id == account_id)
 
-        # Tags filter (matches any of the provided tags)
+        # Tags filter (matches any of the provided tags, case-insensitively)
         if tags:
-            tag_conditions = [Task.tags.contains(tag) for tag in tags]
-            query = query.filter(or_(*tag_conditions))
+            normalized_tags = [tag.strip().lower() for tag in tags]
+            query = query.filter(
+                Task.id.in_(select(TaskTag.task_id).where(TaskTag.tag.in_(normalized_tags)))
+            )
 
         # Document links filter (matches any of the provided links)
         if document_links:
@@ -106,56 +298,103 @@ class TaskService:
         if due_after is not None:
             query = query.filter(Task.due_date >= due_after)
 
-        # Get total count before pagination
-        total = query.count()
+        return query
+
+    @staticmethod
+    def _paginate(query, *, limit: int, offset: int) -> tuple[list, int]:
+        """Fetch one page of a task query along with the unpaginated total.
 
-        # Order by priority score (descending) and created_at
-        tasks = (
-            query.order_by(Task.priority_score.desc(), Task.created_at.desc())
+        Orders by priority score (descending) and created_at. The total count
+        rides along as a window column so the filter runs only once.
+
+        Returns:
+            Tuple of (rows with the total as their last column, total_count)
+        """
+        rows = (
+            query.add_columns(func.count().over().label("_total"))
+            .order_by(Task.priority_score.desc(), Task.created_at.desc())
             .offset(offset)
             .limit(limit)
             .all()
         )
 
-        return tasks, total
+        if rows:
+            total = rows[0]._total
+        elif offset:
+            # Paged past the end: no row carries the window total
+            total = query.count()
+        else:
+            total = 0
+
+        return rows, total
 
     def get_prioritized_tasks(self, limit: int = 10) -> list[Task]:
         """Get top priority tasks that are actionable (pending or in progress)."""
-        return (
-            self.db.query(Task)
+        stmt = lambda_stmt(
+            lambda: select(Task)
             .options(joinedload(Task.initiative))
-            .filter(Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]))
+            .where(Task.status.in_(bindparam("statuses", expanding=True)))
             .order_by(Task.priority_score.desc())
-            .limit(limit)
-            .all()
+            .limit(bindparam("limit"))
         )
+        params = {"statuses": _ACTIVE_STATUSES, "limit": limit}
+        return list(self.db.execute(stmt, params).scalars().unique())
 
     def get_overdue_tasks(self) -> list[Task]:
         """Get all overdue tasks."""
-        now = datetime.now(UTC).replace(tzinfo=None)
-        return (
-            self.db.query(Task)
+        stmt = lambda_stmt(
+            lambda: select(Task)
             .options(joinedload(Task.initiative))
-            .filter(
-                and_(
-                    Task.due_date < now,
-                    Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
-                )
-            )
+            .where(Task.due_date < bindparam("now"))
+            .where(Task.status.in_(bindparam("statuses", expanding=True)))
             .order_by(Task.due_date.asc())
-            .all()
         )
+        params = {"now": naive_utcnow(), "statuses": _ACTIVE_STATUSES}
+        return list(self.db.execute(stmt, params).scalars().unique())
 
     def get_due_soon_tasks(self, days: int = 3) -> list[Task]:
         """Get tasks due within the specified number of days."""
-        now = datetime.now(UTC).replace(tzinfo=None)
-        soon = now + timedelta(days=days)
-        return (
+        now = naive_utcnow()
+        stmt = lambda_stmt(
+            lambda: select(Task)
+            .options(joinedload(Task.initiative))
+            .where(Task.due_date >= bindparam("now"))
+            .where(Task.due_date <= bindparam("soon"))
+            .where(Task.status.in_(bindparam("statuses", expanding=True)))
+            .order_by(Task.due_date.asc())
+        )
+        params = {
+            "now": now,
+            "soon": now + timedelta(days=days),
+            "statuses": _ACTIVE_STATUSES,
+        }
+        return list(self.db.execute(stmt, params).scalars().unique())
+
+    def get_dashboard_bundle(
+        self, due_soon_days: int = 3, top_limit: int = 5
+    ) -> DashboardBundle:
+        """Get the task lists and statistics for a daily summary.
+
+        Overdue, due-today and due-soon tasks are partitioned from a single query
+        over active tasks due before the due-soon horizon, instead of one query each.
+
+        Args:
+            due_soon_days: Days ahead counted as due soon
+            top_limit: Number of top priority tasks to include
+
+        Returns:
+            DashboardBundle with the same contents as get_statistics,
+            get_due_soon_tasks(0), get_due_soon_tasks(due_soon_days),
+            get_overdue_tasks and get_prioritized_tasks(top_limit)
+        """
+        now = naive_utcnow()
+        soon = now + timedelta(days=due_soon_days)
+
+        upcoming = (
             self.db.query(Task)
             .options(joinedload(Task.initiative))
             .filter(
                 and_(
-                    Task.due_date >= now,
                     Task.due_date <= soon,
                     Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
                 )
@@ -164,6 +403,18 @@ class TaskService:
             .all()
         )
 
+        overdue = [t for t in upcoming if t.due_date < now]
+        due_soon = [t for t in upcoming if t.due_date >= now]
+        due_today = [t for t in due_soon if t.due_date <= now]
+
+        return DashboardBundle(
+            statistics=self.get_statistics(),
+            due_today=due_today,
+            due_soon=due_soon,
+            overdue=overdue,
+            top_priority=self.get_prioritized_tasks(limit=top_limit),
+        )
+
     def create_task(
         self,
         title: str,
@@ -208,7 +459,7 @@ class TaskService:
             source=source,
             source_reference=source_reference,
             account_id=account_id,
-            due_date=due_date,
+            due_date=to_naive_utc(due_date),
             initiative_id=initiative_id,
         )
         if tags:
@@ -220,32 +471,24 @@ class TaskService:
 
         self.db.add(task)
         self.db.commit()
-        self.db.refresh(task)
+        _invalidate_statistics()
 
         return task
 
-    def _get_valid_accounts(self) -> set[str]:
+    def _get_valid_accounts(self) -> frozenset[str]:
         """Lazy-load and cache valid account IDs.
 
+        Without an injected integration manager, the IDs come from the
+        module-level cache rather than reloading the config for each service.
+
         Returns:
             Set of valid account_ids from all integrations.
         """
+        if self._integration_manager is None:
+            return _get_configured_account_ids()
+
         if self._valid_accounts is None:
-            if self._integration_manager is None:
-                # Lazy-load manager if not provided
-                from src.integrations.base import IntegrationType
-                from src.integrations.manager import IntegrationManager
-                from src.utils.config import load_config
-
-                config = load_config()
-                self._integration_manager = IntegrationManager(config)
-
-            # Collect all configured account_ids
-            all_accounts = []
-            from src.integrations.base import IntegrationType
-            for integration_type in IntegrationType:
-                all_accounts.extend(self._integration_manager.list_accounts(integration_type))
-            self._valid_accounts = set(all_accounts)
+            self._valid_accounts = _list_account_ids(self._integration_manager)
 
         return self._valid_accounts
 
@@ -300,11 +543,11 @@ class TaskService:
         if status is not None:
             task.status = status
             if status == TaskStatus.COMPLETED:
-                task.completed_at = datetime.now(UTC)
+                task.completed_at = naive_utcnow()
         if priority is not None:
             task.priority = priority
         if due_date is not None:
-            task.due_date = due_date
+            task.due_date = to_naive_utc(due_date)
         if tags is not None:
             task.set_tags_list(tags)
         if document_links is not None:
@@ -317,7 +560,10 @@ class TaskService:
         task.priority_score = self.calculate_priority_score(task)
 
         self.db.commit()
-        self.db.refresh(task)
+        _invalidate_statistics()
+        if clear_initiative or initiative_id is not None:
+            # Objects are not expired on commit, so reload the changed relationship
+            self.db.refresh(task, attribute_names=["initiative"])
 
         return task
 
@@ -325,169 +571,169 @@ class TaskService:
         """Delete a task."""
         self.db.delete(task)
         self.db.commit()
+        _invalidate_statistics()
 
     def bulk_update_status(
         self, task_ids: list[int], status: TaskStatus
     ) -> list[Task]:
-        """Update status for multiple tasks."""
-        tasks = (
-            self.db.query(Task)
-            .options(joinedload(Task.initiative))
-            .filter(Task.id.in_(task_ids))
-            .all()
-        )
-
-        now = datetime.now(UTC) if status == TaskStatus.COMPLETED else None
-
-        for task in tasks:
-            task.status = status
-            if status == TaskStatus.COMPLETED:
-                task.completed_at = now
-            task.priority_score = self.calculate_priority_score(task)
+        """Update status for multiple tasks.
 
+        Status and priority scores are written by two set-based UPDATEs (the
+        score expression reads the new status), then the tasks are loaded once.
+        """
+        # One timestamp for completion, modification and the due-date score
+        now = naive_utcnow()
+        values = {Task.status: status, Task.updated_at: now}
+        if status == TaskStatus.COMPLETED:
+            values[Task.completed_at] = now
+
+        selected = self.db.query(Task).filter(Task.id.in_(task_ids))
+        selected.update(values, synchronize_session=False)
+        selected.update(
+            {Task.priority_score: self._priority_score_expr(now), Task.updated_at: now},
+            synchronize_session=False,
+        )
         self.db.commit()
+        _invalidate_statistics()
 
-        # Refresh all tasks
-        for task in tasks:
-            self.db.refresh(task)
-
-        return tasks
+        return (
+            selected.options(selectinload(Task.initiative)).populate_existing().all()
+        )
 
     def bulk_delete(self, task_ids: list[int]) -> int:
-        """Delete multiple tasks. Returns count of deleted tasks."""
-        deleted = (
-            self.db.query(Task).filter(Task.id.in_(task_ids)).delete(synchronize_session=False)
-        )
+        """Delete multiple tasks. Returns count of deleted tasks.
+
+        IDs are deleted in batches within one transaction so a large selection
+        stays under the driver's bound-parameter limit.
+        """
+        deleted = 0
+        for start in range(0, len(task_ids), _DELETE_BATCH_SIZE):
+            batch = task_ids[start : start + _DELETE_BATCH_SIZE]
+            # SQLite does not enforce ON DELETE CASCADE unless foreign keys are enabled
+            self.db.query(TaskTag).filter(TaskTag.task_id.in_(batch)).delete(
+                synchronize_session=False
+            )
+            # "evaluate" drops deleted tasks from the session so get_task can't return them
+            deleted += (
+                self.db.query(Task)
+                .filter(Task.id.in_(batch))
+                .delete(synchronize_session="evaluate")
+            )
         self.db.commit()
+        _invalidate_statistics()
         return deleted
 
     def recalculate_all_priorities(self) -> int:
         """Recalculate priority scores for all active tasks.
 
+        Scores are computed by the database in a single UPDATE rather than
+        loading and scoring each task in Python.
+
         Returns:
             Number of tasks updated.
         """
-        tasks = (
+        updated = (
             self.db.query(Task)
-            .options(joinedload(Task.initiative))
-            .filter(Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]))
-            .all()
+            .filter(Task.status.in_(_ACTIVE_STATUSES))
+            .update(
+                {Task.priority_score: self._priority_score_expr(naive_utcnow())},
+                synchronize_session=False,
+            )
         )
-
-        for task in tasks:
-            task.priority_score = self.calculate_priority_score(task)
-
         self.db.commit()
-        return len(tasks)
+        # Objects are not expired on commit, so drop scores already loaded in this session
+        self.db.expire_all()
+        _invalidate_statistics()
+        return updated
 
     def get_statistics(self) -> dict:
-        """Get task statistics."""
-        now = datetime.now(UTC).replace(tzinfo=None)
-
-        # Count by status
-        status_counts = dict(
-            self.db.query(Task.status, func.count(Task.id))
-            .group_by(Task.status)
-            .all()
-        )
-
-        # Count by priority (active tasks only)
-        priority_counts = dict(
-            self.db.query(Task.priority, func.count(Task.id))
-            .filter(Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]))
-            .group_by(Task.priority)
-            .all()
-        )
+        """Get task statistics.
 
-        # Count by source
-        source_counts = dict(
-            self.db.query(Task.source, func.count(Task.id))
-            .group_by(Task.source)
-            .all()
-        )
-
-        # Overdue count
-        overdue_count = (
-            self.db.query(func.count(Task.id))
-            .filter(
-                and_(
-                    Task.due_date < now,
-                    Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
-                )
-            )
-            .scalar()
-        )
-
-        # Due today
+        All counts and the average completion time come from a single query
+        using conditional aggregation. Results are cached per database for a few
+        seconds and invalidated by any task write made through TaskService.
+        """
+        global _statistics_cache
+
+        bind = self.db.get_bind()
+        version = _statistics_version
+        if _statistics_cache is not None:
+            cached_bind, cached_version, cached_at, cached = _statistics_cache
+            if (
+                cached_bind is bind
+                and cached_version == version
+                and time.monotonic() - cached_at < _STATISTICS_TTL_SECONDS
+            ):
+                return copy.deepcopy(cached)
+
+        statistics = self._query_statistics()
+        _statistics_cache = (bind, version, time.monotonic(), statistics)
+        return copy.deepcopy(statistics)
+
+    def _query_statistics(self) -> dict:
+        """Compute get_statistics in one conditional-aggregation query."""
+        now = naive_utcnow()
         tomorrow = now + timedelta(days=1)
-        due_today_count = (
-            self.db.query(func.count(Task.id))
-            .filter(
-                and_(
-                    Task.due_date >= now,
-                    Task.due_date < tomorrow,
-                    Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
-                )
-            )
-            .scalar()
-        )
-
-        # Due this week
         week_from_now = now + timedelta(days=7)
-        due_this_week_count = (
-            self.db.query(func.count(Task.id))
-            .filter(
-                and_(
-                    Task.due_date >= now,
-                    Task.due_date < week_from_now,
-                    Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
-                )
-            )
-            .scalar()
-        )
 
-        # Total counts
-        total = self.db.query(func.count(Task.id)).scalar()
-        active = (
-            self.db.query(func.count(Task.id))
-            .filter(Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]))
-            .scalar()
-        )
+        is_active = Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS])
 
-        # Average completion time (for completed tasks with timestamps)
-        # Use SQL aggregation instead of loading all tasks into memory
-        avg_completion_seconds = (
-            self.db.query(
-                func.avg(
-                    func.julianday(Task.completed_at) - func.julianday(Task.created_at)
-                ) * 86400  # Convert days to seconds
-            )
-            .filter(
-                and_(
-                    Task.status == TaskStatus.COMPLETED,
-                    Task.completed_at.isnot(None),
-                    Task.created_at.isnot(None),
-                )
-            )
-            .scalar()
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        is_completed_with_dates = and_(
+            Task.status == TaskStatus.COMPLETED,
+            Task.completed_at.isnot(None),
+            Task.created_at.isnot(None),
         )
 
-        avg_completion_hours = avg_completion_seconds / 3600 if avg_completion_seconds else None
+        columns = [
+            func.count(Task.id),
+            count_where(is_active),
+            count_where(and_(Task.due_date < now, is_active)),
+            count_where(and_(Task.due_date >= now, Task.due_date < tomorrow, is_active)),
+            count_where(and_(Task.due_date >= now, Task.due_date < week_from_now, is_active)),
+            # AVG ignores the NULLs produced for tasks that don't qualify
+            func.avg(case((is_completed_with_dates, self._completion_seconds_expr()))),
+        ]
+        columns += [count_where(Task.status == s) for s in TaskStatus]
+        columns += [count_where(and_(Task.priority == p, is_active)) for p in TaskPriority]
+        columns += [count_where(Task.source == s) for s in TaskSource]
+
+        (
+            total,
+            active,
+            overdue_count,
+            due_today_count,
+            due_this_week_count,
+            avg_completion_seconds,
+            *breakdowns,
+        ) = self.db.query(*columns).one()
+        counts = iter(breakdowns)
 
         return {
             "total": total,
             "active": active,
-            "by_status": {s.value: status_counts.get(s, 0) for s in TaskStatus},
-            "by_priority": {p.value: priority_counts.get(p, 0) for p in TaskPriority},
-            "by_source": {s.value: source_counts.get(s, 0) for s in TaskSource},
+            "by_status": {s.value: next(counts) for s in TaskStatus},
+            "by_priority": {p.value: next(counts) for p in TaskPriority},
+            "by_source": {s.value: next(counts) for s in TaskSource},
             "overdue": overdue_count,
             "due_today": due_today_count,
             "due_this_week": due_this_week_count,
-            "avg_completion_hours": avg_completion_hours,
+            "avg_completion_hours": (
+                avg_completion_seconds / 3600 if avg_completion_seconds else None
+            ),
         }
 
+    def _completion_seconds_expr(self):
+        """SQL expression for seconds between a task's creation and completion."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return func.extract("epoch", Task.completed_at - Task.created_at)
+        # SQLite has no interval type; julianday differences are in days
+        return (func.julianday(Task.completed_at) - func.julianday(Task.created_at)) * 86400
+
     @staticmethod
-    def calculate_priority_score(task: Task) -> float:
+    def calculate_priority_score(task: Task, *, now: datetime | None = None) -> float:
         """Calculate priority score based on multiple factors.
 
         Scoring factors (0-100 scale):
@@ -499,30 +745,23 @@ class TaskService:
         - Initiative priority: 0-10 points
 
         Higher score = higher priority.
+
+        Task dates are naive UTC (see to_naive_utc). Callers scoring many tasks
+        pass a single ``now`` so the clock is read once per batch.
         """
+        if now is None:
+            now = naive_utcnow()
         score = 0.0
 
         # 1. Base priority level (0-40 points)
-        priority_scores = {
-            TaskPriority.CRITICAL: 40,
-            TaskPriority.HIGH: 30,
-            TaskPriority.MEDIUM: 20,
-            TaskPriority.LOW: 10,
-        }
-        score += priority_scores.get(task.priority, 20)
+        score += _PRIORITY_POINTS.get(task.priority, 20)
 
         # 2. Due date urgency (0-25 points)
         if task.due_date:
-            now = datetime.now(UTC).replace(tzinfo=None)
-            # Handle timezone-aware due dates
-            due_date = task.due_date
-            if due_date.tzinfo is not None:
-                due_date = due_date.replace(tzinfo=None)
+            # One subtraction; the day buckets below are whole-day hour bounds
+            hours_until_due = (task.due_date - now).total_seconds() / 3600
 
-            days_until_due = (due_date - now).days
-            hours_until_due = (due_date - now).total_seconds() / 3600
-
-            if days_until_due < 0:
+            if hours_until_due < 0:
                 # Overdue - maximum urgency
                 score += 25
             elif hours_until_due <= 4:
@@ -531,24 +770,20 @@ class TaskService:
             elif hours_until_due <= 24:
                 # Due today
                 score += 20
-            elif days_until_due <= 2:
+            elif hours_until_due < 3 * 24:
                 # Due in 1-2 days
                 score += 15
-            elif days_until_due <= 7:
+            elif hours_until_due < 8 * 24:
                 # Due this week
                 score += 10
-            elif days_until_due <= 14:
+            elif hours_until_due < 15 * 24:
                 # Due in 2 weeks
                 score += 5
 
         # 3. Task age bonus (0-15 points) - older uncompleted tasks get slight boost
-        if task.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]:
+        if task.status in _ACTIVE_STATUSES:
             if task.created_at:
-                now = datetime.now(UTC).replace(tzinfo=None)
-                created = task.created_at
-                if created.tzinfo is not None:
-                    created = created.replace(tzinfo=None)
-                days_old = (now - created).days
+                days_old = (now - task.created_at).days
 
                 if days_old >= 14:
                     score += 15
@@ -560,24 +795,13 @@ class TaskService:
                     score += 2
 
         # 4. Source importance (0-10 points)
-        source_scores = {
-            TaskSource.MANUAL: 5,  # User explicitly created
-            TaskSource.EMAIL: 8,  # Email often contains important requests
-            TaskSource.SLACK: 7,  # Direct communication
-            TaskSource.CALENDAR: 6,  # Calendar-related
-            TaskSource.MEETING_NOTES: 9,  # Action items from meetings
-            TaskSource.AGENT: 4,  # Auto-generated
-        }
-        score += source_scores.get(task.source, 5)
+        score += _SOURCE_POINTS.get(task.source, 5)
 
         # 5. Special tags bonus (0-10 points)
-        tags = task.get_tags_list()
-        urgent_tags = {"urgent", "asap", "critical", "blocking", "blocker"}
-        important_tags = {"important", "priority", "key"}
-
-        if any(tag.lower() in urgent_tags for tag in tags):
+        tags = {tag.lower() for tag in task.get_tags_list()}
+        if not tags.isdisjoint(_URGENT_TAGS):
             score += 10
-        elif any(tag.lower() in important_tags for tag in tags):
+        elif not tags.isdisjoint(_IMPORTANT_TAGS):
             score += 5
 
         # 6. Initiative priority bonus (0-10 points)
@@ -585,12 +809,80 @@ class TaskService:
         if task.initiative_id and task.initiative:
             initiative = task.initiative
             if initiative.status == InitiativeStatus.ACTIVE:
-                initiative_scores = {
-                    InitiativePriority.HIGH: 10,
-                    InitiativePriority.MEDIUM: 5,
-                    InitiativePriority.LOW: 2,
-                }
-                score += initiative_scores.get(initiative.priority, 0)
+                score += _INITIATIVE_POINTS.get(initiative.priority, 0)
 
         # Cap at 100
         return min(score, 100.0)
+
+    @staticmethod
+    def _priority_score_expr(now: datetime):
+        """SQL expression computing calculate_priority_score for each task row.
+
+        Args:
+            now: Naive UTC time to measure due dates and task age against
+
+        Returns:
+            Column expression usable in an UPDATE of the tasks table
+        """
+        day = timedelta(days=1)
+
+        def points_for(column, points, default):
+            return case(
+                *((column == key, value) for key, value in points.items()), else_=default
+            )
+
+        priority_points = points_for(Task.priority, _PRIORITY_POINTS, 20)
+
+        # Mirrors the floor-of-days buckets in calculate_priority_score
+        due_points = case(
+            (Task.due_date.is_(None), 0),
+            (Task.due_date < now, 25),
+            (Task.due_date <= now + timedelta(hours=4), 23),
+            (Task.due_date <= now + day, 20),
+            (Task.due_date < now + 3 * day, 15),
+            (Task.due_date < now + 8 * day, 10),
+            (Task.due_date < now + 15 * day, 5),
+            else_=0,
+        )
+
+        age_points = case(
+            (Task.status.not_in(_ACTIVE_STATUSES), 0),
+            (Task.created_at <= now - 14 * day, 15),
+            (Task.created_at <= now - 7 * day, 10),
+            (Task.created_at <= now - 3 * day, 5),
+            (Task.created_at <= now - day, 2),
+            else_=0,
+        )
+
+        source_points = points_for(Task.source, _SOURCE_POINTS, 5)
+
+        # Tags are comma-separated; wrap them in commas to match whole tags
+        normalized_tags = func.replace(
+            func.lower(func.coalesce(Task.tags, "")), " ", "", type_=String
+        )
+        padded_tags = literal(",", String) + normalized_tags + literal(",", String)
+
+        def has_any_tag(tags):
+            return or_(*(padded_tags.contains(f",{tag},") for tag in sorted(tags)))
+
+        tag_points = case(
+            (has_any_tag(_URGENT_TAGS), 10),
+            (has_any_tag(_IMPORTANT_TAGS), 5),
+            else_=0,
+        )
+
+        initiative_points = func.coalesce(
+            select(points_for(Initiative.priority, _INITIATIVE_POINTS, 0))
+            .where(
+                Initiative.id == Task.initiative_id,
+                Initiative.status == InitiativeStatus.ACTIVE,
+            )
+            .scalar_subquery(),
+            0,
+        )
+
+        total = (
+            priority_points + due_points + age_points + source_points + tag_points
+            + initiative_points
+        )
+        return case((total > 100, 100.0), else_=total)
@@ -4,25 +4,118 @@ Provides functionality for recording audio, transcribing speech to text,
 and creating tasks from voice input using OpenAI Whisper API.
 """
 
+import asyncio
+import atexit
+import hashlib
 import io
 import logging
-import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from pathlib import Path
-from typing import BinaryIO
+from typing import TYPE_CHECKING, BinaryIO
 
-import numpy as np
-import sounddevice as sd
-import soundfile as sf
-from openai import OpenAI
+import httpx
 
 from src.models.task import Task, TaskPriority, TaskSource
-from src.services.llm_service import ExtractedTask, LLMService
+from src.services.llm_service import ExtractedTask, LLMService, get_shared_llm_service
 from src.services.task_service import TaskService
 from src.utils.config import LLMConfig, VoiceConfig
 
+if TYPE_CHECKING:
+    import numpy as np
+    from openai import OpenAI
+
 logger = logging.getLogger(__name__)
 
+_DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+# Whisper resamples everything to 16 kHz, so higher capture rates only add upload bytes
+_WHISPER_SAMPLE_RATE = 16000
+
+# One keep-alive HTTP/2 pool and one OpenAI client per (api_key, base_url),
+# shared by every VoiceService so repeat transcriptions skip the TLS handshake
+_shared_http_client: httpx.Client | None = None
+_shared_openai_clients: dict[tuple[str | None, str | None], "OpenAI"] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_openai_client(api_key: str | None, base_url: str | None) -> "OpenAI":
+    """Get or create the shared OpenAI client for an API key and base URL.
+
+    Args:
+        api_key: OpenAI API key
+        base_url: API base URL, or None for the OpenAI default
+
+    Returns:
+        OpenAI client backed by the module's pooled HTTP client
+    """
+    global _shared_http_client
+
+    from openai import OpenAI
+
+    key = (api_key, base_url)
+    with _shared_clients_lock:
+        client = _shared_openai_clients.get(key)
+        if client is None:
+            if _shared_http_client is None:
+                _shared_http_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=10,
+                        max_connections=20,
+                        keepalive_expiry=300,
+                    ),
+                    timeout=httpx.Timeout(60.0, connect=5.0),
+                )
+                atexit.register(_close_shared_clients)
+            client = OpenAI(api_key=api_key, base_url=base_url, http_client=_shared_http_client)
+            _shared_openai_clients[key] = client
+        return client
+
+
+def _close_shared_clients() -> None:
+    """Close the shared HTTP pool and drop the OpenAI clients using it."""
+    global _shared_http_client
+
+    with _shared_clients_lock:
+        _shared_openai_clients.clear()
+        http_client, _shared_http_client = _shared_http_client, None
+    if http_client is not None:
+        atexit.unregister(_close_shared_clients)
+        http_client.close()
+
+
+
+def _downsample(audio: "np.ndarray", rate: int, target_rate: int) -> "np.ndarray":
+    """Resample int16 audio to a lower rate.
+
+    A moving average over one output sample's worth of input acts as the
+    anti-aliasing filter, then samples are linearly interpolated onto the
+    target grid. That is plenty for speech headed to Whisper.
+
+    Args:
+        audio: int16 samples, shaped (frames, 1)
+        rate: Sample rate of the input
+        target_rate: Sample rate to convert to (lower than rate)
+
+    Returns:
+        Resampled int16 samples, shaped (frames, 1)
+    """
+    import numpy as np
+
+    frames = len(audio) * target_rate // rate
+    if frames == 0:
+        return np.zeros((0, 1), dtype=np.int16)
+
+    samples = audio[:, 0].astype(np.float32)
+    window = round(rate / target_rate)
+    if window > 1:
+        samples = np.convolve(samples, np.full(window, 1 / window, dtype=np.float32), mode="same")
+
+    positions = np.arange(frames) * (rate / target_rate)
+    resampled = np.interp(positions, np.arange(len(samples)), samples)
+    return np.round(resampled).astype(np.int16).reshape(-1, 1)
+
 
 class VoiceError(Exception):
     """Exception raised for voice service errors."""
@@ -78,36 +171,76 @@ class VoiceService:
         """
         self.voice_config = voice_config
         self.llm_config = llm_config
-        self.llm_service = llm_service or LLMService(llm_config)
+        self.llm_service = llm_service or get_shared_llm_service(llm_config)
+
+        # LRU of transcriptions keyed by (audio digest, model, language)
+        self._transcription_cache: OrderedDict[tuple, TranscriptionResult] = OrderedDict()
+        # Guards the LRU; the service is shared by API requests transcribing in worker threads
+        self._transcription_cache_lock = threading.Lock()
+        # Whisper requests in progress, shared by concurrent callers with the same key
+        self._inflight_transcriptions: dict[tuple, asyncio.Future[TranscriptionResult]] = {}
+        # Set once an input device has been seen; enumerating devices is slow
+        self._has_microphone = False
+
+    def _get_openai_client(self) -> "OpenAI":
+        """Get the OpenAI client for Whisper API (litellm doesn't support audio yet)."""
+        base_url = self.llm_config.base_url
+        return _get_shared_openai_client(
+            self.llm_config.api_key,
+            base_url if base_url != _DEFAULT_OPENAI_BASE_URL else None,
+        )
 
-        # Initialize OpenAI client for Whisper (litellm doesn't support audio yet)
-        self._openai_client: OpenAI | None = None
+    def warm_up_connection(self) -> threading.Thread:
+        """Open the Whisper API connection in the background.
 
-    def _get_openai_client(self) -> OpenAI:
-        """Get or create OpenAI client for Whisper API."""
-        if self._openai_client is None:
-            self._openai_client = OpenAI(
-                api_key=self.llm_config.api_key,
-                base_url=self.llm_config.base_url if self.llm_config.base_url != "https://api.openai.com/v1" else None,
-            )
-        return self._openai_client
+        Call this before recording so the TCP/TLS handshake happens while the
+        user is speaking rather than in front of the first transcription. The
+        pooled client keeps the connection alive for the upload.
+
+        Returns:
+            The daemon thread making the request
+        """
+
+        def ping() -> None:
+            try:
+                self._get_openai_client().models.list()
+            except Exception as e:
+                logger.debug("Whisper connection warm-up failed: %s", e)
+
+        thread = threading.Thread(target=ping, daemon=True)
+        thread.start()
+        return thread
 
     def check_microphone_available(self) -> bool:
         """Check if a microphone is available.
 
+        A positive result is cached, so devices are only re-enumerated while no
+        microphone has been found or after invalidate_microphone_cache().
+
         Returns:
             True if a microphone is available, False otherwise
         """
+        if self._has_microphone:
+            return True
+
+        # Audio libraries load native code, so only import them when used
+        import sounddevice as sd
+
         try:
             devices = sd.query_devices()
             for device in devices:
                 if device.get("max_input_channels", 0) > 0:
+                    self._has_microphone = True
                     return True
             return False
         except Exception as e:
-            logger.warning(f"Error checking for microphone: {e}")
+            logger.warning("Error checking for microphone: %s", e)
             return False
 
+    def invalidate_microphone_cache(self) -> None:
+        """Forget the cached microphone check, e.g. after devices change."""
+        self._has_microphone = False
+
     def record_audio(
         self,
         duration_seconds: int | None = None,
@@ -126,6 +259,10 @@ class VoiceService:
             MicrophoneNotFoundError: If no microphone is available
             VoiceError: If recording fails
         """
+        import numpy as np
+        import sounddevice as sd
+        import soundfile as sf
+
         if not self.check_microphone_available():
             raise MicrophoneNotFoundError(
                 "No microphone found. Please connect a microphone and try again."
@@ -134,40 +271,113 @@ class VoiceService:
         duration = duration_seconds or self.voice_config.recording_duration_seconds
         rate = sample_rate or self.voice_config.sample_rate
 
-        logger.info(f"Recording audio for {duration} seconds at {rate}Hz...")
+        logger.info("Recording audio for %s seconds at %sHz...", duration, rate)
 
         try:
-            # Record audio
-            audio_data = sd.rec(
-                int(duration * rate),
-                samplerate=rate,
-                channels=1,
-                dtype=np.float32,
-            )
-            sd.wait()  # Wait for recording to complete
+            # Record 16-bit PCM: Whisper handles it fine and it is half the size
+            # of float32 in memory and in the upload
+            if self.voice_config.stop_on_silence:
+                audio_data = self._record_until_silence(duration, rate)
+            else:
+                audio_data = sd.rec(
+                    int(duration * rate),
+                    samplerate=rate,
+                    channels=1,
+                    dtype=np.int16,
+                )
+                sd.wait()  # Wait for recording to complete
 
-            # Convert to WAV bytes
+            if rate > _WHISPER_SAMPLE_RATE:
+                audio_data = _downsample(audio_data, rate, _WHISPER_SAMPLE_RATE)
+                rate = _WHISPER_SAMPLE_RATE
+
+            # Convert to WAV bytes. getvalue() hands over BytesIO's internal bytes
+            # object rather than copying it, so returning bytes costs nothing
             buffer = io.BytesIO()
-            sf.write(buffer, audio_data, rate, format="WAV")
-            buffer.seek(0)
+            sf.write(buffer, audio_data, rate, format="WAV", subtype="PCM_16")
+            wav_bytes = buffer.getvalue()
+            del buffer
 
-            logger.info(f"Recording complete: {len(buffer.getvalue())} bytes")
-            return buffer.getvalue()
+            logger.info("Recording complete: %d bytes", len(wav_bytes))
+            return wav_bytes
 
         except Exception as e:
-            logger.error(f"Recording failed: {e}")
+            logger.error("Recording failed: %s", e)
+            # The device may have gone away; check again next time
+            self.invalidate_microphone_cache()
             raise VoiceError(f"Failed to record audio: {e}") from e
 
+    def _record_until_silence(self, duration: int, rate: int) -> "np.ndarray":
+        """Record until the speaker goes quiet or the duration limit is reached.
+
+        Audio is captured in 20 ms blocks into a buffer sized for the full
+        duration. Once speech has been heard, a run of blocks below the silence
+        threshold ends the recording and that trailing silence is dropped.
+
+        Args:
+            duration: Maximum recording duration in seconds
+            rate: Audio sample rate
+
+        Returns:
+            Recorded int16 samples, shaped (frames, 1)
+        """
+        import numpy as np
+        import sounddevice as sd
+
+        block_frames = max(1, rate // 50)
+        max_silent_blocks = max(1, self.voice_config.silence_duration_ms // 20)
+        threshold = self.voice_config.silence_threshold
+
+        recording = np.empty((int(duration * rate), 1), dtype=np.int16)
+        written = 0
+        speech_end = 0
+        silent_blocks = 0
+        finished = threading.Event()
+
+        def on_block(indata, frames, time_info, status):
+            nonlocal written, speech_end, silent_blocks
+            count = min(frames, len(recording) - written)
+            recording[written : written + count] = indata[:count]
+            written += count
+
+            rms = np.sqrt(np.mean(np.square(indata[:count], dtype=np.float32)))
+            if rms >= threshold:
+                speech_end = written
+                silent_blocks = 0
+            elif speech_end:
+                silent_blocks += 1
+
+            if written >= len(recording) or silent_blocks >= max_silent_blocks:
+                raise sd.CallbackStop
+
+        with sd.InputStream(
+            samplerate=rate,
+            channels=1,
+            dtype="int16",
+            blocksize=block_frames,
+            callback=on_block,
+            finished_callback=finished.set,
+        ):
+            finished.wait(timeout=duration + 1)
+
+        # Keep everything up to the last block that contained speech
+        return recording[: speech_end if silent_blocks else written]
+
     def transcribe_audio(
         self,
         audio_data: bytes,
         language: str | None = None,
+        *,
+        include_metadata: bool = False,
     ) -> TranscriptionResult:
         """Transcribe audio to text using Whisper API.
 
         Args:
             audio_data: Audio data as bytes (WAV format)
             language: Optional language hint (e.g., "en", "es")
+            include_metadata: Also return the detected language and duration.
+                These need Whisper's verbose response, which carries per-segment
+                data and is much larger, so only ask when they are used.
 
         Returns:
             TranscriptionResult with transcribed text
@@ -178,49 +388,107 @@ class VoiceService:
         if not self.voice_config.enabled:
             raise VoiceError("Voice features are disabled in configuration")
 
+        cache_size = self.voice_config.transcription_cache_size
+        cache_key = self._transcription_key(audio_data, language, include_metadata)
+        with self._transcription_cache_lock:
+            cached = self._transcription_cache.get(cache_key)
+            if cached is not None:
+                self._transcription_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info("Using cached transcription")
+            return cached
+
         logger.info("Transcribing audio...")
 
         try:
             client = self._get_openai_client()
 
-            # Create a temporary file for the audio (OpenAI API requires a file)
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                tmp_file.write(audio_data)
-                tmp_path = Path(tmp_file.name)
+            # The SDK uploads from any file-like object, using .name as the filename.
+            # BytesIO shares the bytes object until written to, so this doesn't copy
+            audio_file = io.BytesIO(audio_data)
+            audio_file.name = "audio.wav"
 
-            try:
-                # Transcribe using Whisper API
-                with open(tmp_path, "rb") as audio_file:
-                    kwargs = {
-                        "model": self.voice_config.whisper_model,
-                        "file": audio_file,
-                        "response_format": "verbose_json",
-                    }
-                    if language:
-                        kwargs["language"] = language
-
-                    response = client.audio.transcriptions.create(**kwargs)
-
-                text = response.text.strip()
-                result_language = getattr(response, "language", None)
-                duration = getattr(response, "duration", None)
-
-                logger.info(f"Transcription complete: '{text[:100]}...' ({len(text)} chars)")
-
-                return TranscriptionResult(
-                    text=text,
-                    language=result_language,
-                    duration_seconds=duration,
-                )
+            kwargs = {
+                "model": self.voice_config.whisper_model,
+                "file": audio_file,
+                "response_format": "verbose_json" if include_metadata else "json",
+            }
+            if language:
+                kwargs["language"] = language
+
+            response = client.audio.transcriptions.create(**kwargs)
+
+            text = response.text.strip()
+            result_language = getattr(response, "language", None)
+            duration = getattr(response, "duration", None)
+
+            # Lazy formatting: the transcript is only sliced into the message if INFO is on
+            logger.info("Transcription complete: '%.100s...' (%d chars)", text, len(text))
 
-            finally:
-                # Clean up temp file
-                tmp_path.unlink(missing_ok=True)
+            result = TranscriptionResult(
+                text=text,
+                language=result_language,
+                duration_seconds=duration,
+            )
+            if cache_size:
+                with self._transcription_cache_lock:
+                    self._transcription_cache[cache_key] = result
+                    while len(self._transcription_cache) > cache_size:
+                        self._transcription_cache.popitem(last=False)
+
+            return result
 
         except Exception as e:
-            logger.error(f"Transcription failed: {e}")
+            logger.error("Transcription failed: %s", e)
             raise TranscriptionError(f"Failed to transcribe audio: {e}") from e
 
+    async def transcribe_audio_async(
+        self,
+        audio_data: bytes,
+        language: str | None = None,
+        *,
+        include_metadata: bool = False,
+    ) -> TranscriptionResult:
+        """Transcribe audio in a worker thread so the event loop stays responsive.
+
+        Concurrent calls for the same audio share a single Whisper request.
+
+        Args:
+            audio_data: Audio data as bytes (WAV format)
+            language: Optional language hint (e.g., "en", "es")
+            include_metadata: Also return the detected language and duration
+
+        Returns:
+            TranscriptionResult with transcribed text
+        """
+        key = self._transcription_key(audio_data, language, include_metadata)
+        pending = self._inflight_transcriptions.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                asyncio.to_thread(
+                    self.transcribe_audio,
+                    audio_data,
+                    language,
+                    include_metadata=include_metadata,
+                )
+            )
+            self._inflight_transcriptions[key] = pending
+            pending.add_done_callback(lambda _: self._inflight_transcriptions.pop(key, None))
+
+        # Shield so one caller being cancelled doesn't cancel the others' request
+        return await asyncio.shield(pending)
+
+    def _transcription_key(
+        self, audio_data: bytes, language: str | None, include_metadata: bool
+    ) -> tuple:
+        """Build the cache key for a transcription request."""
+        return (
+            hashlib.blake2b(audio_data, digest_size=16).digest(),
+            self.voice_config.whisper_model,
+            language,
+            include_metadata,
+        )
+
     def transcribe_audio_file(
         self,
         file: BinaryIO,
@@ -272,11 +540,13 @@ class VoiceService:
         Returns:
             VoiceTaskResult with transcription, extracted tasks, and created task
         """
-        # Record audio
-        audio_data = self.record_audio(duration_seconds)
+        self.warm_up_connection()
+
+        # Record audio (blocking device I/O, kept off the event loop)
+        audio_data = await asyncio.to_thread(self.record_audio, duration_seconds)
 
         # Transcribe
-        transcription_result = self.transcribe_audio(audio_data)
+        transcription_result = await self.transcribe_audio_async(audio_data)
 
         if not transcription_result.text:
             return VoiceTaskResult(
@@ -334,7 +604,7 @@ class VoiceService:
             VoiceTaskResult with transcription, extracted tasks, and created task
         """
         # Transcribe
-        transcription_result = self.transcribe_audio(audio_data, language)
+        transcription_result = await self.transcribe_audio_async(audio_data, language)
 
         if not transcription_result.text:
             return VoiceTaskResult(
@@ -16,6 +16,11 @@ class LLMConfig(BaseModel):
     model: str = Field(default="gpt-4", description="Model to use for LLM requests")
     temperature: float = Field(default=0.7, ge=0, le=2)
     max_tokens: int = Field(default=2000, gt=0)
+    response_cache_ttl: int = Field(
+        default=3600,
+        ge=0,
+        description="Seconds to cache low-temperature LLM responses in memory (0 disables)",
+    )
 
 
 class DatabaseConfig(BaseModel):
@@ -184,6 +189,18 @@ class VoiceConfig(BaseModel):
     recording_duration_seconds: int = Field(default=10, ge=1, le=60, description="Default recording duration")
     sample_rate: int = Field(default=16000, description="Audio sample rate (16000 recommended for Whisper)")
     whisper_model: str = Field(default="whisper-1", description="Whisper model variant")
+    stop_on_silence: bool = Field(
+        default=True, description="Stop recording once the speaker has gone quiet"
+    )
+    silence_threshold: int = Field(
+        default=500, ge=0, description="RMS level (16-bit PCM) below which audio counts as silence"
+    )
+    silence_duration_ms: int = Field(
+        default=800, ge=20, description="Silence after speech that ends the recording"
+    )
+    transcription_cache_size: int = Field(
+        default=128, ge=0, description="Transcriptions cached in memory by audio hash (0 disables)"
+    )
 
 
 class AgentConfig(BaseModel):
@@ -0,0 +1,19 @@
+"""Date and time helpers shared across services."""
+
+from datetime import UTC, datetime
+
+
+def naive_utcnow() -> datetime:
+    """Return the current UTC time as a naive datetime (matches stored timestamps).
+
+    Stored timestamps are naive UTC. datetime.utcnow() would skip the tzinfo
+    round trip but is deprecated, so the aware time is stripped instead.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def to_naive_utc(value: datetime | None) -> datetime | None:
+    """Convert a datetime to naive UTC for storage; naive values are assumed UTC."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
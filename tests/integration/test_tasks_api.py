@@ -149,6 +149,12 @@ def test_delete_task(client, sample_task_data):
     assert get_response.status_code == 404
 
 
+def test_delete_task_not_found(client):
+    """Test deleting a task that does not exist."""
+    response = client.delete("/api/tasks/99999")
+    assert response.status_code == 404
+
+
 def test_get_prioritized_tasks(client, test_db_session):
     """Test getting tasks by priority score."""
     # Create tasks with different priorities
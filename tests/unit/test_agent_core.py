@@ -15,7 +15,7 @@ from src.agent.core import (
     reset_agent,
 )
 from src.integrations.base import ActionableItem, ActionableItemType, IntegrationType
-from src.services.llm_service import ExtractedTask
+from src.services.llm_service import ExtractedTask, LLMError
 from src.utils.config import AgentConfig, Config, LLMConfig
 
 
@@ -561,6 +561,75 @@ class TestProcessActionableItems:
         assert len(suggested) == 0
 
 
+    @pytest.mark.asyncio
+    async def test_process_multiple_items_batches_extraction(self, agent, test_db_session):
+        """Test all items are extracted in one batched call and tasks map back to items."""
+        agent.autonomy_level = AutonomyLevel.SUGGEST
+
+        items = [
+            ActionableItem(
+                type=ActionableItemType.EMAIL_REPLY_NEEDED,
+                title=f"Email {i}",
+                source=IntegrationType.GMAIL,
+                source_reference=f"msg_{i}",
+            )
+            for i in range(3)
+        ]
+
+        with patch.object(agent.llm_service, "extract_tasks_from_texts", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = [
+                [ExtractedTask(title="Task from email 0", confidence=0.9)],
+                [],
+                [ExtractedTask(title="Task from email 2", confidence=0.9)],
+            ]
+
+            with patch("src.agent.core.get_db_session") as mock_db:
+                mock_db.return_value.__enter__ = MagicMock(return_value=test_db_session)
+                mock_db.return_value.__exit__ = MagicMock(return_value=False)
+
+                with patch("src.agent.core.PendingSuggestionService"):
+                    created, suggested = await agent._process_actionable_items(items, IntegrationType.GMAIL)
+
+        mock_extract.assert_awaited_once()
+        assert len(mock_extract.call_args.kwargs["texts"]) == 3
+        assert [s.source_reference for s in suggested] == ["msg_0", "msg_2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_extraction_falls_back_per_item(self, agent, test_db_session):
+        """Test only items whose extraction failed fall back to basic tasks."""
+        agent.autonomy_level = AutonomyLevel.AUTO
+
+        items = [
+            ActionableItem(
+                type=ActionableItemType.EMAIL_REPLY_NEEDED,
+                title=f"Email {i}",
+                source=IntegrationType.GMAIL,
+                source_reference=f"msg_{i}",
+            )
+            for i in range(2)
+        ]
+
+        with patch.object(agent.llm_service, "extract_tasks_from_texts", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = [[], LLMError("rate limited")]
+
+            with patch("src.agent.core.get_db_session") as mock_db:
+                mock_db.return_value.__enter__ = MagicMock(return_value=test_db_session)
+                mock_db.return_value.__exit__ = MagicMock(return_value=False)
+
+                with patch.object(
+                    agent, "_create_task_from_actionable_item", new_callable=AsyncMock
+                ) as mock_fallback:
+                    mock_fallback.return_value = 42
+                    created, suggested = await agent._process_actionable_items(
+                        items, IntegrationType.GMAIL
+                    )
+
+        mock_fallback.assert_awaited_once_with(items[1])
+        assert created == [42]
+        assert suggested == []
+        assert agent.state.items_processed_session == 2
+
+
 class TestAgentStartStop:
     """Tests for agent start/stop."""
 
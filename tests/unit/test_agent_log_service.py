@@ -1,6 +1,5 @@
 """Tests for agent log service including detailed activity logging."""
 
-import json
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -33,12 +32,12 @@ class TestAgentLogServiceBasics:
         assert log_entry.action == AgentAction.POLL_EMAIL
 
     def test_log_with_details_dict(self, test_db_session):
-        """Test log with dict details (JSON serialized)."""
+        """Test log with dict details (stored as JSON)."""
         service = AgentLogService(test_db_session)
         details = {"key": "value", "count": 42}
         log_entry = service.log("Test", details=details)
 
-        assert log_entry.details == json.dumps(details)
+        assert log_entry.details == details
 
     def test_log_info(self, test_db_session):
         """Test log_info helper."""
@@ -68,6 +67,17 @@ class TestAgentLogServiceBasics:
 
         assert log_entry.level == LogLevel.DEBUG
 
+    def test_log_mirrors_to_python_logger(self, test_db_session, caplog):
+        """Test log entries are mirrored to the module logger at the right level."""
+        service = AgentLogService(test_db_session)
+        with caplog.at_level("DEBUG", logger="src.services.agent_log_service"):
+            service.log_warning("Careful", action=AgentAction.POLL_SLACK)
+            service.log_info("No action")
+
+        assert caplog.records[0].levelname == "WARNING"
+        assert caplog.records[0].getMessage() == "[poll_slack] Careful"
+        assert caplog.records[1].getMessage() == "[GENERAL] No action"
+
 
 class TestFileAccessLogging:
     """Tests for file access logging."""
@@ -85,7 +95,7 @@ class TestFileAccessLogging:
         assert log_entry.level == LogLevel.DEBUG
         assert "/path/to/file.txt" in log_entry.message
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["file_path"] == "/path/to/file.txt"
         assert details["bytes_read"] == 1024
         assert details["purpose"] == "Loading configuration"
@@ -103,7 +113,7 @@ class TestFileAccessLogging:
         assert log_entry.level == LogLevel.DEBUG
         assert "/path/to/output.md" in log_entry.message
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["file_path"] == "/path/to/output.md"
         assert details["bytes_written"] == 2048
         assert details["purpose"] == "Writing summary document"
@@ -114,7 +124,7 @@ class TestFileAccessLogging:
         log_entry = service.log_file_read(file_path="/path/to/file.txt")
 
         assert log_entry.action == AgentAction.FILE_READ
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["bytes_read"] is None
         assert details["purpose"] is None
 
@@ -139,7 +149,7 @@ class TestHttpRequestLogging:
         assert "GET" in log_entry.message
         assert "200" in log_entry.message
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["method"] == "GET"
         assert details["status_code"] == 200
         assert details["duration_seconds"] == 0.5
@@ -155,7 +165,7 @@ class TestHttpRequestLogging:
             status_code=200,
         )
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         # api_key should be redacted (may be URL-encoded as %5BREDACTED%5D)
         assert "secret123" not in details["url"]
         assert "REDACTED" in details["url"]  # Check without brackets due to URL encoding
@@ -170,7 +180,7 @@ class TestHttpRequestLogging:
             url="https://api.example.com/data?token=abc123&secret=xyz789&key=test",
         )
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert "abc123" not in details["url"]
         assert "xyz789" not in details["url"]
         assert "test" not in details["url"]
@@ -184,7 +194,7 @@ class TestHttpRequestLogging:
         )
 
         assert log_entry.action == AgentAction.HTTP_REQUEST
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["status_code"] is None
         assert details["duration_seconds"] is None
 
@@ -200,7 +210,7 @@ class TestHttpRequestLogging:
             request_type="task_extraction",
         )
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["service"] == "llm"
         assert details["request_type"] == "task_extraction"
 
@@ -223,7 +233,7 @@ class TestDecisionLogging:
         assert "auto_create_task" in log_entry.message
         assert "approved" in log_entry.message
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["decision"] == "auto_create_task"
         assert details["reasoning"] == "Confidence 0.9 exceeds threshold 0.8"
         assert details["outcome"] == "approved"
@@ -238,7 +248,7 @@ class TestDecisionLogging:
             outcome="rejected",
         )
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["outcome"] == "rejected"
         assert details["context"] is None
 
@@ -259,7 +269,7 @@ class TestDecisionLogging:
             context=context,
         )
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["context"]["tags"] == ["engineering", "review"]
 
 
@@ -317,6 +327,17 @@ class TestGetLogs:
         assert total == 1
         assert logs[0].level == LogLevel.ERROR
 
+    def test_get_logs_without_count(self, test_db_session):
+        """Test skipping the total-count query."""
+        service = AgentLogService(test_db_session)
+        service.log_info("First")
+        service.log_info("Second")
+
+        logs, total = service.get_logs(count=False)
+
+        assert len(logs) == 2
+        assert total == -1
+
 
 class TestUrlSanitization:
     """Tests for URL sanitization."""
@@ -339,6 +360,15 @@ class TestUrlSanitization:
 
         assert sanitized == url
 
+    def test_sanitize_url_redacts_case_insensitively_and_drops_fragment(self, test_db_session):
+        """Test sensitive names match any case and the fragment is removed."""
+        service = AgentLogService(test_db_session)
+        sanitized = service._sanitize_url(
+            "https://api.example.com/data?Token=abc&page=2&flag#section"
+        )
+
+        assert sanitized == "https://api.example.com/data?Token=[REDACTED]&page=2&flag"
+
     def test_sanitize_url_handles_malformed_url(self, test_db_session):
         """Test sanitization handles malformed URLs gracefully."""
         service = AgentLogService(test_db_session)
@@ -366,7 +396,7 @@ class TestPollLogging:
         assert "5" in log_entry.message
         assert "gmail" in log_entry.message
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["items_found"] == 5
         assert details["duration_seconds"] == 1.23  # Rounded to 2 decimals
 
@@ -398,6 +428,7 @@ class TestTaskCreationLogging:
         assert log_entry.reference_type == "task"
         assert log_entry.reference_id == "42"
         assert "Review PR #123" in log_entry.message
+        assert log_entry.details == {"source": "gmail"}
 
     def test_log_task_creation_long_title(self, test_db_session):
         """Test task creation logging truncates long titles."""
@@ -430,5 +461,22 @@ class TestLlmRequestLogging:
         assert log_entry.tokens_used == 150
         assert log_entry.model_used == "gpt-4"
 
-        details = json.loads(log_entry.details)
+        details = log_entry.details
         assert details["tasks_extracted"] == 3
+
+    def test_llm_usage_stats_totals_and_breakdown(self, test_db_session):
+        """Test LLM usage totals match the per-model breakdown."""
+        service = AgentLogService(test_db_session)
+        service.log_llm_request("a", tokens_used=100, model="gpt-4")
+        service.log_llm_request("b", tokens_used=50, model="gpt-4")
+        service.log_llm_request("c", tokens_used=25, model="claude")
+        service.log_info("Not an LLM request", tokens_used=999)
+
+        stats = service.get_llm_usage_stats(since=datetime.now() - timedelta(days=1))
+
+        assert stats["total_requests"] == 3
+        assert stats["total_tokens"] == 175
+        assert stats["by_model"] == {
+            "gpt-4": {"requests": 2, "tokens": 150},
+            "claude": {"requests": 1, "tokens": 25},
+        }
@@ -8,6 +8,7 @@ from click.testing import CliRunner
 
 from src.cli import cli, parse_due_date, format_due_date, get_priority_style, get_status_style
 from src.models.task import TaskPriority, TaskSource, TaskStatus
+from src.services.task_service import TaskSummary
 
 
 @pytest.fixture
@@ -54,6 +55,22 @@ def mock_task():
     return task
 
 
+@pytest.fixture
+def mock_task_summary():
+    """Create a task summary as returned for task listings."""
+    return TaskSummary(
+        id=1,
+        title="Test Task",
+        status=TaskStatus.PENDING,
+        priority=TaskPriority.HIGH,
+        priority_score=75.0,
+        due_date=datetime.now() + timedelta(days=1),
+        initiative_id=None,
+        initiative_title=None,
+        has_document_links=False,
+    )
+
+
 # --- Helper Function Tests ---
 
 
@@ -184,7 +201,7 @@ class TestTasksCommands:
     @patch("src.cli.init_db")
     @patch("src.cli.load_config")
     @patch("src.cli.get_db_session")
-    def test_tasks_list(self, mock_session, mock_load_config, mock_init_db, runner, mock_config, mock_task):
+    def test_tasks_list(self, mock_session, mock_load_config, mock_init_db, runner, mock_config, mock_task_summary):
         """Test tasks list command."""
         mock_load_config.return_value = mock_config
         
@@ -195,7 +212,7 @@ class TestTasksCommands:
         
         with patch("src.cli.TaskService") as mock_service_class:
             mock_service = MagicMock()
-            mock_service.get_tasks.return_value = ([mock_task], 1)
+            mock_service.get_tasks_summary.return_value = ([mock_task_summary], 1)
             mock_service_class.return_value = mock_service
             
             result = runner.invoke(cli, ["tasks", "list"])
@@ -216,7 +233,7 @@ class TestTasksCommands:
         
         with patch("src.cli.TaskService") as mock_service_class:
             mock_service = MagicMock()
-            mock_service.get_tasks.return_value = ([], 0)
+            mock_service.get_tasks_summary.return_value = ([], 0)
             mock_service_class.return_value = mock_service
             
             result = runner.invoke(cli, ["tasks", "list"])
@@ -586,7 +603,7 @@ class TestNotifyCommand:
         mock_get_config.return_value = mock_config
         
         mock_service = MagicMock()
-        mock_service.send.return_value = True
+        mock_service.send_sync.return_value = True
         mock_service_class.return_value = mock_service
         
         result = runner.invoke(cli, ["notify", "Test message"])
@@ -604,7 +621,7 @@ class TestNotifyCommand:
         mock_get_config.return_value = mock_config
         
         mock_service = MagicMock()
-        mock_service.send.return_value = False
+        mock_service.send_sync.return_value = False
         mock_service_class.return_value = mock_service
         
         result = runner.invoke(cli, ["notify", "Test message"])
@@ -1165,8 +1182,8 @@ class TestTasksMergeCommand:
             assert result.exit_code == 0
             assert "Created merged task #10" in result.output
             mock_service.create_task.assert_called_once()
-            # Original tasks should be deleted
-            assert mock_service.delete_task.call_count == 2
+            # Original tasks should be deleted in one call
+            mock_service.bulk_delete.assert_called_once_with([1, 2])
 
     @patch("src.cli.init_db")
     @patch("src.cli.load_config")
@@ -1221,7 +1238,7 @@ class TestTasksMergeCommand:
             assert result.exit_code == 0
             assert "Created merged task" in result.output
             # Original tasks should NOT be deleted
-            mock_service.delete_task.assert_not_called()
+            mock_service.bulk_delete.assert_not_called()
 
     @patch("src.cli.init_db")
     @patch("src.cli.load_config")
@@ -1455,9 +1472,8 @@ class TestAccountsCommands:
     @patch("src.cli.init_db")
     @patch("src.cli.load_config")
     @patch("src.cli.get_db_session")
-    def test_tasks_list_with_account_filter(self, mock_session, mock_load_config, mock_init_db, runner, mock_config, mock_task):
+    def test_tasks_list_with_account_filter(self, mock_session, mock_load_config, mock_init_db, runner, mock_config, mock_task_summary):
         """Test tasks list command with --account filter."""
-        mock_task.account_id = "personal"
         mock_load_config.return_value = mock_config
 
         mock_db = MagicMock()
@@ -1466,23 +1482,22 @@ class TestAccountsCommands:
 
         with patch("src.cli.TaskService") as mock_service_class:
             mock_service = MagicMock()
-            mock_service.get_tasks.return_value = ([mock_task], 1)
+            mock_service.get_tasks_summary.return_value = ([mock_task_summary], 1)
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(cli, ["tasks", "list", "--account", "personal"])
 
             assert result.exit_code == 0
-            # Verify account_id was passed to get_tasks
-            mock_service.get_tasks.assert_called_once()
-            call_kwargs = mock_service.get_tasks.call_args[1]
+            # Verify account_id was passed to get_tasks_summary
+            mock_service.get_tasks_summary.assert_called_once()
+            call_kwargs = mock_service.get_tasks_summary.call_args[1]
             assert call_kwargs.get("account_id") == "personal"
 
     @patch("src.cli.init_db")
     @patch("src.cli.load_config")
     @patch("src.cli.get_db_session")
-    def test_tasks_list_account_filter_shorthand(self, mock_session, mock_load_config, mock_init_db, runner, mock_config, mock_task):
+    def test_tasks_list_account_filter_shorthand(self, mock_session, mock_load_config, mock_init_db, runner, mock_config, mock_task_summary):
         """Test tasks list command with -a shorthand for account filter."""
-        mock_task.account_id = "work"
         mock_load_config.return_value = mock_config
 
         mock_db = MagicMock()
@@ -1491,12 +1506,12 @@ class TestAccountsCommands:
 
         with patch("src.cli.TaskService") as mock_service_class:
             mock_service = MagicMock()
-            mock_service.get_tasks.return_value = ([mock_task], 1)
+            mock_service.get_tasks_summary.return_value = ([mock_task_summary], 1)
             mock_service_class.return_value = mock_service
 
             result = runner.invoke(cli, ["tasks", "list", "-a", "work"])
 
             assert result.exit_code == 0
-            mock_service.get_tasks.assert_called_once()
-            call_kwargs = mock_service.get_tasks.call_args[1]
+            mock_service.get_tasks_summary.assert_called_once()
+            call_kwargs = mock_service.get_tasks_summary.call_args[1]
             assert call_kwargs.get("account_id") == "work"
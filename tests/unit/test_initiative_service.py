@@ -242,6 +242,23 @@ def test_get_initiatives_with_progress(initiative_service, test_db_session):
         assert "progress_percent" in result["progress"]
 
 
+def test_get_loaded_initiative_progress_matches_counts(initiative_service, test_db_session):
+    """Test progress from eager-loaded tasks matches the COUNT-based progress."""
+    initiative = initiative_service.create_initiative(title="Loaded Progress")
+    test_db_session.add_all([
+        Task(title="Task 1", initiative_id=initiative.id, status=TaskStatus.COMPLETED),
+        Task(title="Task 2", initiative_id=initiative.id, status=TaskStatus.PENDING),
+    ])
+    test_db_session.commit()
+    test_db_session.expire_all()
+
+    initiatives, _ = initiative_service.get_initiatives(load_tasks=True)
+
+    assert initiative_service.get_loaded_initiative_progress(initiatives[0]) == (
+        initiative_service.get_initiative_progress(initiative.id)
+    )
+
+
 def test_delete_initiative_unlinks_tasks(initiative_service, test_db_session):
     """Test that deleting initiative unlinks but doesn't delete tasks."""
     initiative = initiative_service.create_initiative(title="Delete Test")
@@ -1,18 +1,28 @@
 """Tests for LLM service."""
 
+import asyncio
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import litellm
 import pytest
 
 from src.services.llm_service import (
     ExtractedTask,
+    JSONArrayStream,
     LLMError,
     LLMResponse,
+    LLMResponseCache,
     LLMService,
     PrioritySuggestion,
     ProductivityRecommendation,
+    _close_shared_http_client,
+    _get_encoding,
+    _get_shared_http_client,
+    _resolve_relative_date,
+    _truncate_to_tokens,
+    get_shared_llm_service,
 )
 from src.utils.config import LLMConfig
 
@@ -35,6 +45,15 @@ def llm_service(llm_config):
     return LLMService(llm_config)
 
 
+def _make_completion(content: str, total_tokens: int = 100) -> MagicMock:
+    """Build a mock litellm completion response."""
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content=content))]
+    mock_response.usage = MagicMock(total_tokens=total_tokens)
+    mock_response.model_dump = MagicMock(return_value={})
+    return mock_response
+
+
 class TestLLMServiceInit:
     """Tests for LLMService initialization."""
 
@@ -50,6 +69,82 @@ class TestLLMServiceInit:
             # Default OpenAI URL should not set api_base
             assert service.config.base_url == "https://api.openai.com/v1"
 
+    def test_shared_service_reused_per_config(self, llm_config):
+        """Test the shared service is reused for the same config object only."""
+        service = get_shared_llm_service(llm_config)
+
+        assert get_shared_llm_service(llm_config) is service
+        assert get_shared_llm_service(llm_config.model_copy()) is not service
+
+
+class TestExtractionSystemPrompt:
+    """Tests for the task extraction system prompt."""
+
+    def test_prompt_is_reused_for_same_day_and_initiatives(self, llm_service):
+        """Test repeated builds return the memoized prompt."""
+        initiatives = [{"id": 1, "title": "Launch", "priority": "high"}]
+
+        first = llm_service._build_extraction_system_prompt(initiatives)
+        second = llm_service._build_extraction_system_prompt(initiatives)
+
+        assert first is second
+        assert datetime.now().strftime("%Y-%m-%d") in first
+        assert "- ID 1: Launch (priority: high)" in first
+        assert '[{"title": "Review PR #123"' in first
+        assert "Available initiatives" not in llm_service._build_extraction_system_prompt()
+
+
+class TestHttpClient:
+    """Tests for the pooled HTTP client used by litellm."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self, llm_service):
+        """Test consecutive calls share one client installed as litellm's session."""
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_completion("ok")
+
+            await llm_service._call_llm([{"role": "user", "content": "a"}])
+            client = litellm.aclient_session
+            await llm_service._call_llm([{"role": "user", "content": "b"}])
+
+        assert client is not None
+        assert litellm.aclient_session is client
+        await llm_service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_shared_across_services(self, llm_config):
+        """Test services created per request don't each open a connection pool."""
+        first = await _get_shared_http_client()
+        LLMService(llm_config)
+        second = await _get_shared_http_client()
+
+        assert first is second
+        await _close_shared_http_client()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_client(self, llm_service):
+        """Test aclose closes the client and uninstalls it from litellm."""
+        client = await _get_shared_http_client()
+
+        await llm_service.aclose()
+
+        assert client.is_closed
+        assert litellm.aclient_session is None
+
+        # A closed client is replaced on next use
+        assert not (await _get_shared_http_client()).is_closed
+        await llm_service.aclose()
+
+    def test_new_client_per_event_loop(self):
+        """Test a new event loop gets its own client and the old loop's client is closed."""
+        first = asyncio.run(_get_shared_http_client())
+        second = asyncio.run(_get_shared_http_client())
+
+        assert first is not second
+        assert first.is_closed
+        assert litellm.aclient_session is second
+        asyncio.run(_close_shared_http_client())
+
 
 class TestExtractTasksFromText:
     """Tests for extract_tasks_from_text."""
@@ -211,6 +306,260 @@ class TestExtractTasksFromText:
 
             assert "API Error" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_uses_response_schema_when_supported(self, llm_service):
+        """Test structured output is requested and its wrapped array unpacked."""
+        content = json.dumps({"tasks": [{"title": "Send report", "priority": "high", "confidence": 0.9}]})
+
+        with (
+            patch("src.services.llm_service._supports_response_schema", return_value=True),
+            patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion,
+        ):
+            mock_acompletion.return_value = _make_completion(content)
+
+            tasks = await llm_service.extract_tasks_from_text(text="Send the report", source="email")
+
+            response_format = mock_acompletion.call_args.kwargs["response_format"]
+            assert response_format["type"] == "json_schema"
+            assert [t.title for t in tasks] == ["Send report"]
+
+    def test_unknown_priority_coerced_to_medium(self, llm_service):
+        """Test extracted priorities are normalized to the known levels."""
+        tasks = llm_service._parse_extracted_tasks(
+            [{"title": "A", "priority": "High"}, {"title": "B", "priority": "urgent"}, {"title": "C"}]
+        )
+
+        assert [t.priority for t in tasks] == ["high", "medium", "medium"]
+
+    @pytest.mark.asyncio
+    async def test_blank_text_skips_llm(self, llm_service):
+        """Test whitespace-only input returns no tasks without an API call."""
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            tasks = await llm_service.extract_tasks_from_text(text="  \n ", source="email")
+
+            assert tasks == []
+            mock_acompletion.assert_not_called()
+
+    def test_oversized_text_is_truncated(self, llm_service):
+        """Test input over the token budget is trimmed before it is sent."""
+        with patch("src.services.llm_service._MAX_EXTRACTION_INPUT_TOKENS", 50):
+            messages = llm_service._build_extraction_messages(
+                "word " * 500, "email", None, None
+            )
+
+        assert messages[1]["content"].count("word") <= 50
+
+    def test_tokenizer_unavailable_truncates_by_length(self):
+        """Test a tokenizer that can't be downloaded falls back to character truncation."""
+        _get_encoding.cache_clear()
+        try:
+            with patch(
+                "src.services.llm_service.tiktoken.encoding_for_model",
+                side_effect=ConnectionError("offline"),
+            ):
+                assert _get_encoding("gpt-4") is None
+                truncated = _truncate_to_tokens("x" * 1000, "gpt-4", 100)
+        finally:
+            _get_encoding.cache_clear()
+
+        assert truncated == "x" * 400
+
+
+def _make_stream(pieces: list[str]):
+    """Create an async iterator of streamed completion chunks."""
+
+    async def stream():
+        for piece in pieces:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = piece
+            yield chunk
+
+    return stream()
+
+
+class TestExtractTasksFromTextStream:
+    """Tests for streaming task extraction."""
+
+    @pytest.mark.asyncio
+    async def test_yields_tasks_as_objects_close(self, llm_service):
+        """Test each task is yielded once its object is complete."""
+        pieces = ['```json\n[{"title": "Reply', ' to Alice", "priority": "high"}', ', {"title": "Book ', 'room"}]\n```']
+
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_stream(pieces)
+
+            titles = [
+                task.title
+                async for task in llm_service.extract_tasks_from_text_stream("Some email", source="gmail")
+            ]
+
+            assert mock_acompletion.call_args.kwargs["stream"] is True
+
+        assert titles == ["Reply to Alice", "Book room"]
+
+    @pytest.mark.asyncio
+    async def test_stream_error_raises_llm_error(self, llm_service):
+        """Test API failures surface as LLMError."""
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.side_effect = Exception("API Error")
+
+            with pytest.raises(LLMError):
+                async for _ in llm_service.extract_tasks_from_text_stream("Some email"):
+                    pass
+
+
+class TestJSONArrayStream:
+    """Tests for the incremental JSON array parser."""
+
+    def test_elements_split_across_chunks(self):
+        """Test elements are emitted when complete, ignoring brackets in strings."""
+        parser = JSONArrayStream()
+
+        assert parser.feed('[{"a": "x]}"') == []
+        assert parser.feed(', "b": [1, 2]}, {"c": "\\"q\\""}') == [{"a": "x]}", "b": [1, 2]}, {"c": '"q"'}]
+        assert parser.feed("]") == []
+
+    def test_bare_object_is_single_element(self):
+        """Test a top-level object is treated as the only element."""
+        parser = JSONArrayStream()
+
+        assert parser.feed('{"title": "Only"} trailing') == [{"title": "Only"}]
+
+    def test_finish_recovers_truncated_element(self):
+        """Test an element cut off by the end of the stream is repaired."""
+        parser = JSONArrayStream()
+
+        assert parser.feed('[{"title": "Done"}, {"title": "Cut') == [{"title": "Done"}]
+        assert parser.finish() == [{"title": "Cut"}]
+
+
+class TestExtractTasksFromTexts:
+    """Tests for batched extract_tasks_from_texts."""
+
+    @pytest.mark.asyncio
+    async def test_batches_texts_into_one_call(self, llm_service):
+        """Test several texts share one LLM request and results stay aligned."""
+        content = json.dumps({
+            "0": [{"title": "Reply to Alice", "priority": "high", "confidence": 0.9}],
+            "1": [],
+            "2": [{"title": "Book venue"}, {"title": "Send invites"}],
+        })
+
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_completion(content)
+
+            results = await llm_service.extract_tasks_from_texts(
+                texts=["Email from Alice", "Newsletter", "Plan the offsite"],
+                source="gmail",
+                contexts=["Source reference: msg_1", None, None],
+            )
+
+            assert mock_acompletion.await_count == 1
+            user_prompt = mock_acompletion.call_args.kwargs["messages"][1]["content"]
+            assert "---DOC 2---" in user_prompt
+            assert "Source reference: msg_1" in user_prompt
+
+        assert [len(r) for r in results] == [1, 0, 2]
+        assert results[0][0].title == "Reply to Alice"
+        assert results[2][1].title == "Send invites"
+
+    @pytest.mark.asyncio
+    async def test_single_text_uses_regular_extraction(self, llm_service):
+        """Test a single text is extracted without the batch prompt."""
+        with patch.object(llm_service, "extract_tasks_from_text", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = [ExtractedTask(title="Only task")]
+
+            results = await llm_service.extract_tasks_from_texts(texts=["Just one"], source="slack")
+
+        assert results == [[ExtractedTask(title="Only task")]]
+        mock_extract.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_response_not_per_document(self, llm_service):
+        """Test an unattributable batch response falls back to per-text extraction."""
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.side_effect = [
+                _make_completion(json.dumps([{"title": "Ambiguous"}])),
+                _make_completion(json.dumps([{"title": "Task A"}])),
+                _make_completion("[]"),
+            ]
+
+            results = await llm_service.extract_tasks_from_texts(
+                texts=["Text A", "Text B"], source="gmail"
+            )
+
+            assert mock_acompletion.await_count == 3
+
+        assert [[t.title for t in r] for r in results] == [["Task A"], []]
+
+    @pytest.mark.asyncio
+    async def test_failed_sub_batch_only_affects_its_texts(self, llm_service):
+        """Test a failing sub-batch returns its error without discarding other results."""
+        error = LLMError("rate limited")
+        with patch.object(llm_service, "_count_tokens", return_value=4000), \
+             patch.object(llm_service, "extract_tasks_from_text", new_callable=AsyncMock) as mock_extract:
+            mock_extract.side_effect = [[ExtractedTask(title="Task A")], error]
+
+            results = await llm_service.extract_tasks_from_texts(
+                texts=["Text A", "Text B"], source="gmail"
+            )
+
+        assert results == [[ExtractedTask(title="Task A")], error]
+
+    @pytest.mark.asyncio
+    async def test_splits_batches_over_token_budget(self, llm_service):
+        """Test texts exceeding the input token budget are split across requests."""
+        with patch.object(llm_service, "_count_tokens", return_value=4000):
+            batches = llm_service._split_extraction_batches(
+                [("a", None), ("b", None), ("c", None)]
+            )
+
+        assert [len(b) for b in batches] == [1, 1, 1]
+
+
+class TestExtractTasksMany:
+    """Tests for concurrent extract_tasks_many."""
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_within_limit(self, llm_service):
+        """Test requests overlap but never exceed max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_extract(text, source, context, initiatives):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [ExtractedTask(title=text)]
+
+        with patch.object(llm_service, "extract_tasks_from_text", side_effect=fake_extract):
+            results = await llm_service.extract_tasks_many(
+                [(f"Task {i}", "slack", None) for i in range(6)], max_concurrency=3
+            )
+
+        assert peak == 3
+        assert [r[0].title for r in results] == [f"Task {i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_returned_in_place(self, llm_service):
+        """Test one failing request doesn't discard the others."""
+
+        async def fake_extract(text, source, context, initiatives):
+            if text == "bad":
+                raise LLMError("boom")
+            return [ExtractedTask(title=text)]
+
+        with patch.object(llm_service, "extract_tasks_from_text", side_effect=fake_extract):
+            results = await llm_service.extract_tasks_many(
+                [("good", "gmail", None), ("bad", "gmail", None)]
+            )
+
+        assert results[0][0].title == "good"
+        assert isinstance(results[1], LLMError)
+
 
 class TestSuggestPriorityUpdates:
     """Tests for suggest_priority_updates."""
@@ -245,6 +594,9 @@ class TestSuggestPriorityUpdates:
                 {"id": 2, "title": "Task 2", "priority": "low"},
             ])
 
+            user_prompt = mock_acompletion.call_args.kwargs["messages"][1]["content"]
+            assert "id|priority|due|title\n1|medium|2026-01-30|Task 1\n2|low||Task 2" in user_prompt
+
             assert len(suggestions) == 1
             assert suggestions[0].task_id == 1
             assert suggestions[0].current_priority == "medium"
@@ -350,6 +702,26 @@ class TestGenerateRecommendations:
             assert "5" in prompt_text  # overdue
 
 
+    @pytest.mark.asyncio
+    async def test_generate_recommendations_for_categories(self, llm_service):
+        """Test requested categories are sent to the model and enforced on the result."""
+        content = json.dumps([
+            {"title": "Focus", "description": "d", "category": "focus"},
+            {"title": "Sort tags", "description": "d", "category": "organization"},
+        ])
+
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_completion(content)
+
+            recommendations = await llm_service.generate_recommendations(
+                tasks=[], categories={"focus"}
+            )
+
+            user_prompt = mock_acompletion.call_args.kwargs["messages"][1]["content"]
+            assert "Only give recommendations in these categories: focus" in user_prompt
+            assert [r.category for r in recommendations] == ["focus"]
+
+
 class TestAnalyzeCalendarForOptimization:
     """Tests for analyze_calendar_for_optimization."""
 
@@ -392,6 +764,86 @@ class TestAnalyzeCalendarForOptimization:
             assert recommendations[0].category == "scheduling"
 
 
+class TestParseDate:
+    """Tests for parse_date."""
+
+    @pytest.fixture
+    def date_service(self, llm_config, tmp_path):
+        """Create an LLM service with an isolated date cache file."""
+        return LLMService(llm_config, date_cache_path=tmp_path / "date-cache.json")
+
+    @pytest.mark.asyncio
+    async def test_iso_date_skips_llm(self, date_service):
+        """Test absolute ISO dates are parsed locally."""
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            parsed = await date_service.parse_date("2026-02-15")
+
+            mock_acompletion.assert_not_called()
+            assert parsed == datetime(2026, 2, 15, 23, 59)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("phrase", "days"),
+        [("tomorrow", 1), ("In 3 days", 3), ("in a week", 7), ("in 2 weeks", 14)],
+    )
+    async def test_relative_phrases_skip_llm(self, date_service, phrase, days):
+        """Test simple relative phrases are resolved locally at end of day."""
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            parsed = await date_service.parse_date(phrase)
+
+            mock_acompletion.assert_not_called()
+
+        expected = (datetime.now() + timedelta(days=days)).date()
+        assert parsed == datetime.combine(expected, datetime.min.time()).replace(hour=23, minute=59)
+
+    def test_next_weekday_is_strictly_after_today(self):
+        """Test "next <weekday>" resolves to the following occurrence."""
+        friday = datetime(2026, 10, 16, 9, 30)
+
+        assert _resolve_relative_date("next friday", friday) == datetime(2026, 10, 23, 23, 59)
+        assert _resolve_relative_date("next Mon", friday) == datetime(2026, 10, 19, 23, 59)
+        assert _resolve_relative_date("next sprint", friday) is None
+        assert _resolve_relative_date("next friday at 5pm", friday) is None
+
+    @pytest.mark.asyncio
+    async def test_llm_result_persisted_across_instances(self, llm_config, tmp_path):
+        """Test an LLM-parsed phrase is served from the on-disk cache afterwards."""
+        cache_path = tmp_path / "date-cache.json"
+
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_completion("2026-02-20T23:59:00")
+
+            first = await LLMService(llm_config, date_cache_path=cache_path).parse_date(
+                "End of next sprint"
+            )
+            second = await LLMService(llm_config, date_cache_path=cache_path).parse_date(
+                "end of next sprint"
+            )
+
+            assert mock_acompletion.await_count == 1
+            assert first == second == datetime(2026, 2, 20, 23, 59)
+
+    @pytest.mark.asyncio
+    async def test_utc_suffix_parsed_as_naive(self, date_service):
+        """Test a trailing Z from the model yields a naive datetime."""
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_completion("2026-02-20T17:00:00Z")
+
+            parsed = await date_service.parse_date("end of next sprint")
+
+        assert parsed == datetime(2026, 2, 20, 17, 0)
+        assert parsed.tzinfo is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_result_not_cached(self, date_service):
+        """Test INVALID responses are not cached so they can be retried."""
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_completion("INVALID")
+
+            assert await date_service.parse_date("someday maybe") is None
+            assert not date_service._date_cache_path.exists()
+
+
 class TestParseJsonResponse:
     """Tests for _parse_json_response helper."""
 
@@ -410,12 +862,98 @@ class TestParseJsonResponse:
         result = llm_service._parse_json_response('```\n[{"key": "value"}]\n```')
         assert result == [{"key": "value"}]
 
+    def test_parse_json_surrounded_by_prose(self, llm_service):
+        """Test parsing JSON with surrounding text and a nested array."""
+        result = llm_service._parse_json_response(
+            'Here you go:\n```json\n{"0": [{"key": "value"}]}\n```\nLet me know!'
+        )
+        assert result == {"0": [{"key": "value"}]}
+
+    def test_parse_repairs_near_miss_json(self, llm_service):
+        """Test trailing commas, Python literals and smart quotes are repaired."""
+        result = llm_service._parse_json_response(
+            '[{\u201ctitle\u201d: "Call Bob", "done": False, "due": None, "tags": ["a",],},]'
+        )
+        assert result == [{"title": "Call Bob", "done": False, "due": None, "tags": ["a"]}]
+
+    def test_parse_repairs_truncated_json(self, llm_service):
+        """Test output cut off mid-string is closed off instead of discarded."""
+        result = llm_service._parse_json_response(
+            '[{"title": "First", "priority": "high"}, {"title": "Sec'
+        )
+        assert result == [{"title": "First", "priority": "high"}, {"title": "Sec"}]
+
     def test_parse_invalid_json(self, llm_service):
         """Test parsing invalid JSON returns empty list."""
         result = llm_service._parse_json_response("not valid json")
         assert result == []
 
 
+class TestResponseCache:
+    """Tests for caching of low-temperature LLM responses."""
+
+    @pytest.mark.asyncio
+    async def test_identical_low_temperature_call_is_cached(self, llm_service):
+        """Test a repeated low-temperature request skips the API call."""
+        messages = [{"role": "user", "content": "Parse this date: tomorrow"}]
+
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_completion("2026-01-30T23:59:00", 42)
+
+            first = await llm_service._call_llm(messages, temperature=0.1)
+            second = await llm_service._call_llm(messages, temperature=0.1)
+
+            assert mock_acompletion.await_count == 1
+            assert second.content == first.content
+            assert first.tokens_used == 42
+            assert second.tokens_used == 0
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_call_is_not_cached(self, llm_service):
+        """Test requests above the cacheable temperature always hit the API."""
+        messages = [{"role": "user", "content": "Be creative"}]
+
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_completion("idea")
+
+            await llm_service._call_llm(messages, temperature=0.9)
+            await llm_service._call_llm(messages, temperature=0.9)
+
+            assert mock_acompletion.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_with_zero_ttl(self, llm_config):
+        """Test response_cache_ttl=0 disables caching."""
+        llm_config.response_cache_ttl = 0
+        service = LLMService(llm_config)
+        messages = [{"role": "user", "content": "Parse this date: tomorrow"}]
+
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = _make_completion("2026-01-30T23:59:00")
+
+            await service._call_llm(messages, temperature=0.1)
+            await service._call_llm(messages, temperature=0.1)
+
+            assert mock_acompletion.await_count == 2
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test the cache stays within maxsize."""
+        cache = LLMResponseCache(maxsize=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, LLMResponse(content=key, tokens_used=1, model="gpt-4"))
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c").content == "c"
+
+    def test_cache_entries_expire(self):
+        """Test entries past their TTL are treated as misses."""
+        cache = LLMResponseCache(ttl=0)
+        cache.set("a", LLMResponse(content="a", tokens_used=1, model="gpt-4"))
+
+        assert cache.get("a") is None
+
+
 class TestLLMResponse:
     """Tests for LLMResponse dataclass."""
 
@@ -433,9 +971,32 @@ class TestLLMResponse:
         assert response.model == "gpt-4"
 
 
+    @pytest.mark.asyncio
+    async def test_raw_response_skipped_without_debug_logging(self, llm_service):
+        """Test the provider response is only dumped when debug logging is enabled."""
+        messages = [{"role": "user", "content": "Hello"}]
+        completion = _make_completion("Hi")
+
+        with patch("src.services.llm_service.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = completion
+            with patch("src.services.llm_service.logger.isEnabledFor", return_value=False):
+                response = await llm_service._call_llm(messages, temperature=0.9)
+
+        assert response.raw_response is None
+        completion.model_dump.assert_not_called()
+
+
 class TestExtractedTask:
     """Tests for ExtractedTask dataclass."""
 
+    def test_extracted_task_uses_slots(self):
+        """Test ExtractedTask instances carry no per-instance __dict__."""
+        task = ExtractedTask(title="Test task")
+
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = True
+
     def test_extracted_task_defaults(self):
         """Test ExtractedTask default values."""
         task = ExtractedTask(title="Test task")
@@ -1,7 +1,7 @@
 """Unit tests for macOS agent status manager."""
 
 import json
-from datetime import datetime, timedelta
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -15,16 +15,12 @@ class TestCachedData:
 
     def test_cache_valid_within_ttl(self):
         """Test that cache is valid within TTL."""
-        from datetime import UTC
-        now = datetime.now(UTC).replace(tzinfo=None)
-        cache = CachedData("test_data", now, ttl_seconds=30)
+        cache = CachedData("test_data", time.monotonic(), ttl_seconds=30)
         assert cache.is_valid()
 
     def test_cache_invalid_after_ttl(self):
         """Test that cache is invalid after TTL expires."""
-        from datetime import UTC
-        old_time = datetime.now(UTC).replace(tzinfo=None) - timedelta(seconds=35)
-        cache = CachedData("test_data", old_time, ttl_seconds=30)
+        cache = CachedData("test_data", time.monotonic() - 35, ttl_seconds=30)
         assert not cache.is_valid()
 
 
@@ -107,10 +103,8 @@ class TestAgentStatusManager:
     @patch("src.macos.agent_status.httpx.Client")
     def test_get_status_uses_cache(self, mock_client_class, manager):
         """Test that get_status uses cache when available and valid."""
-        from datetime import UTC
         cached_status = AgentStatus(is_running=True, autonomy_level="auto")
-        now = datetime.now(UTC).replace(tzinfo=None)
-        manager._status_cache = CachedData(cached_status, now, ttl_seconds=30)
+        manager._status_cache = CachedData(cached_status, time.monotonic(), ttl_seconds=30)
 
         mock_client = MagicMock()
         manager.client = mock_client
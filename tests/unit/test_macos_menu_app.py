@@ -472,3 +472,102 @@ class TestRefreshTasksTimerMethod:
             # The daemon attribute is set on the thread instance, not in constructor
             # So we just verify the thread was created properly
             assert mock_thread_class.called
+
+
+class TestPollNowAction:
+    """Test the poll_now_action method."""
+
+    def test_poll_now_ignored_while_poll_in_progress(
+        self, mock_objc_modules, mock_httpx_client
+    ):
+        """Test that a second poll request is dropped until the first finishes."""
+        from src.macos.menu_app import TaskMenuApp
+
+        app = TaskMenuApp.alloc().init()
+        app.agent_manager = MagicMock()
+        app.agent_status = MagicMock(is_running=True)
+        app._fetch_and_update_agent_status = MagicMock()
+
+        with patch("src.macos.menu_app.threading.Thread") as mock_thread_class:
+            app.poll_now_action()
+            app.poll_now_action()
+
+            mock_thread_class.assert_called_once()
+
+        # Finishing the poll allows the next one
+        app._poll_now_thread()
+
+        with patch("src.macos.menu_app.threading.Thread") as mock_thread_class:
+            app.poll_now_action()
+
+            mock_thread_class.assert_called_once()
+
+
+class TestFetchAndUpdateTasks:
+    """Test the _fetch_and_update_tasks method."""
+
+    def test_unchanged_data_skips_ui_update(self, mock_objc_modules, mock_httpx_client):
+        """Test that the menu is only rebuilt when the task data changes."""
+        from src.macos.menu_app import TaskMenuApp
+
+        app = TaskMenuApp.alloc().init()
+        app.performSelectorOnMainThread_withObject_waitUntilDone_ = MagicMock()
+
+        payload = {
+            "overdue_count": 1,
+            "due_today_count": 2,
+            "total_count": 3,
+            "tasks": [{"id": 1, "title": "Task"}],
+        }
+        mock_httpx_client.get.return_value.json.return_value = payload
+
+        app._fetch_and_update_tasks()
+        app._fetch_and_update_tasks()
+
+        app.performSelectorOnMainThread_withObject_waitUntilDone_.assert_called_once()
+        assert app.total_count == 3
+
+        # Let the queued update run before the data changes
+        app.updateUIOnMainThread_()
+
+        payload["total_count"] = 4
+        app._fetch_and_update_tasks()
+
+        assert app.performSelectorOnMainThread_withObject_waitUntilDone_.call_count == 2
+        assert app.total_count == 4
+
+    def test_pending_ui_update_is_not_queued_twice(self, mock_objc_modules, mock_httpx_client):
+        """Test updates arriving before the main thread runs share one rebuild."""
+        from src.macos.menu_app import TaskMenuApp
+
+        app = TaskMenuApp.alloc().init()
+        app.performSelectorOnMainThread_withObject_waitUntilDone_ = MagicMock()
+
+        app._schedule_ui_update()
+        app._schedule_ui_update()
+        app.performSelectorOnMainThread_withObject_waitUntilDone_.assert_called_once()
+
+        app.updateUIOnMainThread_()
+        app._schedule_ui_update()
+        assert app.performSelectorOnMainThread_withObject_waitUntilDone_.call_count == 2
+
+
+class TestMenuBarTitle:
+    """Test the _update_menu_bar_title method."""
+
+    def test_title_only_set_when_changed(self, mock_objc_modules, mock_httpx_client):
+        """Test the status item title is not reset to the same value."""
+        from src.macos.menu_app import TaskMenuApp
+
+        app = TaskMenuApp.alloc().init()
+        app.status_item = MagicMock()
+        app.total_count = 3
+
+        app._update_menu_bar_title()
+        app._update_menu_bar_title()
+        app.status_item.setTitle_.assert_called_once_with("3")
+
+        app.total_count = 0
+        app._update_menu_bar_title()
+        app.status_item.setTitle_.assert_called_with("✓")
+        assert app.status_item.setTitle_.call_count == 2
@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch, MagicMock
 from src.integrations.base import ActionableItem, ActionableItemType, IntegrationType
 from src.integrations.manager import IntegrationKey, IntegrationManager
 from src.models.task import TaskPriority, TaskSource, TaskStatus
-from src.services.task_service import TaskService
+from src.services.task_service import TaskService, _clear_configured_account_ids
 from src.utils.config import GoogleAccountConfig
 
 
@@ -262,6 +262,13 @@ class TestIntegrationManagerMultiAccount:
 class TestTaskServiceAccountIdValidation:
     """Tests for TaskService account_id validation."""
 
+    @pytest.fixture(autouse=True)
+    def clear_account_cache(self):
+        """Reload configured accounts from the patched config in each test."""
+        _clear_configured_account_ids()
+        yield
+        _clear_configured_account_ids()
+
     def test_create_task_with_valid_account_id(self):
         """Test creating task with valid account_id succeeds."""
         # Mock database
@@ -310,6 +317,19 @@ class TestTaskServiceAccountIdValidation:
                     account_id="nonexistent",
                 )
 
+    def test_configured_accounts_shared_across_services(self):
+        """Test config is loaded once for account validation across services."""
+        with patch("src.integrations.manager.IntegrationManager") as mock_manager_class, \
+             patch("src.utils.config.load_config") as mock_load_config:
+            mock_manager = Mock()
+            mock_manager.list_accounts.return_value = ["personal"]
+            mock_manager_class.return_value = mock_manager
+
+            TaskService(Mock())._validate_account_id("personal")
+            TaskService(Mock())._validate_account_id("personal")
+
+            mock_load_config.assert_called_once()
+
     def test_create_task_without_account_id(self):
         """Test creating task without account_id succeeds (optional field)."""
         db = Mock()
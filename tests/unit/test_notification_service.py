@@ -0,0 +1,267 @@
+"""Tests for notification service."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.services.notification_service as notification_module
+from src.services.notification_service import (
+    Notification,
+    NotificationService,
+    create_notification_service,
+)
+from src.utils.config import NotificationConfig
+
+
+@pytest.fixture
+def notification_config():
+    """Create a test notification config."""
+    return NotificationConfig(enabled=True, sound=False)
+
+
+@pytest.fixture
+def macos():
+    """Run the service as if on macOS, without touching atexit handlers."""
+    with patch.object(notification_module, "_IS_MACOS", True), \
+         patch.object(notification_module, "atexit"):
+        yield
+
+
+@pytest.fixture
+def osascript_service(notification_config, macos):
+    """Create a macOS notification service without terminal-notifier installed."""
+    with patch("shutil.which", return_value=None):
+        return NotificationService(notification_config)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_service():
+    """Drop the cached service between tests."""
+    notification_module._shared_service = None
+    yield
+    notification_module._shared_service = None
+
+
+def _make_helper():
+    """Create a mock interactive osascript process that is still running."""
+    proc = MagicMock()
+    proc.poll.return_value = None
+    proc.stdout.fileno.return_value = 99
+    return proc
+
+
+def _echo_marker(service):
+    """Mock os module whose read echoes the service's latest completion marker."""
+    mock_os = MagicMock()
+    mock_os.read.side_effect = lambda fd, n: f'"pa-ok-{service._osa_seq}"'.encode()
+    return mock_os
+
+
+class TestSendQueueing:
+    """Tests for send, send_sync and flush."""
+
+    def test_send_queues_without_delivering(self, notification_config):
+        """Test send puts the notification on the queue and returns immediately."""
+        service = NotificationService(notification_config)
+        notification = Notification(title="Queued", message="Later")
+
+        with patch.object(service, "_ensure_worker") as mock_worker, \
+             patch.object(service, "send_sync") as mock_send_sync:
+            assert service.send(notification) is True
+
+        mock_worker.assert_called_once()
+        mock_send_sync.assert_not_called()
+        assert service._queue.get_nowait() is notification
+
+    def test_send_disabled_does_not_queue(self):
+        """Test send is a no-op when notifications are disabled."""
+        service = NotificationService(NotificationConfig(enabled=False))
+
+        assert service.send(Notification(title="Ignored", message="")) is False
+        assert service._queue.empty()
+        assert service._worker is None
+
+    def test_flush_waits_for_delivery_in_order(self, notification_config):
+        """Test flush returns after the worker delivered every notification in order."""
+        service = NotificationService(notification_config)
+        delivered = []
+
+        with patch.object(
+            service, "send_sync", side_effect=lambda n: delivered.append(n.title) or True
+        ):
+            for title in ("First", "Second", "Third"):
+                service.send(Notification(title=title, message=""))
+            service.flush()
+
+        assert delivered == ["First", "Second", "Third"]
+        assert service._queue.unfinished_tasks == 0
+
+    def test_worker_survives_delivery_error(self, notification_config):
+        """Test an exception while delivering one notification doesn't stop the worker."""
+        service = NotificationService(notification_config)
+
+        with patch.object(
+            service, "send_sync", side_effect=[RuntimeError("boom"), True]
+        ) as mock_send_sync:
+            service.send(Notification(title="Broken", message=""))
+            service.send(Notification(title="Fine", message=""))
+            service.flush()
+
+        assert mock_send_sync.call_count == 2
+
+    def test_send_sync_delivers_immediately(self, notification_config, capsys):
+        """Test send_sync writes the terminal banner before returning."""
+        service = NotificationService(notification_config)
+
+        with patch.object(notification_module, "_IS_MACOS", False):
+            assert service.send_sync(Notification(title="Now", message="Hello")) is True
+
+        assert "Now" in capsys.readouterr().out
+        assert service._queue.empty()
+
+
+class TestOsascriptHelper:
+    """Tests for the long-lived osascript helper."""
+
+    def test_helper_reused_across_notifications(self, osascript_service):
+        """Test consecutive notifications are written to one osascript process."""
+        proc = _make_helper()
+
+        with patch("subprocess.Popen", return_value=proc) as mock_popen, \
+             patch.object(notification_module, "select") as mock_select, \
+             patch.object(notification_module, "os", _echo_marker(osascript_service)):
+            mock_select.select.return_value = ([99], [], [])
+            assert osascript_service.send_sync(Notification(title="One", message="")) is True
+            assert osascript_service.send_sync(Notification(title="Two", message="")) is True
+
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args.args[0] == ["osascript", "-i"]
+        assert proc.stdin.write.call_count == 2
+
+    def test_recovers_after_helper_timeout(self, osascript_service):
+        """Test a timed-out helper is stopped and a fresh one serves the next notification."""
+        stuck, fresh = _make_helper(), _make_helper()
+
+        with patch("subprocess.Popen", side_effect=[stuck, fresh]) as mock_popen, \
+             patch.object(notification_module, "select") as mock_select, \
+             patch.object(notification_module, "os", _echo_marker(osascript_service)):
+            # The first notification never gets its marker back
+            mock_select.select.side_effect = [([], [], []), ([99], [], [])]
+            assert osascript_service.send_sync(Notification(title="Lost", message="")) is False
+            stuck.stdin.close.assert_called_once()
+            assert osascript_service._osa_proc is None
+
+            assert osascript_service.send_sync(Notification(title="Delivered", message="")) is True
+
+        assert mock_popen.call_count == 2
+        assert osascript_service._osa_proc is fresh
+
+    def test_multiline_message_stays_one_statement(self, osascript_service):
+        """Test line breaks are escaped so the helper receives a single line."""
+        proc = _make_helper()
+
+        with patch("subprocess.Popen", return_value=proc), \
+             patch.object(notification_module, "select") as mock_select, \
+             patch.object(notification_module, "os", _echo_marker(osascript_service)):
+            mock_select.select.return_value = ([99], [], [])
+            notification = Notification(title="Task Digest", message="First\nSecond\r\nThird")
+            assert osascript_service.send_sync(notification) is True
+
+        written = proc.stdin.write.call_args.args[0].decode()
+        script, marker, trailing = written.split("\n")
+        assert 'display notification "First\\nSecond\\r\\nThird"' in script
+        assert marker == '"pa-ok-1"'
+        assert trailing == ""
+
+    def test_applescript_error_reported_as_failure(self, osascript_service):
+        """Test an error printed before the marker makes delivery fail."""
+        mock_os = MagicMock()
+        mock_os.read.return_value = b'execution error: Expected end of line. (-2741)\n"pa-ok-1"\n'
+
+        with patch("subprocess.Popen", return_value=_make_helper()) as mock_popen, \
+             patch.object(notification_module, "select") as mock_select, \
+             patch.object(notification_module, "os", mock_os):
+            mock_select.select.return_value = ([99], [], [])
+            assert osascript_service.send_sync(Notification(title="Oops", message="")) is False
+
+        assert mock_popen.call_args.kwargs["stderr"] == subprocess.STDOUT
+        # An AppleScript error doesn't end the interactive session
+        assert osascript_service._osa_proc is not None
+
+    def test_falls_back_to_one_off_osascript(self, osascript_service):
+        """Test osascript -e is used when the helper can't be started."""
+        with patch("subprocess.Popen", side_effect=OSError("no osascript -i")), \
+             patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stderr="")
+            assert osascript_service.send_sync(Notification(title="Hi", message="There")) is True
+
+        args = mock_run.call_args.args[0]
+        assert args[:2] == ["osascript", "-e"]
+        assert 'with title "Hi"' in args[2]
+
+    def test_close_stops_helper(self, osascript_service):
+        """Test close ends the interactive session."""
+        proc = _make_helper()
+        osascript_service._osa_proc = proc
+
+        osascript_service.close()
+
+        proc.stdin.close.assert_called_once()
+        proc.wait.assert_called_once_with(timeout=1)
+        assert osascript_service._osa_proc is None
+
+
+class TestTerminalNotifier:
+    """Tests for terminal-notifier delivery."""
+
+    def test_prefers_terminal_notifier(self, notification_config, macos):
+        """Test terminal-notifier is used instead of osascript when installed."""
+        with patch("shutil.which", return_value="/usr/local/bin/terminal-notifier"):
+            service = NotificationService(notification_config)
+
+        notification = Notification(
+            title="Title", message="Body", subtitle="Sub", url="https://example.com"
+        )
+        with patch("subprocess.run") as mock_run, patch("subprocess.Popen") as mock_popen:
+            mock_run.return_value = MagicMock(returncode=0, stderr="")
+            assert service.send_sync(notification) is True
+
+        mock_popen.assert_not_called()
+        assert mock_run.call_args.args[0] == [
+            "/usr/local/bin/terminal-notifier",
+            "-title", "Title",
+            "-message", "Body",
+            "-subtitle", "Sub",
+            "-open", "https://example.com",
+        ]
+
+    def test_terminal_notifier_timeout(self, notification_config, macos):
+        """Test a hung terminal-notifier is reported as a failed delivery."""
+        with patch("shutil.which", return_value="/usr/local/bin/terminal-notifier"):
+            service = NotificationService(notification_config)
+
+        with patch(
+            "subprocess.run", side_effect=subprocess.TimeoutExpired("terminal-notifier", 5)
+        ):
+            assert service.send_sync(Notification(title="Slow", message="")) is False
+
+
+class TestCreateNotificationService:
+    """Tests for the shared service factory."""
+
+    def test_same_config_reuses_service(self, notification_config):
+        """Test repeated calls with one config share a service."""
+        first = create_notification_service(notification_config)
+
+        assert create_notification_service(notification_config) is first
+
+    def test_new_config_replaces_and_closes_service(self, notification_config):
+        """Test a different config builds a new service and closes the old one."""
+        first = create_notification_service(notification_config)
+
+        with patch.object(first, "close") as mock_close:
+            second = create_notification_service(NotificationConfig(enabled=True))
+
+        assert second is not first
+        mock_close.assert_called_once()
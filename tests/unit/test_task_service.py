@@ -1,8 +1,10 @@
 """Tests for TaskService."""
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy import event
 
 from src.models.initiative import Initiative, InitiativePriority, InitiativeStatus
 from src.models.task import Task, TaskPriority, TaskSource, TaskStatus
@@ -116,6 +118,19 @@ class TestPriorityScoring:
         assert score <= 100.0
         assert score >= 90.0  # Should be very high
 
+    def test_score_uses_given_now(self):
+        """A supplied now is used instead of reading the clock."""
+        now = datetime(2025, 1, 10, 12, 0)
+        task = Task(
+            title="Test",
+            priority=TaskPriority.MEDIUM,
+            due_date=datetime(2025, 1, 10, 14, 0),
+            source=TaskSource.MANUAL,
+        )
+
+        # Medium (20) + due within 4 hours (23) + manual (5)
+        assert TaskService.calculate_priority_score(task, now=now) == 48.0
+
 
 class TestTaskServiceOperations:
     """Tests for TaskService CRUD operations."""
@@ -137,6 +152,15 @@ class TestTaskServiceOperations:
         assert task.priority_score > 0
         assert "test" in task.get_tags_list()
 
+    def test_create_task_stores_aware_due_date_as_naive_utc(self, test_db_session):
+        """Timezone-aware due dates are converted to naive UTC on write."""
+        service = TaskService(test_db_session)
+        due = datetime(2025, 6, 1, 9, 0, tzinfo=timezone(timedelta(hours=2)))
+
+        task = service.create_task(title="Aware", due_date=due)
+
+        assert task.due_date == datetime(2025, 6, 1, 7, 0)
+
     def test_create_task_with_document_links(self, test_db_session):
         """Test creating a task with document links."""
         service = TaskService(test_db_session)
@@ -244,6 +268,21 @@ class TestTaskServiceOperations:
         
         assert service.get_task(task_id) is None
 
+    def test_delete_task_removes_tags(self, test_db_session):
+        """Test a recreated task doesn't inherit a deleted task's tags."""
+        service = TaskService(test_db_session)
+        task = service.create_task(title="Delete Me", tags=["work"])
+        service.delete_task(task)
+
+        # SQLite reuses the freed id for the next task
+        recreated = service.create_task(title="Recreated")
+        tasks, total = service.get_tasks(tags=["work"])
+        assert total == 0
+
+        service.update_task(recreated, tags=["work"])
+        tasks, total = service.get_tasks(tags=["work"])
+        assert [t.id for t in tasks] == [recreated.id]
+
     def test_get_tasks_with_search(self, test_db_session):
         """Test searching tasks by title/description."""
         service = TaskService(test_db_session)
@@ -279,6 +318,38 @@ class TestTaskServiceOperations:
         
         assert total == 2
 
+    def test_get_tasks_tag_filter_matches_whole_tags(self, test_db_session):
+        """Tag filters match whole tags case-insensitively, not substrings."""
+        service = TaskService(test_db_session)
+        service.create_task(title="Task 1", tags=["Work"])
+        service.create_task(title="Task 2", tags=["homework"])
+        task3 = service.create_task(title="Task 3", tags=["work"])
+        service.update_task(task3, tags=["personal"])
+
+        tasks, total = service.get_tasks(tags=["work"])
+
+        assert total == 1
+        assert [t.title for t in tasks] == ["Task 1"]
+
+    def test_get_tasks_summary(self, test_db_session):
+        """Task summaries carry listing columns and the initiative title."""
+        service = TaskService(test_db_session)
+        initiative = InitiativeService(test_db_session).create_initiative(title="Launch")
+        service.create_task(
+            title="Linked",
+            initiative_id=initiative.id,
+            document_links=["https://example.com/doc"],
+        )
+        done = service.create_task(title="Done")
+        service.update_task(done, status=TaskStatus.COMPLETED)
+
+        summaries, total = service.get_tasks_summary(include_completed=False)
+
+        assert total == 1
+        assert summaries[0].title == "Linked"
+        assert summaries[0].initiative_title == "Launch"
+        assert summaries[0].has_document_links is True
+
     def test_get_prioritized_tasks(self, test_db_session):
         """Test getting prioritized tasks."""
         service = TaskService(test_db_session)
@@ -321,6 +392,23 @@ class TestTaskServiceOperations:
         assert len(due_soon) == 1
         assert due_soon[0].title == "Tomorrow"
 
+    def test_get_dashboard_bundle(self, test_db_session):
+        """Test the dashboard bundle partitions upcoming tasks like the single queries."""
+        service = TaskService(test_db_session)
+        now = datetime.now(UTC).replace(tzinfo=None)
+
+        service.create_task(title="Tomorrow", due_date=now + timedelta(days=1))
+        service.create_task(title="Next week", due_date=now + timedelta(days=7))
+        service.create_task(title="Yesterday", due_date=now - timedelta(days=1))
+
+        bundle = service.get_dashboard_bundle(due_soon_days=3, top_limit=5)
+
+        assert [t.title for t in bundle.due_soon] == ["Tomorrow"]
+        assert [t.title for t in bundle.overdue] == ["Yesterday"]
+        assert bundle.due_today == []
+        assert len(bundle.top_priority) == 3
+        assert bundle.statistics["active"] == 3
+
 
 class TestBatchOperations:
     """Tests for batch operations."""
@@ -345,6 +433,35 @@ class TestBatchOperations:
         task3_fresh = service.get_task(task3.id)
         assert task3_fresh.status == TaskStatus.PENDING
 
+    def test_bulk_update_status_batches_initiative_loads(self, test_db_engine, test_db_session):
+        """Initiatives are loaded in batched IN queries, not once per task."""
+        service = TaskService(test_db_session)
+        initiative = InitiativeService(test_db_session).create_initiative(title="Launch")
+        task_ids = [
+            service.create_task(title=f"Task {i}", initiative_id=initiative.id).id
+            for i in range(5)
+        ]
+        test_db_session.expunge_all()
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_db_engine, "before_cursor_execute", record)
+        try:
+            service.bulk_update_status(task_ids, TaskStatus.IN_PROGRESS)
+        finally:
+            event.remove(test_db_engine, "before_cursor_execute", record)
+
+        # The score UPDATE reads initiatives through a correlated subquery; the
+        # only SELECT is the selectinload that runs when the rows are reloaded
+        initiative_selects = [
+            s for s in statements
+            if s.lstrip().upper().startswith("SELECT") and "FROM initiatives" in s
+        ]
+        assert len(initiative_selects) == 1
+
     def test_bulk_delete(self, test_db_session):
         """Test bulk delete."""
         service = TaskService(test_db_session)
@@ -364,6 +481,17 @@ class TestBatchOperations:
         assert service.get_task(task2_id) is None
         assert service.get_task(task3_id) is not None
 
+    def test_bulk_delete_in_batches(self, test_db_session):
+        """Bulk delete handles more IDs than one batch."""
+        service = TaskService(test_db_session)
+        task_ids = [service.create_task(title=f"Task {i}").id for i in range(5)]
+
+        with patch("src.services.task_service._DELETE_BATCH_SIZE", 2):
+            deleted_count = service.bulk_delete(task_ids)
+
+        assert deleted_count == 5
+        assert service.get_tasks()[1] == 0
+
     def test_recalculate_all_priorities(self, test_db_session):
         """Test recalculating all priorities."""
         service = TaskService(test_db_session)
@@ -377,6 +505,61 @@ class TestBatchOperations:
         # Only active tasks (pending/in_progress) should be recalculated
         assert updated_count == 2
 
+    def test_recalculate_all_priorities_matches_python_scoring(self, test_db_session):
+        """The SQL recalculation agrees with calculate_priority_score."""
+        service = TaskService(test_db_session)
+        initiative = InitiativeService(test_db_session).create_initiative(
+            title="Launch", priority=InitiativePriority.HIGH
+        )
+        now = datetime.now(UTC).replace(tzinfo=None)
+        tasks = [
+            service.create_task(
+                title="Overdue urgent",
+                priority=TaskPriority.CRITICAL,
+                due_date=now - timedelta(days=2),
+                tags=["Urgent", "misc"],
+                source=TaskSource.MEETING_NOTES,
+            ),
+            service.create_task(
+                title="Due this week",
+                priority=TaskPriority.LOW,
+                due_date=now + timedelta(days=5),
+                tags=["key"],
+                source=TaskSource.EMAIL,
+            ),
+            service.create_task(
+                title="In initiative",
+                due_date=now + timedelta(hours=10),
+                initiative_id=initiative.id,
+            ),
+            service.create_task(title="No due date", tags=["keyboard"]),
+        ]
+
+        service.recalculate_all_priorities()
+
+        for task in tasks:
+            test_db_session.refresh(task)
+            assert task.priority_score == TaskService.calculate_priority_score(task)
+
+
+    def test_recalculate_all_priorities_refreshes_loaded_tasks(self, test_db_session):
+        """Tasks loaded before the recalculation see the new scores."""
+        # Match the application's session factory, which keeps objects loaded on commit
+        test_db_session.expire_on_commit = False
+        service = TaskService(test_db_session)
+        task = service.create_task(title="Loaded early", priority=TaskPriority.LOW)
+        old_score = task.priority_score
+
+        # Change the row behind the session's back so the loaded score goes stale
+        test_db_session.query(Task).filter(Task.id == task.id).update(
+            {Task.priority: TaskPriority.CRITICAL}, synchronize_session=False
+        )
+        service.recalculate_all_priorities()
+
+        assert task.priority == TaskPriority.CRITICAL
+        assert task.priority_score > old_score
+        assert task.priority_score == TaskService.calculate_priority_score(task)
+
 
 class TestStatistics:
     """Tests for statistics functionality."""
@@ -413,6 +596,18 @@ class TestStatistics:
         assert stats["active"] == 0
         assert stats["overdue"] == 0
 
+    def test_statistics_cached_until_task_write(self, test_db_session):
+        """Repeated calls reuse cached statistics until a task is written."""
+        service = TaskService(test_db_session)
+        service.create_task(title="Task 1")
+        assert service.get_statistics()["total"] == 1
+
+        with patch.object(service, "_query_statistics", side_effect=AssertionError):
+            assert service.get_statistics()["total"] == 1
+
+        service.create_task(title="Task 2")
+        assert service.get_statistics()["total"] == 2
+
 
 class TestOptionalInitiatives:
     """Tests for tasks with optional initiative relationships."""
@@ -1,10 +1,12 @@
 """Tests for Voice service."""
 
+import asyncio
 import io
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pytest
+import sounddevice as sd
 
 from src.services.voice_service import (
     MicrophoneNotFoundError,
@@ -13,6 +15,7 @@ from src.services.voice_service import (
     VoiceError,
     VoiceService,
     VoiceTaskResult,
+    _close_shared_clients,
 )
 from src.utils.config import LLMConfig, VoiceConfig
 
@@ -25,6 +28,7 @@ def voice_config():
         recording_duration_seconds=5,
         sample_rate=16000,
         whisper_model="whisper-1",
+        stop_on_silence=False,
     )
 
 
@@ -79,6 +83,48 @@ class TestVoiceServiceInit:
         service = VoiceService(voice_config, llm_config, llm_service=mock_llm_service)
         assert service.llm_service == mock_llm_service
 
+    def test_openai_client_shared_between_services(self, voice_config, llm_config):
+        """Test services with the same credentials reuse one pooled OpenAI client."""
+        with patch("openai.OpenAI") as mock_openai, \
+                patch("src.services.voice_service.httpx.Client") as mock_http_client, \
+                patch("src.services.voice_service.atexit"):
+            try:
+                first = VoiceService(voice_config, llm_config)._get_openai_client()
+                second = VoiceService(voice_config, llm_config)._get_openai_client()
+            finally:
+                _close_shared_clients()
+
+        assert first is second
+        mock_openai.assert_called_once()
+        mock_http_client.assert_called_once()
+        assert mock_openai.call_args[1]["http_client"] is mock_http_client.return_value
+
+
+class TestWarmUpConnection:
+    """Tests for warm_up_connection."""
+
+    def test_warm_up_pings_api_in_background(self, voice_service):
+        """Test warm-up makes a cheap API request on a daemon thread."""
+        mock_client = MagicMock()
+
+        with patch.object(voice_service, "_get_openai_client", return_value=mock_client):
+            thread = voice_service.warm_up_connection()
+            thread.join(timeout=5)
+
+        assert thread.daemon
+        mock_client.models.list.assert_called_once()
+
+    def test_warm_up_ignores_errors(self, voice_service):
+        """Test a failed warm-up is swallowed."""
+        mock_client = MagicMock()
+        mock_client.models.list.side_effect = Exception("offline")
+
+        with patch.object(voice_service, "_get_openai_client", return_value=mock_client):
+            thread = voice_service.warm_up_connection()
+            thread.join(timeout=5)
+
+        mock_client.models.list.assert_called_once()
+
 
 class TestCheckMicrophoneAvailable:
     """Tests for check_microphone_available."""
@@ -89,7 +135,7 @@ class TestCheckMicrophoneAvailable:
             {"name": "Built-in Microphone", "max_input_channels": 2},
             {"name": "Speakers", "max_input_channels": 0},
         ]
-        with patch("src.services.voice_service.sd.query_devices", return_value=mock_devices):
+        with patch("sounddevice.query_devices", return_value=mock_devices):
             assert voice_service.check_microphone_available() is True
 
     def test_no_microphone_available(self, voice_service):
@@ -97,19 +143,40 @@ class TestCheckMicrophoneAvailable:
         mock_devices = [
             {"name": "Speakers", "max_input_channels": 0},
         ]
-        with patch("src.services.voice_service.sd.query_devices", return_value=mock_devices):
+        with patch("sounddevice.query_devices", return_value=mock_devices):
             assert voice_service.check_microphone_available() is False
 
     def test_empty_device_list(self, voice_service):
         """Test when device list is empty."""
-        with patch("src.services.voice_service.sd.query_devices", return_value=[]):
+        with patch("sounddevice.query_devices", return_value=[]):
             assert voice_service.check_microphone_available() is False
 
     def test_query_devices_error(self, voice_service):
         """Test when query_devices raises an error."""
-        with patch("src.services.voice_service.sd.query_devices", side_effect=Exception("Device error")):
+        with patch("sounddevice.query_devices", side_effect=Exception("Device error")):
+            assert voice_service.check_microphone_available() is False
+
+    def test_microphone_found_is_cached(self, voice_service):
+        """Test devices are not re-enumerated once a microphone has been found."""
+        mock_devices = [{"name": "Built-in Microphone", "max_input_channels": 1}]
+        with patch("sounddevice.query_devices", return_value=mock_devices) as mock_query:
+            assert voice_service.check_microphone_available() is True
+            assert voice_service.check_microphone_available() is True
+            assert mock_query.call_count == 1
+
+            voice_service.invalidate_microphone_cache()
+            assert voice_service.check_microphone_available() is True
+            assert mock_query.call_count == 2
+
+    def test_missing_microphone_is_rechecked(self, voice_service):
+        """Test a negative result is not cached so a newly attached mic is found."""
+        with patch("sounddevice.query_devices", return_value=[]):
             assert voice_service.check_microphone_available() is False
 
+        mock_devices = [{"name": "USB Microphone", "max_input_channels": 1}]
+        with patch("sounddevice.query_devices", return_value=mock_devices):
+            assert voice_service.check_microphone_available() is True
+
 
 class TestRecordAudio:
     """Tests for record_audio."""
@@ -120,31 +187,72 @@ class TestRecordAudio:
         mock_devices = [{"name": "Mic", "max_input_channels": 2}]
         
         # Create mock audio data
-        mock_audio_data = np.zeros((16000 * 5, 1), dtype=np.float32)
+        mock_audio_data = np.zeros((16000 * 5, 1), dtype=np.int16)
         
-        with patch("src.services.voice_service.sd.query_devices", return_value=mock_devices):
-            with patch("src.services.voice_service.sd.rec", return_value=mock_audio_data) as mock_rec:
-                with patch("src.services.voice_service.sd.wait"):
+        with patch("sounddevice.query_devices", return_value=mock_devices):
+            with patch("sounddevice.rec", return_value=mock_audio_data) as mock_rec:
+                with patch("sounddevice.wait"):
                     audio_bytes = voice_service.record_audio(duration_seconds=5)
                     
                     assert isinstance(audio_bytes, bytes)
                     assert len(audio_bytes) > 0
                     mock_rec.assert_called_once()
+                    assert mock_rec.call_args[1]["dtype"] == np.int16
+
+    def test_record_audio_stops_after_silence(self, voice_config, llm_config):
+        """Test recording stops once speech is followed by silence, trimming it."""
+        voice_config.stop_on_silence = True
+        voice_config.silence_duration_ms = 60
+        service = VoiceService(voice_config, llm_config)
+        mock_devices = [{"name": "Mic", "max_input_channels": 1}]
+
+        speech = np.full((320, 1), 4000, dtype=np.int16)
+        silence = np.zeros((320, 1), dtype=np.int16)
+        blocks = [silence, speech, speech] + [silence] * 10
+        delivered = []
+
+        class FakeInputStream:
+            def __init__(self, callback, finished_callback, **kwargs):
+                self.callback = callback
+                self.finished_callback = finished_callback
+
+            def __enter__(self):
+                for block in blocks:
+                    delivered.append(block)
+                    try:
+                        self.callback(block, len(block), None, None)
+                    except sd.CallbackStop:
+                        break
+                self.finished_callback()
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        with patch("sounddevice.query_devices", return_value=mock_devices):
+            with patch("sounddevice.InputStream", FakeInputStream):
+                with patch("soundfile.write") as mock_write:
+                    service.record_audio(duration_seconds=5)
+
+        # Three 20 ms silent blocks after speech end the recording early
+        assert len(delivered) == 6
+        recorded = mock_write.call_args[0][1]
+        assert len(recorded) == 3 * 320
 
     def test_record_audio_no_microphone(self, voice_service):
         """Test recording when no microphone is available."""
-        with patch("src.services.voice_service.sd.query_devices", return_value=[]):
+        with patch("sounddevice.query_devices", return_value=[]):
             with pytest.raises(MicrophoneNotFoundError):
                 voice_service.record_audio()
 
     def test_record_audio_uses_config_defaults(self, voice_service):
         """Test that recording uses config defaults."""
         mock_devices = [{"name": "Mic", "max_input_channels": 2}]
-        mock_audio_data = np.zeros((16000 * 5, 1), dtype=np.float32)
+        mock_audio_data = np.zeros((16000 * 5, 1), dtype=np.int16)
         
-        with patch("src.services.voice_service.sd.query_devices", return_value=mock_devices):
-            with patch("src.services.voice_service.sd.rec", return_value=mock_audio_data) as mock_rec:
-                with patch("src.services.voice_service.sd.wait"):
+        with patch("sounddevice.query_devices", return_value=mock_devices):
+            with patch("sounddevice.rec", return_value=mock_audio_data) as mock_rec:
+                with patch("sounddevice.wait"):
                     voice_service.record_audio()
                     
                     # Check that config defaults were used
@@ -154,11 +262,11 @@ class TestRecordAudio:
     def test_record_audio_custom_duration(self, voice_service):
         """Test recording with custom duration."""
         mock_devices = [{"name": "Mic", "max_input_channels": 2}]
-        mock_audio_data = np.zeros((16000 * 10, 1), dtype=np.float32)
+        mock_audio_data = np.zeros((16000 * 10, 1), dtype=np.int16)
         
-        with patch("src.services.voice_service.sd.query_devices", return_value=mock_devices):
-            with patch("src.services.voice_service.sd.rec", return_value=mock_audio_data) as mock_rec:
-                with patch("src.services.voice_service.sd.wait"):
+        with patch("sounddevice.query_devices", return_value=mock_devices):
+            with patch("sounddevice.rec", return_value=mock_audio_data) as mock_rec:
+                with patch("sounddevice.wait"):
                     voice_service.record_audio(duration_seconds=10)
                     
                     # Check that custom duration was used (10 seconds * 16000 sample rate)
@@ -168,12 +276,30 @@ class TestRecordAudio:
         """Test recording when an error occurs."""
         mock_devices = [{"name": "Mic", "max_input_channels": 2}]
         
-        with patch("src.services.voice_service.sd.query_devices", return_value=mock_devices):
-            with patch("src.services.voice_service.sd.rec", side_effect=Exception("Recording error")):
+        with patch("sounddevice.query_devices", return_value=mock_devices):
+            with patch("sounddevice.rec", side_effect=Exception("Recording error")):
                 with pytest.raises(VoiceError) as exc_info:
                     voice_service.record_audio()
                 assert "Failed to record audio" in str(exc_info.value)
 
+    def test_record_audio_downsamples_to_whisper_rate(self, voice_service):
+        """Test audio captured above 16 kHz is resampled before encoding."""
+        mock_devices = [{"name": "Mic", "max_input_channels": 1}]
+        mock_audio_data = np.full((48000, 1), 1000, dtype=np.int16)
+
+        with patch("sounddevice.query_devices", return_value=mock_devices):
+            with patch("sounddevice.rec", return_value=mock_audio_data):
+                with patch("sounddevice.wait"):
+                    with patch("soundfile.write") as mock_write:
+                        voice_service.record_audio(duration_seconds=1, sample_rate=48000)
+
+        written, rate = mock_write.call_args[0][1:3]
+        assert rate == 16000
+        assert written.shape == (16000, 1)
+        assert written.dtype == np.int16
+        # A constant signal survives filtering away from the edges
+        assert (written[10:-10] == 1000).all()
+
 
 class TestTranscribeAudio:
     """Tests for transcribe_audio."""
@@ -189,11 +315,28 @@ class TestTranscribeAudio:
         mock_client.audio.transcriptions.create.return_value = mock_response
         
         with patch.object(voice_service, "_get_openai_client", return_value=mock_client):
-            result = voice_service.transcribe_audio(b"fake audio data")
+            result = voice_service.transcribe_audio(b"fake audio data", include_metadata=True)
             
             assert result.text == "Buy groceries tomorrow"
             assert result.language == "en"
             assert result.duration_seconds == 3.5
+            call_kwargs = mock_client.audio.transcriptions.create.call_args[1]
+            assert call_kwargs["response_format"] == "verbose_json"
+
+    def test_transcribe_audio_text_only_by_default(self, voice_service):
+        """Test the compact response format is requested when metadata isn't needed."""
+        mock_response = MagicMock()
+        mock_response.text = "Buy groceries tomorrow"
+
+        mock_client = MagicMock()
+        mock_client.audio.transcriptions.create.return_value = mock_response
+
+        with patch.object(voice_service, "_get_openai_client", return_value=mock_client):
+            result = voice_service.transcribe_audio(b"fake audio data")
+
+            assert result.text == "Buy groceries tomorrow"
+            call_kwargs = mock_client.audio.transcriptions.create.call_args[1]
+            assert call_kwargs["response_format"] == "json"
 
     def test_transcribe_audio_disabled(self, voice_service_disabled):
         """Test transcription when voice is disabled."""
@@ -219,6 +362,55 @@ class TestTranscribeAudio:
             call_kwargs = mock_client.audio.transcriptions.create.call_args[1]
             assert call_kwargs["language"] == "es"
 
+    def test_transcribe_audio_uploads_from_memory(self, voice_service):
+        """Test audio is uploaded from an in-memory file named like a WAV."""
+        mock_response = MagicMock()
+        mock_response.text = "Call the dentist"
+
+        mock_client = MagicMock()
+        mock_client.audio.transcriptions.create.return_value = mock_response
+
+        with patch.object(voice_service, "_get_openai_client", return_value=mock_client):
+            voice_service.transcribe_audio(b"fake audio data")
+
+            uploaded = mock_client.audio.transcriptions.create.call_args[1]["file"]
+            assert uploaded.name == "audio.wav"
+            assert uploaded.getvalue() == b"fake audio data"
+
+    def test_transcribe_audio_cached_by_content(self, voice_service):
+        """Test identical audio is transcribed once, other audio is not served from cache."""
+        mock_response = MagicMock()
+        mock_response.text = "Buy milk"
+
+        mock_client = MagicMock()
+        mock_client.audio.transcriptions.create.return_value = mock_response
+
+        with patch.object(voice_service, "_get_openai_client", return_value=mock_client):
+            first = voice_service.transcribe_audio(b"same audio")
+            second = voice_service.transcribe_audio(b"same audio")
+            voice_service.transcribe_audio(b"other audio")
+
+        assert first == second
+        assert mock_client.audio.transcriptions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_async_coalesces_concurrent_requests(self, voice_service):
+        """Test concurrent transcriptions of the same audio share one Whisper call."""
+        mock_response = MagicMock()
+        mock_response.text = "Water the plants"
+
+        mock_client = MagicMock()
+        mock_client.audio.transcriptions.create.return_value = mock_response
+
+        with patch.object(voice_service, "_get_openai_client", return_value=mock_client):
+            results = await asyncio.gather(
+                *(voice_service.transcribe_audio_async(b"same audio") for _ in range(3))
+            )
+
+        assert [r.text for r in results] == ["Water the plants"] * 3
+        assert mock_client.audio.transcriptions.create.call_count == 1
+        assert voice_service._inflight_transcriptions == {}
+
     def test_transcribe_audio_error(self, voice_service):
         """Test transcription when API returns error."""
         mock_client = MagicMock()